@@ -241,6 +241,7 @@ DEBUG_TOOLBAR_PANELS = [
     "debug_toolbar.panels.sql.SQLPanel",
     "misago.permissions.panels.MisagoUserPermissionsPanel",
     "misago.acl.panels.MisagoACLPanel",
+    "misago.cache.panels.MisagoVersionedCachesPanel",
     "debug_toolbar.panels.staticfiles.StaticFilesPanel",
     "debug_toolbar.panels.templates.TemplatesPanel",
     "debug_toolbar.panels.cache.CachePanel",
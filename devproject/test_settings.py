@@ -3,9 +3,27 @@ from .settings import *  # pylint: disable-all
 # Use in-memory cache
 CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
 
+# Read cache versions from database on every request
+MISAGO_CACHE_VERSIONS_TTL = 0
+
+# Disable process-local cache for versioned caches
+MISAGO_VERSIONED_CACHE_LOCAL_SIZE = 0
+
+# Disable process-local cache for parsed markups
+MISAGO_PARSER_AST_CACHE_SIZE = 0
+MISAGO_MARKUP_CACHE_SIZE = 0
+
+# Disable process-local caches for visibility plans and serialized ACLs,
+# tests patch user ACLs
+MISAGO_VISIBILITY_PLANS_CACHE_SIZE = 0
+MISAGO_SERIALIZED_ACL_CACHE_SIZE = 0
+
 # Disable Celery backend
 CELERY_BROKER_URL = None
 
+# Don't warm up invalidated caches in Celery tasks
+MISAGO_CACHE_WARMERS = {}
+
 # Disable Debug Toolbar
 DEBUG_TOOLBAR_CONFIG = {}
 INTERNAL_IPS = []
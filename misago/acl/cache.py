@@ -1,17 +1,23 @@
-from django.core.cache import cache
-
 from . import ACL_CACHE
+from ..cache.versionedcache import VersionedCache
 from ..cache.versions import invalidate_cache
 
+acl_cache = VersionedCache(ACL_CACHE)
+
 
 def get_acl_cache(user, cache_versions):
     key = get_cache_key(user, cache_versions)
-    return cache.get(key)
+    return acl_cache.get(key)
 
 
 def set_acl_cache(user, cache_versions, user_acl):
     key = get_cache_key(user, cache_versions)
-    cache.set(key, user_acl)
+    acl_cache.set(key, user_acl)
+
+
+def get_or_build_acl_cache(user, cache_versions, build):
+    key = get_cache_key(user, cache_versions)
+    return acl_cache.get_or_build(key, lambda: build(user))
 
 
 def get_cache_key(user, cache_versions):
@@ -4,12 +4,23 @@ from .providers import providers
 def add_acl_to_obj(user_acl, obj):
     """add valid ACL to obj (iterable of objects or single object)"""
     if hasattr(obj, "__iter__"):
-        for item in obj:
-            _add_acl_to_obj(user_acl, item)
+        _add_acl_to_objs(user_acl, obj)
     else:
         _add_acl_to_obj(user_acl, obj)
 
 
+def _add_acl_to_objs(user_acl, objs):
+    """add valid ACL to objs, calling annotators once for every objs type"""
+    objs_types = {}
+    for obj in objs:
+        obj.acl = {}
+        objs_types.setdefault(obj.__class__, []).append(obj)
+
+    for obj_type, type_objs in objs_types.items():
+        for annotator in providers.get_type_many_annotators(obj_type):
+            annotator(user_acl, type_objs)
+
+
 def _add_acl_to_obj(user_acl, obj):
     """add valid ACL to single obj, helper for add_acl function"""
     obj.acl = {}
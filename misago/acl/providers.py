@@ -23,6 +23,7 @@ class PermissionProviders:
         self._providers_dict = {}
 
         self._annotators = {}
+        self._many_annotators = {}
         self._user_acl_serializers = []
 
     def load(self):
@@ -31,6 +32,7 @@ class PermissionProviders:
 
         self._register_providers()
         self._coerce_dict_values_to_tuples(self._annotators)
+        self._coerce_dict_values_to_tuples(self._many_annotators)
         self._user_acl_serializers = tuple(self._user_acl_serializers)
         self._initialized = True
 
@@ -46,10 +48,18 @@ class PermissionProviders:
         for hashType in types_dict.keys():
             types_dict[hashType] = tuple(types_dict[hashType])
 
-    def acl_annotator(self, hashable_type, func):
-        """registers ACL annotator for specified types"""
+    def acl_annotator(self, hashable_type, func, many=None):
+        """registers ACL annotator for specified types
+
+        Optional many annotator is called with list of objects instead of
+        single object. Annotators registered without it are called with every
+        object from the list.
+        """
         assert not self._initialized, _ALREADY_INITIALIZED_ERROR
         self._annotators.setdefault(hashable_type, []).append(func)
+        self._many_annotators.setdefault(hashable_type, []).append(
+            many or annotate_many(func)
+        )
 
     def user_acl_serializer(self, func):
         """registers ACL serializer for specified types"""
@@ -60,6 +70,10 @@ class PermissionProviders:
         assert self._initialized, _NOT_INITIALIZED_ERROR
         return self._annotators.get(obj.__class__, [])
 
+    def get_type_many_annotators(self, hashable_type):
+        assert self._initialized, _NOT_INITIALIZED_ERROR
+        return self._many_annotators.get(hashable_type, [])
+
     def get_user_acl_serializers(self):
         assert self._initialized, _NOT_INITIALIZED_ERROR
         return self._user_acl_serializers
@@ -73,4 +87,14 @@ class PermissionProviders:
         return self._providers_dict
 
 
+def annotate_many(annotator):
+    """adapts single object annotator to list of objects"""
+
+    def many_annotator(user_acl, objs):
+        for obj in objs:
+            annotator(user_acl, obj)
+
+    return many_annotator
+
+
 providers = PermissionProviders()
@@ -1,7 +1,7 @@
 from contextlib import ContextDecorator, ExitStack, contextmanager
 from unittest.mock import patch
 
-from .useracl import get_user_acl
+from .useracl import add_categories_sets, get_user_acl
 
 __all__ = ["patch_user_acl"]
 
@@ -23,6 +23,8 @@ class patch_user_acl(ContextDecorator, ExitStack):
     def patched_get_user_acl(self, user, cache_versions):
         user_acl = get_user_acl(user, cache_versions)
         self.apply_acl_patches(user, user_acl)
+        # Patches change categories lists, so their sets have to be rebuilt
+        add_categories_sets(user_acl)
         return user_acl
 
     def apply_acl_patches(self, user, user_acl):
@@ -0,0 +1,31 @@
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..cache import acl_cache, get_cache_key
+from ..warmup import warm_up_acl_cache
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_acl_warm_up_builds_acls_for_users_acl_keys(
+    cache_versions, anonymous_user, user, admin
+):
+    cache.clear()
+    warm_up_acl_cache(cache_versions)
+
+    for acl_user in (anonymous_user, user, admin):
+        assert acl_cache.get(get_cache_key(acl_user, cache_versions))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_acl_warm_up_builds_acl_once_per_acl_key(
+    mocker, cache_versions, user, other_user
+):
+    cache.clear()
+    build_acl = mocker.patch("misago.acl.buildacl.build_acl", return_value={})
+    warm_up_acl_cache(cache_versions)
+
+    # Anonymous user and user with other user share ACL key
+    assert user.acl_key == other_user.acl_key
+    assert build_acl.call_count == 2
@@ -1,3 +1,6 @@
+from django.test import override_settings
+
+from ..cache import acl_cache
 from ..useracl import get_user_acl
 
 
@@ -98,3 +101,27 @@ def test_getter_is_not_setting_new_cache_if_cache_is_set(
 
     get_user_acl(anonymous_user, cache_versions)
     cache_set.assert_not_called()
+
+
+@override_settings(MISAGO_VERSIONED_CACHE_LOCAL_SIZE=10)
+def test_user_fields_in_acl_are_not_shared_with_next_getter(
+    cache_versions, user, other_user
+):
+    acl_cache.clear()
+
+    user_acl = get_user_acl(user, cache_versions)
+    other_user_acl = get_user_acl(other_user, cache_versions)
+
+    assert user_acl["user_id"] == user.id
+    assert other_user_acl["user_id"] == other_user.id
+    # Rest of cached ACL is shared instead of being copied for every getter
+    assert other_user_acl["categories"] is user_acl["categories"]
+
+    acl_cache.clear()
+
+
+def test_user_acl_includes_categories_sets(cache_versions, user):
+    acl = get_user_acl(user, cache_versions)
+
+    assert acl["visible_categories_set"] == frozenset(acl["visible_categories"])
+    assert acl["browseable_categories_set"] == frozenset(acl["browseable_categories"])
@@ -68,3 +68,10 @@ def test_multiple_acl_patches_applied_by_context_manager_stack(cache_versions, u
         assert user_acl["acl_patch"] == 1
     user_acl = useracl.get_user_acl(user, cache_versions)
     assert "acl_patch" not in user_acl
+
+
+@patch_user_acl({"visible_categories": [], "browseable_categories": []})
+def test_patch_rebuilds_categories_sets(cache_versions, user):
+    user_acl = useracl.get_user_acl(user, cache_versions)
+    assert user_acl["visible_categories_set"] == frozenset()
+    assert user_acl["browseable_categories_set"] == frozenset()
@@ -88,3 +88,39 @@ def test_getter_returns_registered_user_acl_serializer():
     providers.load()
 
     assert test_user_acl_serializer in providers.get_user_acl_serializers()
+
+
+def test_getter_returns_registered_type_many_annotator():
+    class TestType:
+        pass
+
+    def test_annotator():
+        pass
+
+    def test_many_annotator():
+        pass
+
+    providers = PermissionProviders()
+    providers.acl_annotator(TestType, test_annotator, many=test_many_annotator)
+    providers.load()
+
+    assert test_annotator in providers.get_obj_type_annotators(TestType())
+    assert test_many_annotator in providers.get_type_many_annotators(TestType)
+
+
+def test_getter_adapts_single_annotator_to_many_annotator():
+    class TestType:
+        pass
+
+    def test_annotator(user_acl, obj):
+        obj.annotated = True
+
+    providers = PermissionProviders()
+    providers.acl_annotator(TestType, test_annotator)
+    providers.load()
+
+    objs = [TestType(), TestType()]
+    for annotator in providers.get_type_many_annotators(TestType):
+        annotator({}, objs)
+
+    assert all(obj.annotated for obj in objs)
@@ -1,6 +1,13 @@
 import json
 
-from ..useracl import get_user_acl, serialize_user_acl
+from django.test import override_settings
+
+from ..useracl import (
+    get_user_acl,
+    serialize_user_acl,
+    serialize_user_acl_json,
+    serialized_acl_cache,
+)
 
 
 def test_user_acl_is_serializeable(cache_versions, user):
@@ -12,3 +19,42 @@ def test_user_acl_is_json_serializeable(cache_versions, user):
     acl = get_user_acl(user, cache_versions)
     serialized_acl = serialize_user_acl(acl)
     assert json.dumps(serialized_acl)
+
+
+def test_user_acl_is_serialized_to_json_with_per_user_keys(cache_versions, user):
+    acl = get_user_acl(user, cache_versions)
+    serialized_acl = json.loads(serialize_user_acl_json(acl))
+    assert serialized_acl == serialize_user_acl(acl)
+    assert serialized_acl["user_id"] == user.id
+    assert serialized_acl["is_authenticated"] is True
+    assert "cache_versions" not in serialized_acl
+    assert "acl_key" not in serialized_acl
+    assert "visible_categories_set" not in serialized_acl
+
+
+def test_serializing_user_acl_doesnt_change_it(cache_versions, user):
+    acl = get_user_acl(user, cache_versions)
+    categories = acl["categories"]
+    serialize_user_acl(acl)
+    assert acl["categories"] is categories
+    assert acl["cache_versions"] == cache_versions
+
+
+@override_settings(MISAGO_SERIALIZED_ACL_CACHE_SIZE=10)
+def test_serialized_acl_is_cached_for_acl_key_and_version(
+    cache_versions, user, other_user
+):
+    serialized_acl_cache.clear()
+
+    acl = get_user_acl(user, cache_versions)
+    serialize_user_acl_json(acl)
+
+    acl["visible_categories"] = []
+    other_user_acl = dict(acl, user_id=other_user.id)
+    serialized_acl = json.loads(serialize_user_acl_json(other_user_acl))
+    assert serialized_acl["visible_categories"]
+    assert serialized_acl["user_id"] == other_user.id
+
+    acl["cache_versions"] = dict(cache_versions, acl="changed")
+    serialized_acl = json.loads(serialize_user_acl_json(acl))
+    assert serialized_acl["visible_categories"] == []
@@ -1,30 +1,116 @@
 import copy
+import json
 
-from . import buildacl
-from .cache import get_acl_cache, set_acl_cache
+from . import ACL_CACHE, buildacl
+from ..cache.versionedcache import VersionedCache
+from ..conf import settings
+from .cache import get_or_build_acl_cache
 from .providers import providers
 
+# Frozenset views of categories ids lists in ACL, for membership tests
+CATEGORIES_SETS = {
+    "visible_categories": "visible_categories_set",
+    "browseable_categories": "browseable_categories_set",
+}
+
+# Keys set on ACL for every user, serialized separately from the rest of ACL
+USER_KEYS = ("user_id", "is_authenticated", "is_anonymous", "is_admin", "is_root")
+
+# Keys that are not serialized at all
+PRIVATE_KEYS = ("cache_versions", "acl_key") + tuple(CATEGORIES_SETS.values())
+
+SERIALIZED_ACL_CACHE = "serialized_acl"
+
+
+class SerializedAclCache(VersionedCache):
+    """Process-local cache for JSON-encoded ACLs, keyed by ACL key and version."""
+
+    def get_local_size(self) -> int:
+        return settings.MISAGO_SERIALIZED_ACL_CACHE_SIZE
+
+    def is_shared(self) -> bool:
+        return False
+
+
+serialized_acl_cache = SerializedAclCache(SERIALIZED_ACL_CACHE)
+
 
 def get_user_acl(user, cache_versions):
-    user_acl = get_acl_cache(user, cache_versions)
-    if user_acl is None:
-        user_acl = buildacl.build_acl(user.get_roles())
-        set_acl_cache(user, cache_versions, user_acl)
+    # Cached ACL is shared between requests, copy it before adding user's data
+    user_acl = get_or_build_acl_cache(user, cache_versions, build_user_acl).copy()
     user_acl["user_id"] = user.id
+    user_acl["acl_key"] = user.acl_key
     user_acl["is_authenticated"] = bool(user.is_authenticated)
     user_acl["is_anonymous"] = bool(user.is_anonymous)
     user_acl["is_admin"] = user.is_misago_admin
     user_acl["is_root"] = user.is_misago_root
     user_acl["cache_versions"] = cache_versions.copy()
+    add_categories_sets(user_acl)
     return user_acl
 
 
+def build_user_acl(user):
+    return buildacl.build_acl(user.get_roles())
+
+
+def add_categories_sets(user_acl):
+    """Adds frozenset views of ACL's categories ids lists.
+
+    Lists are kept in ACL and its cache for backwards compatibility, while sets
+    are built for every request and are not cached.
+    """
+    for list_key, set_key in CATEGORIES_SETS.items():
+        user_acl[set_key] = frozenset(user_acl.get(list_key) or ())
+
+
 def serialize_user_acl(user_acl):
     """serialize authenticated user's ACL"""
-    serialized_acl = copy.deepcopy(user_acl)
-    serialized_acl.pop("cache_versions")
+    return json.loads(serialize_user_acl_json(user_acl))
+
+
+def serialize_user_acl_json(user_acl) -> str:
+    """Returns user's ACL serialized and encoded to JSON.
+
+    ACL shared by all users with same ACL key is serialized and encoded once
+    for every ACL version, and per-user keys are encoded on every call.
+    """
+    user_json = json.dumps({key: user_acl[key] for key in USER_KEYS if key in user_acl})
+    acl_json = get_serialized_acl_json(user_acl)
+
+    if acl_json == "{}":
+        return user_json
+    if user_json == "{}":
+        return acl_json
+    return "%s, %s" % (user_json[:-1], acl_json[1:])
+
+
+def get_serialized_acl_json(user_acl) -> str:
+    if not user_acl.get("acl_key"):
+        return build_serialized_acl_json(user_acl)
+
+    cache_key = "%s_%s_%s" % (
+        SERIALIZED_ACL_CACHE,
+        user_acl["acl_key"],
+        user_acl["cache_versions"][ACL_CACHE],
+    )
+    return serialized_acl_cache.get_or_build(
+        cache_key, lambda: build_serialized_acl_json(user_acl)
+    )
+
+
+def build_serialized_acl_json(user_acl) -> str:
+    """Serializes and encodes ACL without per-user keys.
+
+    Serializers are ran on copy of ACL, and can't depend on per-user keys,
+    because their result is shared by all users with same ACL key.
+    """
+    serialized_acl = {
+        key: copy.deepcopy(value)
+        for key, value in user_acl.items()
+        if key not in USER_KEYS and key not in PRIVATE_KEYS
+    }
 
     for serializer in providers.get_user_acl_serializers():
         serializer(serialized_acl)
 
-    return serialized_acl
+    return json.dumps(serialized_acl)
@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+
+from ..users.models import AnonymousUser
+from .cache import get_or_build_acl_cache
+from .useracl import build_user_acl
+
+User = get_user_model()
+
+
+def warm_up_acl_cache(cache_versions):
+    """Builds ACLs for anonymous user and for every ACL key that users have,
+    so requests after ACL cache invalidation don't build them all at once."""
+    get_or_build_acl_cache(AnonymousUser(), cache_versions, build_user_acl)
+
+    for user in get_users_with_distinct_acl_keys():
+        get_or_build_acl_cache(user, cache_versions, build_user_acl)
+
+
+def get_users_with_distinct_acl_keys():
+    return (
+        User.objects.filter(acl_key__isnull=False)
+        .order_by("acl_key", "id")
+        .distinct("acl_key")
+        .select_related("rank")
+        .prefetch_related("roles", "rank__roles")
+    )
@@ -63,7 +63,7 @@ def test_thread_watch_api_enables_watched_thread_email_notifications(
         send_emails=False,
     )
 
-    with django_assert_num_queries(25):
+    with django_assert_num_queries(24):
         response = user_client.post(
             reverse("misago:apiv2:thread-watch", kwargs={"thread_id": thread.id}),
             json={"notifications": ThreadNotifications.SITE_AND_EMAIL.value},
@@ -89,7 +89,7 @@ def test_thread_watch_api_disables_watched_thread_email_notifications(
         send_emails=True,
     )
 
-    with django_assert_num_queries(25):
+    with django_assert_num_queries(24):
         response = user_client.post(
             reverse("misago:apiv2:thread-watch", kwargs={"thread_id": thread.id}),
             json={"notifications": ThreadNotifications.SITE_ONLY.value},
@@ -113,7 +113,7 @@ def test_thread_watch_api_skips_update_if_notifications_are_not_changed(
         send_emails=True,
     )
 
-    with django_assert_num_queries(24):
+    with django_assert_num_queries(23):
         response = user_client.post(
             reverse("misago:apiv2:thread-watch", kwargs={"thread_id": thread.id}),
             json={"notifications": ThreadNotifications.SITE_AND_EMAIL.value},
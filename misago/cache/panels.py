@@ -0,0 +1,15 @@
+from debug_toolbar.panels import Panel
+from django.utils.translation import pgettext_lazy
+
+from .versionedcache import get_versioned_caches_stats
+
+
+class MisagoVersionedCachesPanel(Panel):
+    """Panel that displays hit rates of process's versioned caches"""
+
+    title = pgettext_lazy("debug toolbar", "Misago Versioned Caches")
+    nav_title = pgettext_lazy("debug toolbar", "Misago Caches")
+    template = "misago/versioned_caches_panel.html"
+
+    def generate_stats(self, request, response):
+        self.record_stats({"versioned_caches": get_versioned_caches_stats()})
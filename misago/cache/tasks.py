@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .versions import get_cache_versions
+from .warmup import warm_up_caches
+
+
+@shared_task(name="cache.warm-up", serializer="json")
+def warm_up_invalidated_caches(cache_names: list[str]):
+    warm_up_caches(cache_names, get_cache_versions())
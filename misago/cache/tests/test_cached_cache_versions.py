@@ -0,0 +1,100 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..models import CacheVersion
+from ..versions import (
+    CACHE_VERSIONS_GENERATION_KEY,
+    cache_versions_snapshot,
+    get_cache_versions,
+    get_cached_cache_versions,
+    invalidate_cache,
+)
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshot():
+    cache_versions_snapshot.clear()
+    yield
+    cache_versions_snapshot.clear()
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=0)
+def test_cached_getter_queries_database_if_ttl_is_disabled(
+    cache_version, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        versions = get_cached_cache_versions()
+    with django_assert_num_queries(1):
+        get_cached_cache_versions()
+
+    assert versions == get_cache_versions()
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=60, CACHES=LOCMEM_CACHE)
+def test_cached_getter_reuses_snapshot_until_it_expires(
+    cache_version, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        versions = get_cached_cache_versions()
+    with django_assert_num_queries(0):
+        assert get_cached_cache_versions() == versions
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=60, CACHES=LOCMEM_CACHE)
+def test_cached_getter_returns_copy_of_snapshot(cache_version):
+    versions = get_cached_cache_versions()
+    versions[cache_version.cache] = "changed"
+    assert get_cached_cache_versions()[cache_version.cache] == cache_version.version
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=60, CACHES=LOCMEM_CACHE)
+def test_cached_getter_keeps_expired_snapshot_if_generation_is_unchanged(
+    cache_version, django_assert_num_queries
+):
+    get_cached_cache_versions()
+    cache_versions_snapshot.expires_at = 0
+
+    with django_assert_num_queries(0):
+        get_cached_cache_versions()
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=60, CACHES=LOCMEM_CACHE)
+def test_cached_getter_reloads_expired_snapshot_if_generation_has_changed(
+    cache_version,
+):
+    get_cached_cache_versions()
+
+    # Simulate invalidation made by other process
+    CacheVersion.objects.filter(cache=cache_version.cache).update(version="changed")
+    cache.set(CACHE_VERSIONS_GENERATION_KEY, "changed")
+
+    assert get_cached_cache_versions()[cache_version.cache] == cache_version.version
+
+    cache_versions_snapshot.expires_at = 0
+    assert get_cached_cache_versions()[cache_version.cache] == "changed"
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=60, CACHES=LOCMEM_CACHE)
+def test_invalidating_cache_clears_local_snapshot(cache_version):
+    get_cached_cache_versions()
+    invalidate_cache(cache_version.cache)
+
+    new_version = CacheVersion.objects.get(cache=cache_version.cache).version
+    assert get_cached_cache_versions()[cache_version.cache] == new_version
+
+
+@override_settings(MISAGO_CACHE_VERSIONS_TTL=60, CACHES=LOCMEM_CACHE)
+def test_invalidating_cache_changes_generation_on_commit(
+    cache_version, django_capture_on_commit_callbacks
+):
+    get_cached_cache_versions()
+    generation = cache.get(CACHE_VERSIONS_GENERATION_KEY)
+    assert generation
+
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_cache(cache_version.cache)
+
+    assert cache.get(CACHE_VERSIONS_GENERATION_KEY) != generation
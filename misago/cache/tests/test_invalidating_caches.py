@@ -1,5 +1,8 @@
+from django.test import override_settings
+
 from ..models import CacheVersion
 from ..versions import invalidate_all_caches, invalidate_cache
+from ..warmup import warm_up_caches
 
 
 def test_invalidating_cache_updates_cache_version_in_database(cache_version):
@@ -12,3 +15,31 @@ def test_invalidating_all_caches_updates_cache_version_in_database(cache_version
     invalidate_all_caches()
     updated_cache_version = CacheVersion.objects.get(cache=cache_version.cache)
     assert cache_version.version != updated_cache_version.version
+
+
+@override_settings(MISAGO_CACHE_WARMERS={"test_cache": "misago.test_warmer"})
+def test_invalidating_cache_schedules_warm_up_on_commit(
+    mocker, cache_version, django_capture_on_commit_callbacks
+):
+    task = mocker.patch("misago.cache.tasks.warm_up_invalidated_caches")
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_cache(cache_version.cache)
+
+    task.delay.assert_called_once_with(["test_cache"])
+
+
+def test_invalidating_cache_without_warmer_doesnt_schedule_warm_up(
+    mocker, cache_version, django_capture_on_commit_callbacks
+):
+    task = mocker.patch("misago.cache.tasks.warm_up_invalidated_caches")
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_cache(cache_version.cache)
+
+    task.delay.assert_not_called()
+
+
+@override_settings(MISAGO_CACHE_WARMERS={"test_cache": "misago.test_warmer"})
+def test_warm_up_calls_cache_warmer_with_cache_versions(mocker):
+    warmer = mocker.patch("misago.test_warmer", create=True)
+    warm_up_caches(["test_cache", "other_cache"], {"test_cache": "abcdefgh"})
+    warmer.assert_called_once_with({"test_cache": "abcdefgh"})
@@ -0,0 +1,163 @@
+from unittest.mock import Mock
+
+from django.core.cache import cache as django_cache
+from django.test import override_settings
+
+from ..versionedcache import VersionedCache, get_versioned_caches_stats
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def test_versioned_cache_returns_none_for_missing_key():
+    cache = VersionedCache("test_missing", size=2)
+    assert cache.get("test") is None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_versioned_cache_returns_value_from_local_cache(mocker):
+    cache_get = mocker.patch("django.core.cache.cache.get")
+    mocker.patch("django.core.cache.cache.set")
+
+    cache = VersionedCache("test_local", size=2)
+    value = {"key": "value"}
+    cache.set("test", value)
+
+    assert cache.get("test") is value
+    cache_get.assert_not_called()
+    assert cache.get_stats()["local_hits"] == 1
+
+
+def test_versioned_cache_returns_copy_of_local_value_if_its_enabled(mocker):
+    mocker.patch("django.core.cache.cache.get")
+    mocker.patch("django.core.cache.cache.set")
+
+    class CopyingVersionedCache(VersionedCache):
+        copy_local_values = True
+
+    cache = CopyingVersionedCache("test_local_copy", size=2)
+    cache.set("test", {"categories": {1: {"can_see": 1}}})
+
+    value = cache.get("test")
+    value["categories"][1]["can_see"] = 0
+    value["lazy_value"] = "value"
+
+    assert cache.get("test") == {"categories": {1: {"can_see": 1}}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_versioned_cache_reads_shared_cache_on_local_miss():
+    cache = VersionedCache("test_shared", size=2)
+    cache.set("test", {"key": "value"})
+    cache.clear()
+
+    assert cache.get("test") == {"key": "value"}
+    assert cache.get("test") == {"key": "value"}
+
+    stats = cache.get_stats()
+    assert stats["shared_hits"] == 1
+    assert stats["local_hits"] == 1
+
+
+def test_versioned_cache_evicts_least_recently_used_keys(mocker):
+    mocker.patch("django.core.cache.cache.get", return_value=None)
+    mocker.patch("django.core.cache.cache.set")
+
+    cache = VersionedCache("test_lru", size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@override_settings(MISAGO_VERSIONED_CACHE_LOCAL_SIZE=0)
+def test_versioned_cache_local_cache_can_be_disabled(mocker):
+    mocker.patch("django.core.cache.cache.get", return_value=None)
+    mocker.patch("django.core.cache.cache.set")
+
+    cache = VersionedCache("test_disabled")
+    cache.set("test", 1)
+
+    assert cache.get("test") is None
+    assert cache.get_stats()["local_size"] == 0
+
+
+def test_versioned_caches_stats_include_registered_caches():
+    VersionedCache("test_stats", size=2)
+    assert "test_stats" in get_versioned_caches_stats()
+
+
+class LocalVersionedCache(VersionedCache):
+    def is_shared(self):
+        return False
+
+
+def test_versioned_cache_skips_shared_cache_if_its_not_shared(mocker):
+    cache_get = mocker.patch("django.core.cache.cache.get")
+    cache_set = mocker.patch("django.core.cache.cache.set")
+
+    cache = LocalVersionedCache("test_not_shared", size=2)
+    cache.set("test", "value")
+    assert cache.get("test") == "value"
+    assert cache.get("other") is None
+
+    cache_get.assert_not_called()
+    cache_set.assert_not_called()
+
+
+def test_versioned_cache_stats_include_hit_rate():
+    cache = VersionedCache("test_hit_rate", size=2)
+    assert cache.get_stats()["hit_rate"] == 0
+
+    cache.set("test", 1)
+    cache.get("test")
+    cache.get("other")
+
+    assert cache.get_stats()["hit_rate"] == 0.5
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_versioned_cache_get_or_build_builds_and_sets_missing_value():
+    cache = VersionedCache("test_build", size=2)
+    build = Mock(return_value={"key": "value"})
+
+    assert cache.get_or_build("test_build", build) == {"key": "value"}
+    assert cache.get_or_build("test_build", build) == {"key": "value"}
+    build.assert_called_once()
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_versioned_cache_get_or_build_releases_lock_after_build():
+    cache = VersionedCache("test_build_lock", size=0)
+    cache.get_or_build("test_build_lock", Mock(return_value="value"))
+
+    assert django_cache.get("test_build_lock:build") is None
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_versioned_cache_get_or_build_waits_for_other_build(mocker):
+    cache = VersionedCache("test_build_wait", size=2)
+    django_cache.add("test_build_wait:build", True)
+
+    # Other process sets the value while this one waits
+    mocker.patch(
+        "misago.cache.versionedcache.time.sleep",
+        side_effect=lambda _: django_cache.set("test_build_wait", "built"),
+    )
+    build = Mock(return_value="value")
+
+    assert cache.get_or_build("test_build_wait", build) == "built"
+    build.assert_not_called()
+
+
+@override_settings(CACHES=LOCMEM_CACHE, MISAGO_CACHE_BUILD_WAIT=0)
+def test_versioned_cache_get_or_build_builds_value_if_wait_times_out():
+    cache = VersionedCache("test_build_timeout", size=2)
+    django_cache.add("test_build_timeout:build", True)
+    build = Mock(return_value="value")
+
+    assert cache.get_or_build("test_build_timeout", build) == "value"
+    build.assert_called_once()
@@ -0,0 +1,173 @@
+import pickle
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
+
+from django.core.cache import cache
+
+from ..conf import settings
+
+BUILD_WAIT_INTERVAL = 0.05
+
+versioned_caches: dict[str, "VersionedCache"] = {}
+
+
+class VersionedCache:
+    """Two-tier cache for values stored under versioned keys.
+
+    Value stored under a versioned key never changes, so once it's been read
+    from the shared cache it's kept in a bounded, process-local LRU and
+    returned from it on subsequent reads, skipping the round trip to the
+    shared cache.
+
+    Values in local LRU are unpickled once and shared between requests, so
+    callers must copy parts of them they mutate. Caches of values that are
+    mutated as a whole set `copy_local_values`, keeping values pickled and
+    returning new copy of the value on every read.
+    """
+
+    copy_local_values = False
+
+    def __init__(self, name: str, size: int | None = None):
+        self.name = name
+        self.size = size
+        self.local = OrderedDict()
+        self.lock = Lock()
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+        versioned_caches[name] = self
+
+    def get_local_size(self) -> int:
+        if self.size is not None:
+            return self.size
+        return settings.MISAGO_VERSIONED_CACHE_LOCAL_SIZE
+
+    def get(self, key: str) -> Any | None:
+        with self.lock:
+            local_value = self.local.get(key)
+            if local_value is not None:
+                self.local.move_to_end(key)
+                self.local_hits += 1
+
+        if local_value is not None:
+            if self.copy_local_values:
+                return pickle.loads(local_value)
+            return local_value
+
+        if not self.is_shared():
+            with self.lock:
+                self.misses += 1
+            return None
+
+        value = cache.get(key)
+        if value is None:
+            with self.lock:
+                self.misses += 1
+            return None
+
+        with self.lock:
+            self.shared_hits += 1
+            self._set_local(key, value)
+        return value
+
+    def is_shared(self) -> bool:
+        return True
+
+    def set(self, key: str, value: Any):
+        if self.is_shared():
+            cache.set(key, value)
+        with self.lock:
+            self._set_local(key, value)
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> Any:
+        """Returns value from cache, building and caching it if it's missing.
+
+        Only one process builds missing value at a time. Other processes wait
+        for it to appear in the shared cache, and build it themselves only if
+        that takes longer than `MISAGO_CACHE_BUILD_WAIT` seconds.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        if not self.is_shared():
+            value = build()
+            self.set(key, value)
+            return value
+
+        lock_key = f"{key}:build"
+        if cache.add(lock_key, True, settings.MISAGO_CACHE_BUILD_LOCK_TIMEOUT):
+            try:
+                value = build()
+                self.set(key, value)
+            finally:
+                cache.delete(lock_key)
+            return value
+
+        value = self._wait_for_build(key)
+        if value is None:
+            value = build()
+            self.set(key, value)
+        return value
+
+    def _wait_for_build(self, key: str) -> Any | None:
+        deadline = time.monotonic() + settings.MISAGO_CACHE_BUILD_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(BUILD_WAIT_INTERVAL)
+            value = cache.get(key)
+            if value is not None:
+                with self.lock:
+                    self.shared_hits += 1
+                    self._set_local(key, value)
+                return value
+
+        return None
+
+    def _set_local(self, key: str, value: Any):
+        local_size = self.get_local_size()
+        if not local_size:
+            return
+
+        if self.copy_local_values:
+            self.local[key] = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        else:
+            self.local[key] = value
+        self.local.move_to_end(key)
+        while len(self.local) > local_size:
+            self.local.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.local.clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        with self.lock:
+            hits = self.local_hits + self.shared_hits
+            reads = hits + self.misses
+
+            return {
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_rate": hits / reads if reads else 0.0,
+                "local_size": len(self.local),
+            }
+
+    def reset_stats(self):
+        with self.lock:
+            self.local_hits = 0
+            self.shared_hits = 0
+            self.misses = 0
+
+
+def get_versioned_caches_stats() -> dict[str, dict[str, int | float]]:
+    return {name: cache.get_stats() for name, cache in versioned_caches.items()}
+
+
+def clear_versioned_caches():
+    for versioned_cache in versioned_caches.values():
+        versioned_cache.clear()
@@ -1,20 +1,114 @@
+import time
+from threading import Lock
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..conf import settings
 from .models import CacheVersion
 from .utils import generate_version_string
 
+CACHE_VERSIONS_GENERATION_KEY = "misago_cache_versions_generation"
+
+
+class CacheVersionsSnapshot:
+    """Process-local copy of cache versions.
+
+    Snapshot is reused until it expires. Expired snapshot is compared with the
+    generation stored in shared cache and only reloaded from the database if
+    cache versions were invalidated since it was taken.
+    """
+
+    def __init__(self):
+        self.versions = None
+        self.generation = None
+        self.expires_at = 0
+        self.lock = Lock()
+
+    def get(self, ttl: int) -> dict:
+        with self.lock:
+            now = time.monotonic()
+            if self.versions is not None and now < self.expires_at:
+                return self.versions.copy()
+
+            # Generation has to be read before the versions, otherwise
+            # invalidation happening between two reads would go unnoticed
+            generation = cache.get(CACHE_VERSIONS_GENERATION_KEY)
+            if (
+                self.versions is None
+                or generation is None
+                or generation != self.generation
+            ):
+                self.versions = get_cache_versions()
+                if generation is None:
+                    generation = generate_version_string()
+                    cache.add(CACHE_VERSIONS_GENERATION_KEY, generation, None)
+                self.generation = generation
+
+            self.expires_at = now + ttl
+            return self.versions.copy()
+
+    def clear(self):
+        with self.lock:
+            self.versions = None
+            self.generation = None
+            self.expires_at = 0
+
+
+cache_versions_snapshot = CacheVersionsSnapshot()
+
 
 def get_cache_versions():
     queryset = CacheVersion.objects.all()
     return {i.cache: i.version for i in queryset}
 
 
+def get_cached_cache_versions():
+    ttl = settings.MISAGO_CACHE_VERSIONS_TTL
+    if not ttl:
+        return get_cache_versions()
+
+    return cache_versions_snapshot.get(ttl)
+
+
 def invalidate_cache(*cache_name: str):
     CacheVersion.objects.filter(cache__in=cache_name).update(
         version=generate_version_string()
     )
+    publish_cache_versions_change(cache_name)
 
 
 def invalidate_all_caches():
-    for cache_name in get_cache_versions().keys():
+    cache_names = list(get_cache_versions())
+    for cache_name in cache_names:
         CacheVersion.objects.filter(cache=cache_name).update(
             version=generate_version_string()
         )
+    publish_cache_versions_change(cache_names)
+
+
+def publish_cache_versions_change(cache_names: Iterable[str] = ()):
+    # Clear local snapshot right away so this process sees its own changes
+    cache_versions_snapshot.clear()
+    transaction.on_commit(_bump_cache_versions_generation)
+
+    warmed_caches = [
+        cache_name
+        for cache_name in cache_names
+        if cache_name in settings.MISAGO_CACHE_WARMERS
+    ]
+    if warmed_caches:
+        transaction.on_commit(lambda: _schedule_caches_warm_up(warmed_caches))
+
+
+def _bump_cache_versions_generation():
+    cache.set(CACHE_VERSIONS_GENERATION_KEY, generate_version_string(), None)
+    cache_versions_snapshot.clear()
+
+
+def _schedule_caches_warm_up(cache_names: list[str]):
+    # Tasks module imports cache versions
+    from .tasks import warm_up_invalidated_caches
+
+    warm_up_invalidated_caches.delay(cache_names)
@@ -0,0 +1,16 @@
+from django.utils.module_loading import import_string
+
+from ..conf import settings
+
+
+def warm_up_caches(cache_names: list[str], cache_versions: dict):
+    """Builds values of invalidated caches before requests need them.
+
+    Warmers are configured in `MISAGO_CACHE_WARMERS` setting and are called
+    with current cache versions.
+    """
+    for cache_name in cache_names:
+        warmer_path = settings.MISAGO_CACHE_WARMERS.get(cache_name)
+        if warmer_path:
+            warmer = import_string(warmer_path)
+            warmer(cache_versions)
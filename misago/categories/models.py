@@ -118,6 +118,11 @@ class Category(MPTTModel, PluginDataModel):
         return super().delete(*args, **kwargs)
 
     def synchronize(self):
+        from ..threads.statsdeltas import discard_category_stats_deltas
+
+        # Pending deltas are already included in recounted values
+        discard_category_stats_deltas(self)
+
         threads_queryset = self.thread_set.filter(is_hidden=False, is_unapproved=False)
         self.threads = threads_queryset.count()
 
@@ -50,10 +50,13 @@ def get_categories_roles(roles):
 
 def build_category_acl(acl, category, categories_roles, key_name):
     if category.level > 1:
-        if category.parent_id not in acl["visible_categories"]:
+        # categories dict is keyed by visible categories, so parent lookup
+        # doesn't scan visible categories list for every category
+        parent_acl = acl["categories"].get(category.parent_id)
+        if not parent_acl:
             # dont bother with child categories of invisible parents
             return
-        if not acl["categories"][category.parent_id]["can_browse"]:
+        if not parent_acl["can_browse"]:
             # parent's visible, but its contents aint
             return
 
@@ -110,7 +113,7 @@ def allow_see_category(user_acl, target):
     except AttributeError:
         category_id = int(target)
 
-    if not category_id in user_acl["visible_categories"]:
+    if category_id not in user_acl["visible_categories_set"]:
         raise Http404()
 
 
@@ -51,7 +51,7 @@ def get_categories_list(request: HttpRequest):
             "last_thread": category_last_thread,
             "new_posts": False,
             "is_protected": category.id
-            not in request.user_acl["browseable_categories"],
+            not in request.user_acl["browseable_categories_set"],
             "is_private": not category_permissions["can_see_all_threads"],
             "children": [],
             "children_threads": category.threads,
@@ -1,17 +1,18 @@
-from django.core.cache import cache
-
 from . import SETTINGS_CACHE
+from ..cache.versionedcache import VersionedCache
 from ..cache.versions import invalidate_cache
 
+settings_cache = VersionedCache(SETTINGS_CACHE)
+
 
 def get_settings_cache(cache_versions):
     key = get_cache_key(cache_versions)
-    return cache.get(key)
+    return settings_cache.get(key)
 
 
 def set_settings_cache(cache_versions, user_settings):
     key = get_cache_key(cache_versions)
-    cache.set(key, user_settings)
+    settings_cache.set(key, user_settings)
 
 
 def get_cache_key(cache_versions):
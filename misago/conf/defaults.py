@@ -73,6 +73,26 @@ MISAGO_POSTING_MIDDLEWARES = [
 ]
 
 
+# Record changes to categories and users threads and posts counters as deltas
+# instead of updating them in the posting transaction, which makes every poster
+# in busy category wait for the same row lock. Pending deltas are folded into
+# the counters by the "foldstatsdeltas" management command or the
+# "threads.fold-stats-deltas" Celery task that should be ran periodically.
+# Categories last thread and last post date are also updated when deltas are
+# folded, so they lag behind new posts until next fold.
+
+MISAGO_DEFERRED_STATS = False
+
+
+# Update posts search vectors in background instead of the posting transaction.
+# Posts with changed search documents are marked as outdated, and their search
+# vectors are updated in batches by the "updatesearchvectors" management command
+# or the "threads.update-search-vectors" Celery task that should be ran
+# periodically. New and edited posts are found by search after next update.
+
+MISAGO_DEFERRED_SEARCH_VECTORS = False
+
+
 # Configured thread types
 
 MISAGO_THREAD_TYPES = [
@@ -124,6 +144,88 @@ MISAGO_ADMIN_NAMESPACES = ["admin", "misago:admin"]
 MISAGO_ADMIN_SESSION_EXPIRATION = 60
 
 
+# How long (in seconds) should each process reuse its local copy of cache versions
+# before checking the shared cache for invalidations. Invalidations made by other
+# processes take effect within this delay, provided that the cache backend is
+# shared between them (eg. Redis or Memcached). Set to 0 to read cache versions
+# from the database on every request.
+
+MISAGO_CACHE_VERSIONS_TTL = 5
+
+
+# How many values (eg. settings, ACLs or user permissions) should each process keep
+# in its local LRU cache, in front of the shared cache. Set to 0 to disable local cache.
+
+MISAGO_VERSIONED_CACHE_LOCAL_SIZE = 256
+
+
+# For how many seconds process building a versioned cache value (eg. user ACL) holds
+# a lock in the shared cache. Other processes wait up to MISAGO_CACHE_BUILD_WAIT
+# seconds for it to finish, instead of building the same value again.
+
+MISAGO_CACHE_BUILD_LOCK_TIMEOUT = 30
+MISAGO_CACHE_BUILD_WAIT = 5
+
+
+# Functions that build values of invalidated caches in a Celery task, so they are
+# ready before requests need them. Keys are cache names, values are import paths.
+
+MISAGO_CACHE_WARMERS = {
+    "acl": "misago.acl.warmup.warm_up_acl_cache",
+    "permissions": "misago.permissions.warmup.warm_up_permissions_cache",
+}
+
+
+# How many parsed markups should each process keep in its local LRU cache, so
+# identical markup (eg. quoted post or repeated preview) is parsed only once.
+# Set to 0 to disable local cache. Enable shared cache to also store parsed
+# markups in the cache backend, where they are shared between processes.
+
+MISAGO_PARSER_AST_CACHE_SIZE = 128
+MISAGO_PARSER_AST_CACHE_SHARED = False
+
+
+# How many parsing results of legacy markup should each process keep in its
+# local LRU cache. Results of markups with mentions are never cached. Set to 0
+# to disable local cache. Enable shared cache to also store parsing results in
+# the cache backend, where they are shared between processes.
+
+MISAGO_MARKUP_CACHE_SIZE = 128
+MISAGO_MARKUP_CACHE_SHARED = False
+
+
+# How many threads and posts visibility plans (categories in which user can see
+# all, hidden or unapproved content) should each process keep in its local LRU
+# cache. Plans are keyed by user's ACL key and version. Set to 0 to disable.
+
+MISAGO_VISIBILITY_PLANS_CACHE_SIZE = 256
+
+
+# How many serialized and JSON-encoded ACLs should each process keep in its
+# local LRU cache, to skip serializing ACL for every page with frontend context.
+# ACLs are keyed by user's ACL key and version. Set to 0 to disable.
+
+MISAGO_SERIALIZED_ACL_CACHE_SIZE = 128
+
+
+# Minimum time (in seconds) between updates of user's online tracker.
+# Requests made sooner after the previous update don't write to the database.
+
+MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD = 30
+
+
+# Buffer online tracker updates in the shared cache instead of saving them right away.
+# Buffered updates are saved to the database in bulk by the "flushonlinetracker"
+# management command or the "users.flush-online-tracker" Celery task, which should
+# be ran every MISAGO_ONLINE_TRACKER_FLUSH_INTERVAL seconds. Only one update per
+# user per update threshold is buffered, so the database lags behind user's last
+# click by up to the sum of the update threshold and the flush interval. This sum
+# must stay below two minutes, after which users are displayed as offline.
+
+MISAGO_ONLINE_TRACKER_BUFFERED = False
+MISAGO_ONLINE_TRACKER_FLUSH_INTERVAL = 60
+
+
 # Display threads on forum index
 # Change this to false to display categories list instead
 
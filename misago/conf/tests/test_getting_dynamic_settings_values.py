@@ -1,6 +1,8 @@
 import pytest
+from django.test import override_settings
 
 from .. import SETTINGS_CACHE
+from ..cache import settings_cache
 from ..dynamicsettings import DynamicSettings
 
 
@@ -83,6 +85,21 @@ def test_lazy_setting_getter_for_lazy_setting_makes_db_query(
         settings.get_lazy_setting_value("lazy_setting")
 
 
+@override_settings(MISAGO_VERSIONED_CACHE_LOCAL_SIZE=10)
+def test_lazy_setting_real_value_is_not_stored_in_cached_settings(
+    cache_versions, lazy_setting
+):
+    settings_cache.clear()
+
+    settings = DynamicSettings(cache_versions)
+    settings.get_lazy_setting_value("lazy_setting")
+
+    other_settings = DynamicSettings(cache_versions)
+    assert "real_value" not in other_settings.get("lazy_setting")
+
+    settings_cache.clear()
+
+
 def test_accessing_attr_for_lazy_setting_without_value_returns_none(
     cache_versions, lazy_setting_without_value
 ):
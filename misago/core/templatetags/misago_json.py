@@ -1,15 +1,28 @@
 import json
+from uuid import uuid4
 
 from django import template
 from django.utils.safestring import mark_safe
 
-from ..utils import encode_json_html
+from ..utils import PreencodedJSON, encode_json_html
 
 register = template.Library()
 
 
 @register.filter
 def as_json(value):
-    json_dump = json.dumps(value)
+    preencoded = {}
+
+    def encode_preencoded(obj):
+        if isinstance(obj, PreencodedJSON):
+            placeholder = "preencoded-json-%s" % uuid4().hex
+            preencoded[json.dumps(placeholder)] = obj.json
+            return placeholder
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    json_dump = json.dumps(value, default=encode_preencoded)
+    for placeholder, preencoded_json in preencoded.items():
+        json_dump = json_dump.replace(placeholder, preencoded_json, 1)
+
     # fixes XSS as described in #651
     return mark_safe(encode_json_html(json_dump))
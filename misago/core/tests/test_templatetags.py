@@ -2,6 +2,7 @@ from django.template import Context, Template
 from django.test import TestCase
 
 from ..templatetags.misago_batch import batch, batchnonefilled
+from ..utils import PreencodedJSON
 
 
 class CaptureTests(TestCase):
@@ -134,6 +135,21 @@ class JSONTests(TestCase):
             r'{"he\u003C/script>llo": "bo\"b!"}',
         )
 
+    def test_json_filter_inserts_preencoded_json(self):
+        """as_json filter inserts preencoded json as it is"""
+        tpl_content = """
+{% load misago_json %}
+
+{{ value|as_json }}
+"""
+
+        tpl = Template(tpl_content)
+        value = {"user": {"acl": PreencodedJSON('{"he</script>llo": 1}')}}
+        self.assertEqual(
+            tpl.render(Context({"value": value})).strip(),
+            r'{"user": {"acl": {"he\u003C/script>llo": 1}}}',
+        )
+
 
 class PageTitleTests(TestCase):
     def test_single_title(self):
@@ -23,6 +23,13 @@ def encode_json_html(string):
     return string.replace("<", r"\u003C")
 
 
+class PreencodedJSON:
+    """Value already encoded to JSON, inserted as it is by as_json filter"""
+
+    def __init__(self, json):
+        self.json = json
+
+
 ISO8601_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f")
 
 
@@ -1,13 +1,22 @@
+from django.utils.translation import pgettext
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
 from . import common_flavour, finalize_markup
-from .serializers import MarkupSerializer
+from .preview import (
+    PreviewBlocksExpired,
+    get_preview_blocks_markup,
+    render_preview_blocks,
+)
+from .serializers import MarkupBlocksSerializer, MarkupSerializer
 
 
 @api_view(["POST"])
 def parse_markup(request):
+    if isinstance(request.data, dict) and "blocks" in request.data:
+        return parse_markup_blocks(request)
+
     serializer = MarkupSerializer(
         data=request.data, context={"settings": request.settings}
     )
@@ -21,3 +30,59 @@ def parse_markup(request):
     finalized = finalize_markup(parsing_result["parsed_text"])
 
     return Response({"parsed": finalized})
+
+
+def parse_markup_blocks(request):
+    """Incremental preview: client sends markup of changed blocks and hashes of
+    blocks unchanged since previous preview, and receives HTML of new blocks."""
+    serializer = MarkupBlocksSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(
+            {"detail": get_first_error(serializer.errors)},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        markup = get_preview_blocks_markup(request, serializer.data["blocks"])
+    except PreviewBlocksExpired:
+        return Response(
+            {
+                "detail": pgettext(
+                    "markup preview", "Preview has expired. Send the whole message."
+                ),
+                "code": "preview_expired",
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    markup_serializer = MarkupSerializer(
+        data={"post": markup}, context={"settings": request.settings}
+    )
+    if not markup_serializer.is_valid():
+        return Response(
+            {"detail": get_first_error(markup_serializer.errors)},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    sent_hashes = {
+        block["hash"] for block in serializer.data["blocks"] if "hash" in block
+    }
+    blocks = render_preview_blocks(request, markup)
+
+    response_blocks = []
+    for block in blocks:
+        response_block = {"hash": block["hash"], "length": len(block["markup"])}
+        if block["hash"] not in sent_hashes:
+            response_block["parsed"] = block["parsed"]
+        response_blocks.append(response_block)
+
+    return Response({"blocks": response_blocks})
+
+
+def get_first_error(errors):
+    while isinstance(errors, (dict, list)):
+        if isinstance(errors, dict):
+            errors = list(errors.values())[0]
+        else:
+            errors = errors[0]
+    return errors
@@ -0,0 +1,33 @@
+from hashlib import sha256
+
+from ..cache.versionedcache import VersionedCache
+from ..conf import settings
+
+MARKUP_CACHE = "markup"
+
+
+class MarkupCache(VersionedCache):
+    """Cache for parsing results of legacy markup, keyed by text hash, host
+    and parser's flags.
+
+    Parsing results that depend on database state, like mentions, are not
+    cached, so keys are never invalidated.
+    """
+
+    copy_local_values = True
+
+    def get_local_size(self) -> int:
+        return settings.MISAGO_MARKUP_CACHE_SIZE
+
+    def is_shared(self) -> bool:
+        return settings.MISAGO_MARKUP_CACHE_SHARED
+
+
+markup_cache = MarkupCache(MARKUP_CACHE)
+
+
+def get_markup_cache_key(text: str, host: str, *flags: bool) -> str:
+    text_hash = sha256(text.encode()).hexdigest()
+    flags_str = "".join("1" if flag else "0" for flag in flags)
+    host_hash = sha256(host.encode()).hexdigest()[:8]
+    return f"misago_{MARKUP_CACHE}_{flags_str}_{host_hash}_{text_hash}"
@@ -0,0 +1,355 @@
+import html
+from html.parser import HTMLParser
+
+from .htmlparser import SINGLETON_TAGS
+from .links import URL_RE, clean_link, strip_link_protocol
+from .mentions import (
+    EXCLUDE_ELEMENTS,
+    MENTIONS_LIMIT,
+    USERNAME_RE,
+    find_mentions_in_str,
+    get_users_data,
+)
+
+# Start tags of those elements close open paragraph, like in html5lib
+PARAGRAPH_CLOSING_TAGS = (
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "center",
+    "details",
+    "dialog",
+    "dir",
+    "div",
+    "dl",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hgroup",
+    "hr",
+    "listing",
+    "main",
+    "menu",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "summary",
+    "table",
+    "ul",
+)
+# Elements that prevent paragraph outside of them from being closed
+PARAGRAPH_SCOPE_TAGS = ("button", "caption", "object", "table", "td", "th")
+
+
+def rewrite_html(
+    request,
+    result: dict,
+    *,
+    linkify: bool,
+    mentions: bool,
+    clean_links: bool,
+    force_shva: bool = False,
+):
+    """Linkifies texts, adds mentions and cleans links and images in parsed text.
+
+    Replaces html5lib tree built and walked by `linkify_texts`, `add_mentions`
+    and `clean_links` with single pass over HTML tokens, producing same HTML.
+    """
+    rewriter = HTMLRewriter(
+        request.get_host() if clean_links else "",
+        linkify=linkify,
+        mentions=mentions,
+        clean_links=clean_links,
+        force_shva=force_shva,
+    )
+    rewriter.feed(result["parsed_text"])
+    rewriter.close()
+
+    users_data = {}
+    if rewriter.usernames and len(rewriter.usernames) <= MENTIONS_LIMIT:
+        users_data = get_users_data(rewriter.usernames)
+    if users_data:
+        result["mentions"] = [user[0] for user in users_data.values()]
+
+    for link in rewriter.links:
+        if isinstance(link, MentionsText):
+            rewriter.resolve_mentions(link, users_data)
+            for result_key, result_link in link.links:
+                result[result_key].append(result_link)
+        else:
+            result_key, result_link = link
+            result[result_key].append(result_link)
+
+    result["parsed_text"] = "".join(str(part) for part in rewriter.html)
+
+
+class MentionsText:
+    """Text with mentions, rendered after mentioned users are loaded."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.html = html.escape(text)
+        self.links: list[tuple[str, str]] = []
+
+    def __str__(self):
+        return self.html
+
+
+class HTMLRewriter(HTMLParser):
+    def __init__(
+        self,
+        host: str,
+        *,
+        linkify: bool,
+        mentions: bool,
+        clean_links: bool,
+        force_shva: bool,
+    ):
+        super().__init__(convert_charrefs=True)
+
+        self.host = host
+        self.linkify = linkify
+        self.mentions = mentions
+        self.clean_links = clean_links
+        self.force_shva = force_shva
+
+        self.html: list[str | MentionsText] = []
+        self.links: list[tuple[str, str] | MentionsText] = []
+        self.usernames: set[str] = set()
+
+        self.stack: list[str] = []
+        # Number of open elements in which texts aren't linkified or mentioned
+        self.excluded = 0
+        # Open anchors which children are counted to clean their text
+        self.anchors: list[dict] = []
+        self.pre_newline = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        self.pre_newline = False
+
+        if tag in PARAGRAPH_CLOSING_TAGS and self.has_paragraph_in_scope():
+            self.handle_endtag("p")
+
+        self.count_anchor_child()
+
+        attrs_dict: dict = {}
+        for name, value in attrs:
+            attrs_dict.setdefault(name, value)
+
+        if tag == "a" and self.clean_links:
+            self.clean_anchor_attrs(attrs_dict, self.links)
+        elif tag == "img" and self.clean_links:
+            self.clean_image_attrs(attrs_dict)
+
+        self.html.append(write_start_tag(tag, attrs_dict))
+
+        if tag in SINGLETON_TAGS:
+            return
+
+        self.stack.append(tag)
+        if tag in EXCLUDE_ELEMENTS:
+            self.excluded += 1
+        if tag == "a" and self.clean_links:
+            self.anchors.append(
+                {
+                    "depth": len(self.stack),
+                    "href": attrs_dict["href"],
+                    "children": 0,
+                    "text": None,
+                    "text_index": None,
+                }
+            )
+        if tag == "pre":
+            self.pre_newline = True
+
+    def handle_endtag(self, tag: str):
+        if tag == "p" and not self.has_paragraph_in_scope():
+            # html5lib inserts empty paragraph for closing tag without opening
+            self.count_anchor_child()
+            self.html.append("<p></p>")
+            return
+
+        if tag not in self.stack:
+            return
+
+        while self.stack:
+            if self.anchors and self.anchors[-1]["depth"] == len(self.stack):
+                self.close_anchor(self.anchors.pop())
+
+            closed_tag = self.stack.pop()
+            if closed_tag in EXCLUDE_ELEMENTS:
+                self.excluded -= 1
+            self.html.append(f"</{closed_tag}>")
+
+            if closed_tag == tag:
+                break
+
+    def handle_data(self, data: str):
+        if self.pre_newline:
+            self.pre_newline = False
+            if data.startswith("\n"):
+                data = data[1:]
+            if not data:
+                return
+
+        self.count_anchor_child(data)
+
+        if self.excluded or not self.linkify:
+            self.write_text(data)
+            return
+
+        cursor = 0
+        for match in URL_RE.finditer(data):
+            start, end = match.span()
+            if start > cursor:
+                self.write_text(data[cursor:start])
+            self.write_link(data[start:end])
+            cursor = end
+
+        if cursor < len(data):
+            self.write_text(data[cursor:])
+
+    def close(self):
+        super().close()
+
+        if self.stack:
+            self.handle_endtag(self.stack[0])
+
+    def has_paragraph_in_scope(self) -> bool:
+        for tag in reversed(self.stack):
+            if tag == "p":
+                return True
+            if tag in PARAGRAPH_SCOPE_TAGS:
+                return False
+        return False
+
+    def count_anchor_child(self, text: str | None = None):
+        if not self.anchors or self.anchors[-1]["depth"] != len(self.stack):
+            return
+
+        anchor = self.anchors[-1]
+        anchor["children"] += 1
+        if text is not None and anchor["children"] == 1:
+            anchor["text"] = text
+            anchor["text_index"] = len(self.html)
+
+    def close_anchor(self, anchor: dict):
+        if not anchor["children"]:
+            self.html.append(html.escape(strip_link_protocol(anchor["href"])))
+        elif anchor["children"] == 1 and anchor["text"] is not None:
+            if URL_RE.match(anchor["text"]):
+                text = strip_link_protocol(anchor["text"])
+                self.html[anchor["text_index"]] = html.escape(text)
+
+    def write_text(self, text: str):
+        if self.mentions and not self.excluded and "@" in text:
+            usernames = find_mentions_in_str(text)
+            if usernames:
+                self.usernames.update(usernames)
+                mentions_text = MentionsText(text)
+                self.html.append(mentions_text)
+                self.links.append(mentions_text)
+                return
+
+        self.html.append(html.escape(text))
+
+    def write_link(self, url: str):
+        attrs = {"href": url}
+        text = strip_link_protocol(url)
+
+        if self.clean_links:
+            self.clean_anchor_attrs(attrs, self.links)
+            if URL_RE.match(text):
+                text = strip_link_protocol(text)
+
+        self.html.append(write_start_tag("a", attrs))
+        self.html.append(html.escape(text))
+        self.html.append("</a>")
+
+    def clean_anchor_attrs(self, attrs: dict, links: list):
+        href, result_href, is_internal = clean_link(
+            attrs.get("href") or "/", self.host, self.force_shva
+        )
+
+        if is_internal:
+            links.append(("internal_links", result_href))
+        else:
+            links.append(("outgoing_links", result_href))
+            attrs["rel"] = "external nofollow noopener"
+
+        attrs["target"] = "_blank"
+        attrs["href"] = href
+
+    def clean_image_attrs(self, attrs: dict):
+        src, result_src, _ = clean_link(
+            attrs.get("src") or "/", self.host, self.force_shva
+        )
+
+        if "alt" in attrs:
+            attrs["alt"] = strip_link_protocol(attrs["alt"] or "")
+        self.links.append(("images", result_src))
+        attrs["src"] = src
+
+    def resolve_mentions(self, mentions_text: MentionsText, users_data: dict):
+        if not users_data:
+            return
+
+        html_parts: list[str] = []
+        text = mentions_text.text
+
+        while True:
+            match = USERNAME_RE.search(text)
+            if not match:
+                html_parts.append(html.escape(text))
+                break
+
+            start, end = match.span()
+            user_slug = text[start + 1 : end].lower().replace("_", "-")
+
+            if user_slug not in users_data:
+                html_parts.append(html.escape(text[:end]))
+                text = text[end:]
+                continue
+
+            html_parts.append(html.escape(text[:start]))
+
+            user_id, username = users_data[user_slug]
+            attrs = {
+                "href": f"/u/{user_slug}/{user_id}/",
+                "data-quote": f"@{username}",
+            }
+            if self.clean_links:
+                self.clean_anchor_attrs(attrs, mentions_text.links)
+
+            html_parts.append(write_start_tag("a", attrs))
+            html_parts.append(html.escape(f"@{username}"))
+            html_parts.append("</a>")
+
+            text = text[end:]
+
+        mentions_text.html = "".join(html_parts)
+
+
+def write_start_tag(tag: str, attrs: dict) -> str:
+    parts = [tag]
+    for name, value in attrs.items():
+        if value is True or not value:
+            parts.append(html.escape(str(name)))
+        else:
+            parts.append(f'{html.escape(str(name))}="{html.escape(str(value))}"')
+
+    if tag in SINGLETON_TAGS:
+        return "<%s />" % " ".join(parts)
+    return "<%s>" % " ".join(parts)
@@ -94,23 +94,21 @@ def clean_link_node(
     node: ElementNode,
     force_shva: bool,
 ):
-    host = request.get_host()
-    href = node.attrs.get("href") or "/"
+    href, result_href, is_internal = clean_link(
+        node.attrs.get("href") or "/", request.get_host(), force_shva
+    )
 
-    if is_internal_link(href, host):
-        href = clean_internal_link(href, host)
-        result["internal_links"].append(href)
-        href = clean_attachment_link(href, force_shva)
+    if is_internal:
+        result["internal_links"].append(result_href)
     else:
-        result["outgoing_links"].append(strip_link_protocol(href))
-        href = assert_link_prefix(href)
+        result["outgoing_links"].append(result_href)
         node.attrs["rel"] = "external nofollow noopener"
 
     node.attrs["target"] = "_blank"
     node.attrs["href"] = href
 
     if len(node.children) == 0:
-        node.children.append(strip_link_protocol(href))
+        node.children.append(TextNode(text=strip_link_protocol(href)))
     elif len(node.children) == 1 and isinstance(node.children[0], TextNode):
         text = node.children[0].text
         if URL_RE.match(text):
@@ -123,20 +121,23 @@ def clean_image_node(
     node: ElementNode,
     force_shva: bool,
 ):
-    host = request.get_host()
-    src = node.attrs.get("src") or "/"
+    src, result_src, _ = clean_link(
+        node.attrs.get("src") or "/", request.get_host(), force_shva
+    )
 
     node.attrs["alt"] = strip_link_protocol(node.attrs["alt"])
+    result["images"].append(result_src)
+    node.attrs["src"] = src
 
-    if is_internal_link(src, host):
-        src = clean_internal_link(src, host)
-        result["images"].append(src)
-        src = clean_attachment_link(src, force_shva)
-    else:
-        result["images"].append(strip_link_protocol(src))
-        src = assert_link_prefix(src)
 
-    node.attrs["src"] = src
+def clean_link(link: str, host: str, force_shva: bool) -> tuple[str, str, bool]:
+    """Returns cleaned link, link to store in parsing result and a bool that is
+    True if link is internal."""
+    if is_internal_link(link, host):
+        link = clean_internal_link(link, host)
+        return clean_attachment_link(link, force_shva), link, True
+
+    return assert_link_prefix(link), strip_link_protocol(link), False
 
 
 def is_internal_link(link, host):
@@ -111,7 +111,7 @@ def add_mentions_to_text(text: str, users_data):
 
         # Append match string to nodes and keep scanning
         if user_slug not in users_data:
-            nodes.append(TextNode(text=text[:end]))
+            nodes.append(TextNode(text=text[start:end]))
             text = text[end:]
             continue
 
@@ -1,18 +1,26 @@
+import re
+
 import markdown
 from markdown.extensions.fenced_code import FencedCodeExtension
 
+from .. import hooks
+from ..conf import settings
 from .bbcode.code import CodeBlockExtension
 from .bbcode.hr import BBCodeHRProcessor
 from .bbcode.inline import bold, image, italics, underline, url
 from .bbcode.quote import QuoteExtension
 from .bbcode.spoiler import SpoilerExtension
-from .htmlparser import parse_html_string, print_html_string
-from .links import clean_links, linkify_texts
+from .cache import get_markup_cache_key, markup_cache
+from .htmlrewriter import rewrite_html
+from .links import URL_RE
 from .md.shortimgs import ShortImagesExtension
 from .md.strikethrough import StrikethroughExtension
-from .mentions import add_mentions
 from .pipeline import pipeline
 
+HTML_TAG_RE = re.compile(r"(<[^>]*>)")
+# Entities other than ones escaped by markdown are decoded by rewriter
+HTML_ENTITY_RE = re.compile(r"&(?!(amp|lt|gt);)")
+
 
 def parse(
     text,
@@ -34,6 +42,22 @@ def parse(
 
     Returns dict object
     """
+    use_cache = not has_markup_extensions()
+    if use_cache:
+        cache_key = get_markup_cache_key(
+            text,
+            request.get_host(),
+            allow_mentions,
+            allow_links,
+            allow_images,
+            allow_blocks,
+            force_shva,
+        )
+        parsing_result = markup_cache.get(cache_key)
+        if parsing_result is not None:
+            parsing_result["markdown"] = None
+            return parsing_result
+
     md = md_factory(
         allow_links=allow_links, allow_images=allow_images, allow_blocks=allow_blocks
     )
@@ -56,23 +80,71 @@ def parse(
 
     # Run additional operations
     if allow_mentions or allow_links or allow_images:
-        root_node = parse_html_string(parsing_result["parsed_text"])
+        if needs_html_processing(
+            parsing_result["parsed_text"], allow_mentions, allow_links, allow_images
+        ):
+            rewrite_html(
+                request,
+                parsing_result,
+                linkify=allow_links,
+                mentions=allow_mentions,
+                clean_links=allow_links or allow_images,
+                force_shva=force_shva,
+            )
+        else:
+            # Produce same HTML as rewriter would, without it
+            parsing_result["parsed_text"] = escape_html_texts_quotes(
+                parsing_result["parsed_text"]
+            )
 
-        if allow_links:
-            linkify_texts(root_node)
+    # Let plugins do their magic
+    parsing_result = pipeline.process_result(parsing_result)
 
-        if allow_mentions:
-            add_mentions(parsing_result, root_node)
+    # Mentions depend on users in database and can't be cached
+    if use_cache and not (allow_mentions and "@" in parsing_result["parsed_text"]):
+        markup_cache.set(cache_key, {**parsing_result, "markdown": None})
 
-        if allow_links or allow_images:
-            clean_links(request, parsing_result, root_node, force_shva)
+    return parsing_result
 
-        parsing_result["parsed_text"] = print_html_string(root_node)
 
-    # Let plugins do their magic
-    parsing_result = pipeline.process_result(parsing_result)
+def has_markup_extensions() -> bool:
+    return bool(
+        settings.MISAGO_MARKUP_EXTENSIONS
+        or hooks.markdown_extensions
+        or hooks.parsing_result_processors
+    )
 
-    return parsing_result
+
+def needs_html_processing(
+    parsed_text: str, allow_mentions: bool, allow_links: bool, allow_images: bool
+) -> bool:
+    """Returns True if HTML has links, images or mentions that need processing,
+    or entities that rewriter would change."""
+    if HTML_ENTITY_RE.search(parsed_text):
+        return True
+
+    if (allow_links or allow_images) and (
+        "<a " in parsed_text or "<img " in parsed_text
+    ):
+        return True
+
+    for text in HTML_TAG_RE.split(parsed_text)[::2]:
+        if allow_mentions and "@" in text:
+            return True
+        if allow_links and URL_RE.search(text):
+            return True
+
+    return False
+
+
+def escape_html_texts_quotes(parsed_text: str) -> str:
+    if '"' not in parsed_text and "'" not in parsed_text:
+        return parsed_text
+
+    parts = HTML_TAG_RE.split(parsed_text)
+    for i in range(0, len(parts), 2):
+        parts[i] = parts[i].replace('"', "&quot;").replace("'", "&#x27;")
+    return "".join(parts)
 
 
 def md_factory(allow_links=True, allow_images=True, allow_blocks=True):
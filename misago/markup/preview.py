@@ -0,0 +1,143 @@
+import re
+from hashlib import sha256
+
+from .finalize import finalize_markup
+from .flavours import common as common_flavour
+
+PREVIEW_SESSION_KEY = "misago_markup_preview"
+
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+BBCODE_BLOCK_RE = re.compile(r"\[(/?)(code|quote|spoiler)(=[^\]]*)?\]", re.IGNORECASE)
+LIST_ITEM_RE = re.compile(r"^ {0,3}([*+-]|\d+\.)\s")
+# Reference links resolve definitions from anywhere in the markup
+LINK_REFERENCE_RE = re.compile(r"^ {0,3}\[[^\]]+\]:", re.MULTILINE)
+
+
+class PreviewBlocksExpired(Exception):
+    pass
+
+
+def split_markup_blocks(markup: str) -> list[str]:
+    """Splits markup into top-level blocks that can be parsed separately.
+
+    Blocks include blank lines that follow them, so their concatenation is
+    equal to markup. Fenced code and code, quote and spoiler bbcodes are never
+    split, and blocks markdown would continue, like lists, block quotes and
+    indented blocks, are kept together with blocks preceding them.
+
+    Markup with link reference definitions is never split.
+    """
+    if LINK_REFERENCE_RE.search(markup):
+        return [markup] if markup else []
+
+    blocks: list[str] = []
+    block_lines: list[str] = []
+    fence: str | None = None
+    bbcode_depth = 0
+    in_code_bbcode = False
+    block_ended = False
+
+    for line in markup.splitlines(keepends=True):
+        is_blank = not line.strip()
+
+        if block_ended and not is_blank:
+            if is_block_continuation(block_lines[0], line):
+                block_ended = False
+            else:
+                blocks.append("".join(block_lines))
+                block_lines = []
+                block_ended = False
+
+        block_lines.append(line)
+
+        if fence:
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+
+        fence_match = FENCE_RE.match(line)
+        if fence_match and not bbcode_depth:
+            fence = fence_match.group(1)
+            continue
+
+        for bbcode_match in BBCODE_BLOCK_RE.finditer(line):
+            is_closing = bool(bbcode_match.group(1))
+            bbcode = bbcode_match.group(2).lower()
+            if in_code_bbcode:
+                if is_closing and bbcode == "code":
+                    in_code_bbcode = False
+                    bbcode_depth -= 1
+            elif is_closing:
+                bbcode_depth = max(bbcode_depth - 1, 0)
+            else:
+                bbcode_depth += 1
+                in_code_bbcode = bbcode == "code"
+
+        if is_blank and not bbcode_depth and block_lines[0].strip():
+            block_ended = True
+
+    if block_lines:
+        blocks.append("".join(block_lines))
+
+    return blocks
+
+
+def is_block_continuation(block_first_line: str, line: str) -> bool:
+    if line[0] in (" ", "\t") and not LIST_ITEM_RE.match(line):
+        return True
+    if line.lstrip().startswith(">") and block_first_line.lstrip().startswith(">"):
+        return True
+    return bool(LIST_ITEM_RE.match(line) and LIST_ITEM_RE.match(block_first_line))
+
+
+def get_block_hash(block: str) -> str:
+    return sha256(block.encode()).hexdigest()[:32]
+
+
+def get_preview_blocks_markup(request, blocks: list[dict]) -> str:
+    """Returns markup of blocks sent by client, either as markup or hash of
+    block from previous preview."""
+    session_blocks = request.session.get(PREVIEW_SESSION_KEY) or {}
+
+    markup: list[str] = []
+    for block in blocks:
+        if "hash" in block:
+            if block["hash"] not in session_blocks:
+                raise PreviewBlocksExpired()
+            markup.append(session_blocks[block["hash"]]["markup"])
+        else:
+            markup.append(block["markup"])
+
+    return "".join(markup)
+
+
+def render_preview_blocks(request, markup: str) -> list[dict]:
+    """Renders markup's blocks to finalized HTML, reusing HTML of unchanged
+    blocks from previous preview stored in session.
+
+    Returns list of dicts with hash, markup and HTML of every block.
+    """
+    session_blocks = request.session.get(PREVIEW_SESSION_KEY) or {}
+
+    blocks: list[dict] = []
+    for block in split_markup_blocks(markup):
+        block_hash = get_block_hash(block)
+        if block_hash in session_blocks:
+            parsed = session_blocks[block_hash]["parsed"]
+        elif block.strip():
+            parsing_result = common_flavour(
+                request, request.user, block.strip(), force_shva=True
+            )
+            parsed = finalize_markup(parsing_result["parsed_text"])
+        else:
+            parsed = ""
+
+        blocks.append({"hash": block_hash, "markup": block, "parsed": parsed})
+
+    # Keep only blocks of latest preview, client diffs against them
+    request.session[PREVIEW_SESSION_KEY] = {
+        block["hash"]: {"markup": block["markup"], "parsed": block["parsed"]}
+        for block in blocks
+    }
+
+    return blocks
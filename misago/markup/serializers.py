@@ -10,3 +10,21 @@ class MarkupSerializer(serializers.Serializer):
         settings = self.context["settings"]
         validate_post_length(settings, data.get("post", ""))
         return data
+
+
+class MarkupBlockSerializer(serializers.Serializer):
+    hash = serializers.CharField(required=False, max_length=64)
+    markup = serializers.CharField(
+        required=False, allow_blank=True, trim_whitespace=False
+    )
+
+    def validate(self, data):
+        if ("hash" in data) == ("markup" in data):
+            raise serializers.ValidationError(
+                "Block should have either a hash or a markup."
+            )
+        return data
+
+
+class MarkupBlocksSerializer(serializers.Serializer):
+    blocks = MarkupBlockSerializer(many=True)
@@ -0,0 +1,67 @@
+import pytest
+
+from ..parser import needs_html_processing, parse
+
+MARKUPS = [
+    "Hello world!",
+    "Hello\nworld!",
+    "**Bold** and *italic* with \"quotes\" and 'apostrophes'",
+    "Text with <html> & ampersand",
+    "Text with &copy; entity and &nbsp; space",
+    '> Quote with "quotes"\n\n[quote="Author"]Quoted \'text\'[/quote]',
+    '[spoiler="Summary"]Hidden[/spoiler]\n\n---\n\n[hr]',
+    '```python\nprint("Hello")\n```\n\n[code="python"]x = \'y\'[/code]',
+    "1. First\n2. Second\n\n- Item\n- Other item",
+    "# Heading\n\nSetext\n------",
+    "Link to http://example.com/page and www.example.org",
+    "[Link](http://example.com) and ![Image](http://example.com/img.png)",
+    "[url=http://example.com]Link[/url] and [img]http://example.com/i.png[/img]",
+    "Mail me at test@example.com",
+    "Hello @Someone!",
+    '`inline "code"` and ~~strike~~ and [b]bold[/b]',
+]
+
+
+@pytest.mark.parametrize("markup", MARKUPS)
+def test_parsing_without_html_processing_produces_same_html(
+    mocker, request_mock, user, markup
+):
+    result = parse(markup, request_mock, user)
+
+    mocker.patch("misago.markup.parser.needs_html_processing", return_value=True)
+    processed_result = parse(markup, request_mock, user)
+
+    assert result["parsed_text"] == processed_result["parsed_text"]
+    assert result["internal_links"] == processed_result["internal_links"]
+    assert result["outgoing_links"] == processed_result["outgoing_links"]
+    assert result["images"] == processed_result["images"]
+
+
+def test_html_processing_is_not_needed_for_plain_html():
+    assert not needs_html_processing(
+        "<p>Hello <strong>world</strong>!</p>", True, True, True
+    )
+
+
+def test_html_processing_is_needed_for_links():
+    assert needs_html_processing(
+        '<p><a href="http://example.com">Link</a></p>', False, True, False
+    )
+
+
+def test_html_processing_is_needed_for_images():
+    assert needs_html_processing(
+        '<p><img alt="Image" src="http://example.com/i.png" /></p>', False, False, True
+    )
+
+
+def test_html_processing_is_needed_for_texts_with_urls():
+    assert needs_html_processing("<p>See example.com</p>", False, True, False)
+
+
+def test_html_processing_is_needed_for_mentions():
+    assert needs_html_processing("<p>Hello @Someone!</p>", True, False, False)
+
+
+def test_html_processing_is_needed_for_entities():
+    assert needs_html_processing("<p>&copy;</p>", False, True, False)
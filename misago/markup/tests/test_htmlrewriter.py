@@ -0,0 +1,183 @@
+import random
+
+import pytest
+
+from ..htmlparser import parse_html_string, print_html_string
+from ..htmlrewriter import rewrite_html
+from ..links import clean_links, linkify_texts
+from ..mentions import add_mentions
+from ..parser import md_factory
+
+MARKUPS = [
+    "Hello world!",
+    "Hello\nworld!",
+    "**Bold** and *italic* with \"quotes\" and 'apostrophes'",
+    "Text with <html> & ampersand, &copy; entity and &nbsp; space",
+    "Visit http://example.com, https://www.example.org/page?q=1 and test.com!",
+    "Mail me at test@example.com",
+    "Internal link http://example.com/t/thread/1/ and www.example.com/u/",
+    "[Link](http://example.com) and [Other](https://other.com/path/)",
+    "[http://example.com](http://example.com) and [](http://example.com)",
+    "[Link **with** style](http://example.com)",
+    "[url=http://example.com]Link[/url] and [url]other.com[/url]",
+    "![Image](http://example.com/img.png) and ![](https://other.com/i.jpg)",
+    "[img]http://example.com/img.png[/img]",
+    "[![Image](http://other.com/i.png)](http://other.com)",
+    "Attachment [link](/a/file-1/1/) and ![image](/a/thumb/image-2/2/?shva=1)",
+    "Hello @{username}!",
+    "Hello @{username}, @{username} and @{other_username}!",
+    "Hello @Nobody and @{username}!",
+    "Hello @Nobody!",
+    "Mention in link [@{username}](http://example.com)",
+    "`@{username} http://example.com` and [code]@{username}[/code]",
+    "```\n@{username} http://example.com\n```",
+    "> Quote with @{username} and http://example.com",
+    '[quote="{username}"]Quoted http://example.com[/quote]',
+    "[spoiler]Hidden http://example.com @{username}[/spoiler]",
+    "1. First http://example.com\n2. Second @{username}",
+    "# Heading http://example.com\n\nSetext @{username}\n------",
+    "Lorem ipsum [code]http://test.com[/code]",
+    "Text\n\n---\n\n[hr]\n\nhttp://example.com",
+]
+
+
+@pytest.fixture
+def render_markup(user, other_user):
+    def render(markup: str) -> str:
+        markup = markup.replace("{username}", user.username)
+        markup = markup.replace("{other_username}", other_user.username)
+        return md_factory().convert(markup).strip()
+
+    return render
+
+
+def rewrite_with_html5lib(request, parsed_text, linkify, mentions, clean, shva):
+    result = create_result(parsed_text)
+    root_node = parse_html_string(parsed_text)
+    if linkify:
+        linkify_texts(root_node)
+    if mentions:
+        add_mentions(result, root_node)
+    if clean:
+        clean_links(request, result, root_node, shva)
+    result["parsed_text"] = print_html_string(root_node)
+    return result
+
+
+def rewrite_with_rewriter(request, parsed_text, linkify, mentions, clean, shva):
+    result = create_result(parsed_text)
+    rewrite_html(
+        request,
+        result,
+        linkify=linkify,
+        mentions=mentions,
+        clean_links=clean,
+        force_shva=shva,
+    )
+    return result
+
+
+def create_result(parsed_text: str) -> dict:
+    return {
+        "parsed_text": parsed_text,
+        "mentions": [],
+        "images": [],
+        "internal_links": [],
+        "outgoing_links": [],
+    }
+
+
+def assert_rewriters_parity(request, parsed_text, *flags):
+    result = rewrite_with_rewriter(request, parsed_text, *flags)
+    html5lib_result = rewrite_with_html5lib(request, parsed_text, *flags)
+
+    assert result["parsed_text"] == html5lib_result["parsed_text"]
+    assert sorted(result["mentions"]) == sorted(html5lib_result["mentions"])
+    assert result["images"] == html5lib_result["images"]
+    assert result["internal_links"] == html5lib_result["internal_links"]
+    assert result["outgoing_links"] == html5lib_result["outgoing_links"]
+
+
+@pytest.mark.parametrize("markup", MARKUPS)
+def test_rewriter_produces_same_result_as_html5lib(request_mock, render_markup, markup):
+    assert_rewriters_parity(
+        request_mock, render_markup(markup), True, True, True, False
+    )
+
+
+@pytest.mark.parametrize("markup", MARKUPS)
+def test_rewriter_produces_same_result_as_html5lib_with_shva(
+    request_mock, render_markup, markup
+):
+    assert_rewriters_parity(request_mock, render_markup(markup), True, True, True, True)
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        (False, True, False, False),
+        (False, False, True, False),
+        (True, False, True, False),
+        (False, True, True, False),
+    ],
+)
+@pytest.mark.parametrize("markup", MARKUPS)
+def test_rewriter_produces_same_result_as_html5lib_with_disabled_features(
+    request_mock, render_markup, markup, flags
+):
+    assert_rewriters_parity(request_mock, render_markup(markup), *flags)
+
+
+HTMLS = [
+    "<p>Hello <pre><code>code</code></pre> world</p>",
+    "<p>Lorem</p></p>",
+    "<p>Hello <div>world</div></p>",
+    "<p>Hello<hr />world</p>",
+    "<pre>\nhttp://example.com</pre>",
+    '<p><a href="http://example.com"></a></p>',
+    "<p><a>http://example.com</a></p>",
+    '<p><a href="/">Home <strong>page</strong> http://example.com</a></p>',
+    '<p><img src="http://example.com/img.png" alt="http://example.com" /></p>',
+    "<p>Unclosed <strong>tags",
+    "<p title=\"&quot;quoted&quot; &amp; 'single'\">Attributes</p>",
+    '<p data-empty="" hidden>Empty attributes</p>',
+    "<p>Stray closing</span> tag</p>",
+    "<p>Hello<br>world<br/>again</p>",
+]
+
+
+@pytest.mark.parametrize("html", HTMLS)
+def test_rewriter_handles_html_like_html5lib(request_mock, html):
+    assert_rewriters_parity(request_mock, html, True, True, True, False)
+
+
+FRAGMENTS = [
+    "Hello",
+    " world",
+    "\n",
+    "http://example.com/page",
+    "example.com",
+    "@{username}",
+    "@Nobody",
+    "**bold**",
+    "`code http://example.com`",
+    "[link](http://other.com)",
+    "![img](http://example.com/i.png)",
+    "\n\n> quote ",
+    "\n\n- item ",
+    "\n\n[quote]",
+    "[/quote]\n\n",
+    "\n\n[code]x[/code]\n\n",
+    ' & "quote" ',
+]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_rewriter_produces_same_result_as_html5lib_for_random_markup(
+    request_mock, render_markup, seed
+):
+    rng = random.Random(seed)
+    markup = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 30)))
+    assert_rewriters_parity(
+        request_mock, render_markup(markup), True, True, True, False
+    )
@@ -0,0 +1,81 @@
+from django.test import override_settings
+
+from ... import hooks
+from ..cache import get_markup_cache_key, markup_cache
+from ..parser import md_factory, parse
+
+
+@override_settings(MISAGO_MARKUP_CACHE_SIZE=10)
+def test_parse_reuses_result_of_identical_text(mocker, request_mock, user):
+    markup_cache.clear()
+    md_factory_spy = mocker.patch("misago.markup.parser.md_factory", wraps=md_factory)
+
+    result = parse("Hello **world**!", request_mock, user)
+    cached_result = parse("Hello **world**!", request_mock, user)
+
+    assert md_factory_spy.call_count == 1
+    assert cached_result["parsed_text"] == result["parsed_text"]
+    assert cached_result["original_text"] == "Hello **world**!"
+
+
+@override_settings(MISAGO_MARKUP_CACHE_SIZE=10)
+def test_parse_doesnt_cache_result_with_mentions(mocker, request_mock, user):
+    markup_cache.clear()
+    md_factory_spy = mocker.patch("misago.markup.parser.md_factory", wraps=md_factory)
+
+    parse(f"Hello @{user.username}!", request_mock, user)
+    result = parse(f"Hello @{user.username}!", request_mock, user)
+
+    assert md_factory_spy.call_count == 2
+    assert result["mentions"] == [user.id]
+
+
+@override_settings(MISAGO_MARKUP_CACHE_SIZE=10)
+def test_parse_doesnt_cache_result_if_markup_extensions_are_set(
+    mocker, request_mock, user
+):
+    markup_cache.clear()
+    md_factory_spy = mocker.patch("misago.markup.parser.md_factory", wraps=md_factory)
+
+    def processor(result, html_tree):
+        pass
+
+    hooks.parsing_result_processors.append(processor)
+    try:
+        parse("Hello world!", request_mock, user)
+        parse("Hello world!", request_mock, user)
+    finally:
+        hooks.parsing_result_processors.remove(processor)
+
+    assert md_factory_spy.call_count == 2
+
+
+@override_settings(MISAGO_MARKUP_CACHE_SIZE=10)
+def test_parse_updates_markup_cache_stats(request_mock, user):
+    markup_cache.clear()
+    markup_cache.reset_stats()
+
+    parse("Hello world!", request_mock, user)
+    parse("Hello world!", request_mock, user)
+
+    stats = markup_cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] == 1
+
+
+def test_markup_cache_key_depends_on_text():
+    assert get_markup_cache_key("Hello", "example.com", True) != (
+        get_markup_cache_key("World", "example.com", True)
+    )
+
+
+def test_markup_cache_key_depends_on_host():
+    assert get_markup_cache_key("Hello", "example.com", True) != (
+        get_markup_cache_key("Hello", "example.org", True)
+    )
+
+
+def test_markup_cache_key_depends_on_flags():
+    assert get_markup_cache_key("Hello", "example.com", True, False) != (
+        get_markup_cache_key("Hello", "example.com", False, True)
+    )
@@ -67,3 +67,63 @@ def test_api_returns_parsed_value(user_client):
     response = user_client.post(api_link, json={"post": "Hello world!"})
     assert response.status_code == 200
     assert response.json() == {"parsed": "<p>Hello world!</p>"}
+
+
+def test_api_returns_parsed_blocks(user_client):
+    response = user_client.post(
+        api_link, json={"blocks": [{"markup": "Hello world!\n\nHow are you?"}]}
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert [block["length"] for block in data["blocks"]] == [14, 12]
+    assert [block["parsed"] for block in data["blocks"]] == [
+        "<p>Hello world!</p>",
+        "<p>How are you?</p>",
+    ]
+
+
+def test_api_reuses_blocks_sent_by_hash(mocker, user_client):
+    response = user_client.post(
+        api_link, json={"blocks": [{"markup": "Hello world!\n\nHow are you?"}]}
+    )
+    first_block = response.json()["blocks"][0]
+
+    flavour_spy = mocker.patch("misago.markup.preview.common_flavour")
+    flavour_spy.return_value = {"parsed_text": "<p>I am fine.</p>"}
+
+    response = user_client.post(
+        api_link,
+        json={
+            "blocks": [{"hash": first_block["hash"]}, {"markup": "I am fine."}],
+        },
+    )
+    assert response.status_code == 200
+    assert flavour_spy.call_count == 1
+
+    blocks = response.json()["blocks"]
+    assert blocks[0] == {"hash": first_block["hash"], "length": 14}
+    assert blocks[1]["parsed"] == "<p>I am fine.</p>"
+
+
+def test_api_rejects_blocks_with_unknown_hash(user_client):
+    response = user_client.post(api_link, json={"blocks": [{"hash": "unknown"}]})
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "Preview has expired. Send the whole message.",
+        "code": "preview_expired",
+    }
+
+
+def test_api_rejects_invalid_block(user_client):
+    response = user_client.post(api_link, json={"blocks": [{}]})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Block should have either a hash or a markup."}
+
+
+def test_api_validates_length_of_blocks_markup(user_client):
+    response = user_client.post(api_link, json={"blocks": [{"markup": "a"}]})
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "Posted message should be at least 5 characters long (it has 1)."
+    }
@@ -0,0 +1,88 @@
+import pytest
+
+from ..finalize import finalize_markup
+from ..flavours import common as common_flavour
+from ..preview import render_preview_blocks, split_markup_blocks
+
+MARKUPS = [
+    "Hello world!",
+    "Hello **world**!\n\nHow are you?\n\n\nFine, thanks.",
+    "# Header\n\nLorem ipsum\ndolor met.\n\n---\n\nSit amet.",
+    "- First\n- Second\n\n- Third\n\nParagraph",
+    "1. First\n\n2. Second\n\n    Indented continuation\n\nEnd",
+    "> Quote\n\n> Same quote\n\nAfter quote",
+    "```python\nalert(1)\n\n\nalert(2)\n```\n\nAfter code",
+    "[quote]\nLorem\n\nIpsum\n[/quote]\n\nAfter quote",
+    "[quote]\n[spoiler]\nLorem\n\n[/spoiler]\n\nIpsum\n[/quote]\n\nDone",
+    "[code]\n[quote]\n\nNot a quote\n[/code]\n\nAfter code",
+    "Visit http://example.com\n\nOr [link](http://google.com)",
+    "See [the docs][1]\n\nSomething else\n\n[1]: http://example.com",
+    "\n\nLeading blank lines\n\n",
+]
+
+
+@pytest.mark.parametrize("markup", MARKUPS)
+def test_split_markup_blocks_preserves_markup(markup):
+    assert "".join(split_markup_blocks(markup)) == markup
+
+
+def test_split_markup_blocks_splits_at_blank_lines():
+    assert split_markup_blocks("Lorem\nipsum\n\nDolor\n\n\nMet") == [
+        "Lorem\nipsum\n\n",
+        "Dolor\n\n\n",
+        "Met",
+    ]
+
+
+def test_split_markup_blocks_doesnt_split_fenced_code():
+    assert split_markup_blocks("```\na\n\nb\n```\n\nc") == ["```\na\n\nb\n```\n\n", "c"]
+
+
+def test_split_markup_blocks_doesnt_split_bbcode_blocks():
+    assert split_markup_blocks("[quote]\na\n\nb\n[/quote]\n\nc") == [
+        "[quote]\na\n\nb\n[/quote]\n\n",
+        "c",
+    ]
+
+
+def test_split_markup_blocks_keeps_lists_together():
+    assert split_markup_blocks("- a\n\n- b\n\nc") == ["- a\n\n- b\n\n", "c"]
+
+
+def join_blocks(blocks: list[dict]) -> str:
+    return "\n".join(block["parsed"] for block in blocks if block["parsed"])
+
+
+@pytest.fixture
+def preview_request(request_mock):
+    request_mock.session = {}
+    return request_mock
+
+
+@pytest.mark.parametrize("markup", MARKUPS)
+def test_preview_blocks_html_is_same_as_whole_markup_html(preview_request, markup):
+    blocks = render_preview_blocks(preview_request, markup)
+    result = common_flavour(
+        preview_request, preview_request.user, markup.strip(), force_shva=True
+    )
+    assert join_blocks(blocks) == finalize_markup(result["parsed_text"])
+
+
+def test_preview_blocks_reuse_html_of_unchanged_blocks(mocker, preview_request):
+    flavour_spy = mocker.patch(
+        "misago.markup.preview.common_flavour", wraps=common_flavour
+    )
+
+    render_preview_blocks(preview_request, "Lorem ipsum\n\nDolor met")
+    assert flavour_spy.call_count == 2
+
+    blocks = render_preview_blocks(preview_request, "Lorem ipsum\n\nDolor met sit")
+    assert flavour_spy.call_count == 3
+    assert join_blocks(blocks) == "<p>Lorem ipsum</p>\n<p>Dolor met sit</p>"
+
+
+def test_preview_blocks_session_keeps_only_latest_preview_blocks(preview_request):
+    render_preview_blocks(preview_request, "Lorem ipsum\n\nDolor met")
+    blocks = render_preview_blocks(preview_request, "Sit amet")
+
+    assert list(preview_request.session["misago_markup_preview"]) == [blocks[0]["hash"]]
@@ -6,7 +6,7 @@ from django.contrib.auth import get_user_model
 
 from ..cache.versions import get_cache_versions
 from ..conf.dynamicsettings import DynamicSettings
-from ..users.bans import get_user_ban
+from ..users.bans import get_users_bans
 from ..threads.models import Post, Thread
 from .models import WatchedThread
 from .threads import (
@@ -36,22 +36,32 @@ def notify_on_new_thread_reply(reply_id: int):
     cache_versions = get_cache_versions()
     dynamic_settings = DynamicSettings(cache_versions)
 
-    queryset = WatchedThread.objects.filter(thread=post.thread).select_related("user")
+    queryset = WatchedThread.objects.filter(thread=post.thread).select_related(
+        "user", "user__ban_cache"
+    )
+
+    for watched_threads in iterate_in_chunks(queryset):
+        users_bans = get_users_bans(
+            [watched_thread.user for watched_thread in watched_threads],
+            cache_versions,
+        )
 
-    for watched_thread in queryset.iterator(chunk_size=NOTIFY_CHUNK_SIZE):
-        if (
-            watched_thread.user == post.poster
-            or not watched_thread.user.is_active
-            or get_user_ban(watched_thread.user, cache_versions)
-        ):
-            continue  # Skip poster and banned or inactive watchers
+        for watched_thread in watched_threads:
+            if (
+                watched_thread.user == post.poster
+                or not watched_thread.user.is_active
+                or watched_thread.user_id in users_bans
+            ):
+                continue  # Skip poster and banned or inactive watchers
 
-        try:
-            notify_watcher_on_new_thread_reply(
-                watched_thread, post, cache_versions, dynamic_settings
-            )
-        except Exception:
-            logger.exception("Unexpected error in 'notify_watcher_on_new_thread_reply'")
+            try:
+                notify_watcher_on_new_thread_reply(
+                    watched_thread, post, cache_versions, dynamic_settings
+                )
+            except Exception:
+                logger.exception(
+                    "Unexpected error in 'notify_watcher_on_new_thread_reply'"
+                )
 
 
 @shared_task(
@@ -74,20 +84,35 @@ def notify_on_new_private_thread(
     cache_versions = get_cache_versions()
     dynamic_settings = DynamicSettings(cache_versions)
 
-    queryset = User.objects.filter(id__in=participants)
+    queryset = User.objects.filter(id__in=participants).select_related("ban_cache")
+
+    for participants_chunk in iterate_in_chunks(queryset):
+        users_bans = get_users_bans(participants_chunk, cache_versions)
+
+        for participant in participants_chunk:
+            if not participant.is_active or participant.id in users_bans:
+                continue  # Skip inactive or banned participants
+
+            try:
+                notify_participant_on_new_private_thread(
+                    participant, actor, thread, cache_versions, dynamic_settings
+                )
+            except Exception:
+                logger.exception(
+                    "Unexpected error in 'notify_participant_on_new_private_thread'"
+                )
+
 
-    for participant in queryset.iterator(chunk_size=NOTIFY_CHUNK_SIZE):
-        if not participant.is_active or get_user_ban(participant, cache_versions):
-            continue  # Skip inactive or banned participants
+def iterate_in_chunks(queryset):
+    chunk = []
+    for item in queryset.iterator(chunk_size=NOTIFY_CHUNK_SIZE):
+        chunk.append(item)
+        if len(chunk) == NOTIFY_CHUNK_SIZE:
+            yield chunk
+            chunk = []
 
-        try:
-            notify_participant_on_new_private_thread(
-                participant, actor, thread, cache_versions, dynamic_settings
-            )
-        except Exception:
-            logger.exception(
-                "Unexpected error in 'notify_participant_on_new_private_thread'"
-            )
+    if chunk:
+        yield chunk
 
 
 @shared_task(serializer="json")
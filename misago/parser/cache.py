@@ -0,0 +1,41 @@
+from hashlib import sha256
+
+from ..cache.versionedcache import VersionedCache
+from ..conf import settings
+from .parser import Parser
+
+AST_CACHE = "parser_ast"
+
+
+class ASTCache(VersionedCache):
+    """Cache for parsed markups, keyed by markup hash and parser fingerprint.
+
+    Parsing same markup with same patterns always produces same AST, so keys
+    are never invalidated and values are evicted from local LRU by its size.
+    """
+
+    copy_local_values = True
+
+    def get_local_size(self) -> int:
+        return settings.MISAGO_PARSER_AST_CACHE_SIZE
+
+    def is_shared(self) -> bool:
+        return settings.MISAGO_PARSER_AST_CACHE_SHARED
+
+
+ast_cache = ASTCache(AST_CACHE)
+
+
+def parse_cached(parser: Parser, markup: str) -> list[dict]:
+    """Parses markup with parser, reusing AST of identical markup parsed before."""
+    cache_key = get_ast_cache_key(parser, markup)
+    ast = ast_cache.get(cache_key)
+    if ast is None:
+        ast = parser(markup)
+        ast_cache.set(cache_key, ast)
+    return ast
+
+
+def get_ast_cache_key(parser: Parser, markup: str) -> str:
+    markup_hash = sha256(markup.encode()).hexdigest()
+    return f"misago_{AST_CACHE}_{parser.fingerprint[:16]}_{markup_hash}"
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
@@ -22,6 +22,8 @@ class ParserContext:
     cache_versions: dict
     settings: DynamicSettings
     plugin_data: dict
+    # Users and posts loaded for ASTs metadata, reused by all parses in context
+    identity_map: dict = field(default_factory=dict, compare=False, repr=False)
 
 
 def create_parser_context(
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from threading import Lock
 from typing import Callable
 
 from django.contrib.auth import get_user_model
@@ -11,6 +13,11 @@ from .postprocessors import post_processors
 
 User = get_user_model()
 
+PARSERS_POOL_SIZE = 32
+
+_parsers_pool: OrderedDict[tuple, Parser] = OrderedDict()
+_parsers_pool_lock = Lock()
+
 
 def create_parser(context: ParserContext) -> Parser:
     return create_parser_hook(
@@ -29,4 +36,40 @@ def _create_parser_action(
     inline_patterns: list[Pattern],
     post_processors: list[Callable[[Parser, list[dict]], list[dict]]],
 ) -> Parser:
-    return Parser(block_patterns, inline_patterns, post_processors)
+    return get_pooled_parser(block_patterns, inline_patterns, post_processors)
+
+
+def get_pooled_parser(
+    block_patterns: list[Pattern],
+    inline_patterns: list[Pattern],
+    post_processors: list[Callable[[Parser, list[dict]], list[dict]]],
+) -> Parser:
+    """Returns compiled parser shared by all calls with same patterns instances."""
+    key = (
+        tuple(map(id, block_patterns)),
+        tuple(map(id, inline_patterns)),
+        tuple(map(id, post_processors)),
+    )
+
+    with _parsers_pool_lock:
+        parser = _parsers_pool.get(key)
+        if parser:
+            _parsers_pool.move_to_end(key)
+            return parser
+
+    # Pooled parser keeps references to its patterns, so their ids in the key
+    # can't be reused by other objects
+    parser = Parser(block_patterns, inline_patterns, post_processors)
+    parser.compile()
+
+    with _parsers_pool_lock:
+        _parsers_pool[key] = parser
+        while len(_parsers_pool) > PARSERS_POOL_SIZE:
+            _parsers_pool.popitem(last=False)
+
+    return parser
+
+
+def clear_parsers_pool():
+    with _parsers_pool_lock:
+        _parsers_pool.clear()
@@ -1,5 +1,6 @@
 from .complete_markup_html import complete_markup_html_hook
 from .create_parser import create_parser_hook
+from .get_ast_metadata_posts_queryset import get_ast_metadata_posts_queryset_hook
 from .get_ast_metadata_users_queryset import get_ast_metadata_users_queryset_hook
 from .render_ast_node_to_html import render_ast_node_to_html_hook
 from .render_ast_node_to_plaintext import render_ast_node_to_plaintext_hook
@@ -11,6 +12,7 @@ from .update_ast_metadata_users import update_ast_metadata_users_hook
 __all__ = [
     "complete_markup_html_hook",
     "create_parser_hook",
+    "get_ast_metadata_posts_queryset_hook",
     "get_ast_metadata_users_queryset_hook",
     "render_ast_node_to_html_hook",
     "render_ast_node_to_plaintext_hook",
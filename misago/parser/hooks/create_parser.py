@@ -39,6 +39,12 @@ class CreateParserHookAction(Protocol):
         return ast
     ```
 
+    Post-processors wrapping blocks between opening and closing blocks in a
+    single block can extend `misago.parser.postprocessors.BlockPostProcessor`
+    and implement its `wrap_block` method. `children` passed to `wrap_block` are
+    already processed, including blocks wrapped in them, so `wrap_block` should
+    use them as they are instead of passing them to the post-processor again.
+
     # Return value
 
     An instance of the `Parser` class.
@@ -92,6 +98,12 @@ class CreateParserHookFilter(Protocol):
         return ast
     ```
 
+    Post-processors wrapping blocks between opening and closing blocks in a
+    single block can extend `misago.parser.postprocessors.BlockPostProcessor`
+    and implement its `wrap_block` method. `children` passed to `wrap_block` are
+    already processed, including blocks wrapped in them, so `wrap_block` should
+    use them as they are instead of passing them to the post-processor again.
+
     # Return value
 
     An instance of the `Parser` class.
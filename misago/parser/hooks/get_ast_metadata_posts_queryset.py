@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING, Iterable, Protocol
+
+from ...plugins.hooks import FilterHook
+
+if TYPE_CHECKING:
+    from ...threads.models import Post
+    from ..context import ParserContext
+
+
+class GetAstMetadataPostsQuerysetHookAction(Protocol):
+    """
+    A standard Misago function used to create a `Post` queryset or the next filter
+    function from another plugin.
+
+    # Arguments
+
+    ## `context: ParserContext`
+
+    An instance of the `ParserContext` data class that contains dependencies
+    used during parsing.
+
+    ## `posts_ids: list[int]`
+
+    A list of ids of quoted `Post` instances to retrieve from the database.
+
+    # Return value
+
+    A queryset with `Post` instances to use in updating the metadata.
+    """
+
+    def __call__(
+        self,
+        *,
+        context: "ParserContext",
+        posts_ids: list[int],
+    ) -> Iterable["Post"]: ...
+
+
+class GetAstMetadataPostsQuerysetHookFilter(Protocol):
+    """
+    A function implemented by a plugin that can be registered in this hook.
+
+    # Arguments
+
+    ## `action: GetAstMetadataPostsQuerysetHookAction`
+
+    A standard Misago function used to create a `Post` queryset or the next filter
+    function from another plugin.
+
+    See the [action](#action) section for details.
+
+    ## `context: ParserContext`
+
+    An instance of the `ParserContext` data class that contains dependencies
+    used during parsing.
+
+    ## `posts_ids: list[int]`
+
+    A list of ids of quoted `Post` instances to retrieve from the database.
+
+    # Return value
+
+    A queryset with `Post` instances to use in updating the metadata.
+    """
+
+    def __call__(
+        self,
+        action: GetAstMetadataPostsQuerysetHookAction,
+        context: "ParserContext",
+        posts_ids: list[int],
+    ) -> Iterable["Post"]: ...
+
+
+class GetAstMetadataPostsQuerysetHook(
+    FilterHook[
+        GetAstMetadataPostsQuerysetHookAction, GetAstMetadataPostsQuerysetHookFilter
+    ]
+):
+    """
+    This hook wraps the standard function that Misago uses to retrieve posts
+    quoted in the Abstract Syntax Tree representation of parsed markup.
+
+    Ids of posts come from the markup. The standard function retrieves only
+    approved posts from categories the user can browse, and defers their
+    content fields.
+
+    # Example
+
+    The code below implements a custom filter function that updates the queryset
+    to exclude hidden posts.
+
+    ```python
+    from misago.parser.context import ParserContext
+
+    @get_ast_metadata_posts_queryset_hook.append_filter
+    def get_ast_metadata_posts_queryset_exclude_hidden(
+        action: GetAstMetadataPostsQuerysetHookAction,
+        context: ParserContext,
+        posts_ids: list[int],
+    ):
+        return action(context, posts_ids).filter(is_hidden=False)
+    ```
+    """
+
+    __slots__ = FilterHook.__slots__
+
+    def __call__(
+        self,
+        action: GetAstMetadataPostsQuerysetHookAction,
+        context: "ParserContext",
+        posts_ids: list[int],
+    ):
+        return super().__call__(action, context, posts_ids)
+
+
+get_ast_metadata_posts_queryset_hook = GetAstMetadataPostsQuerysetHook()
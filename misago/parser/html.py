@@ -12,12 +12,27 @@ SPOILER_SUMMARY = "<spoiler-summary-message>"
 
 
 def render_ast_to_html(context: ParserContext, ast: list[dict], metadata: dict) -> str:
-    html = ""
-    for ast_node in ast:
-        node_html = render_ast_node_to_html(context, ast_node, metadata)
-        if node_html:
-            html += node_html
-    return html
+    html: list[str] = []
+    write_ast_html(context, ast, metadata, html)
+    return "".join(html)
+
+
+def write_ast_html(
+    context: ParserContext, ast: list[dict], metadata: dict, html: list[str]
+):
+    """Appends HTML representation of AST nodes to the `html` list of strings.
+
+    Nodes are written to the list directly, unless plugins filter their HTML,
+    in which case every node is rendered to a string that filters can wrap.
+    """
+    if render_ast_node_to_html_hook:
+        for ast_node in ast:
+            node_html = render_ast_node_to_html(context, ast_node, metadata)
+            if node_html:
+                html.append(node_html)
+    else:
+        for ast_node in ast:
+            write_ast_node_html(context, ast_node, metadata, html)
 
 
 def render_ast_node_to_html(
@@ -31,139 +46,153 @@ def render_ast_node_to_html(
 def _render_ast_node_to_html_action(
     context: ParserContext, ast_node: dict, metadata: dict
 ) -> str:
+    html: list[str] = []
+    write_ast_node_html(context, ast_node, metadata, html)
+    return "".join(html)
+
+
+def write_ast_node_html(
+    context: ParserContext, ast_node: dict, metadata: dict, html: list[str]
+):
     ast_type = ast_node["type"]
 
     if ast_type in ("heading", "heading-setex"):
         html_tag = f"h{ast_node['level']}"
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<{html_tag}>{children}</{html_tag}>"
+        html.append(f"<{html_tag}>")
+        write_ast_html(context, ast_node["children"], metadata, html)
+        html.append(f"</{html_tag}>")
 
-    if ast_type == "list":
+    elif ast_type == "list":
         html_tag = "ol" if ast_node["ordered"] else "ul"
-        children = render_ast_to_html(context, ast_node["items"], metadata)
-        return f"<{html_tag}>{children}</{html_tag}>"
+        html.append(f"<{html_tag}>")
+        write_ast_html(context, ast_node["items"], metadata, html)
+        html.append(f"</{html_tag}>")
 
-    if ast_type == "list-item":
-        text = render_ast_to_html(context, ast_node["children"], metadata)
-        children = render_ast_to_html(context, ast_node["lists"], metadata)
-        return f"<li>{text}{children}</li>"
+    elif ast_type == "list-item":
+        html.append("<li>")
+        write_ast_html(context, ast_node["children"], metadata, html)
+        write_ast_html(context, ast_node["lists"], metadata, html)
+        html.append("</li>")
 
-    if ast_type in ("code", "code-bbcode"):
+    elif ast_type in ("code", "code-bbcode"):
         if ast_node["syntax"]:
             html_class = f" class=\"language-{ast_node['syntax']}\""
         else:
             html_class = ""
-        return f"<pre{html_class}><code>{escape(ast_node['code'])}</code></pre>"
-
-    if ast_type == "code-indented":
-        return f"<pre><code>{escape(ast_node['code'])}</code></pre>"
+        html.append(f"<pre{html_class}><code>{escape(ast_node['code'])}</code></pre>")
 
-    if ast_type == "code-inline":
-        return f"<code>{escape(ast_node['code'])}</code>"
+    elif ast_type == "code-indented":
+        html.append(f"<pre><code>{escape(ast_node['code'])}</code></pre>")
 
-    if ast_type == "quote":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<blockquote>{children}</blockquote>"
+    elif ast_type == "code-inline":
+        html.append(f"<code>{escape(ast_node['code'])}</code>")
 
-    if ast_type == "quote-bbcode":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
+    elif ast_type == "quote":
+        _write_wrapped_children(context, ast_node, metadata, html, "blockquote")
 
+    elif ast_type == "quote-bbcode":
         if not ast_node["author"]:
-            return f"<blockquote>{children}</blockquote>"
-
-        heading = escape(ast_node["author"])
-
-        return (
-            '<aside class="quote-block">'
-            f'<div class="quote-heading" data-noquote="1">{heading}</div>'
-            f'<blockquote class="quote-body">{children}</blockquote>'
-            "</aside>"
-        )
-
-    if ast_type == "spoiler-bbcode":
+            _write_wrapped_children(context, ast_node, metadata, html, "blockquote")
+        else:
+            heading = escape(ast_node["author"])
+            html.append(
+                '<aside class="quote-block">'
+                f'<div class="quote-heading" data-noquote="1">{heading}</div>'
+                '<blockquote class="quote-body">'
+            )
+            write_ast_html(context, ast_node["children"], metadata, html)
+            html.append("</blockquote></aside>")
+
+    elif ast_type == "spoiler-bbcode":
         if ast_node["summary"]:
             summary = escape(ast_node["summary"])
         else:
             summary = SPOILER_SUMMARY
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<details><summary>{summary}</summary>{children}</details>"
-
-    if ast_type == "paragraph":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<p>{children}</p>"
-
-    if ast_type in ("emphasis", "emphasis-underscore"):
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<em>{children}</em>"
+        html.append(f"<details><summary>{summary}</summary>")
+        write_ast_html(context, ast_node["children"], metadata, html)
+        html.append("</details>")
 
-    if ast_type in ("strong", "strong-underscore"):
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<strong>{children}</strong>"
+    elif ast_type in WRAPPING_HTML_TAGS:
+        html_tag = WRAPPING_HTML_TAGS[ast_type]
+        _write_wrapped_children(context, ast_node, metadata, html, html_tag)
 
-    if ast_type in ("strikethrough", "strikethrough-bbcode"):
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<del>{children}</del>"
+    elif ast_type in ("thematic-break", "thematic-break-bbcode"):
+        html.append("<hr />")
 
-    if ast_type == "bold-bbcode":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<b>{children}</b>"
-
-    if ast_type == "italics-bbcode":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<i>{children}</i>"
-
-    if ast_type == "underline-bbcode":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<u>{children}</u>"
-
-    if ast_type == "superscript-bbcode":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<sup>{children}</sup>"
-
-    if ast_type == "subscript-bbcode":
-        children = render_ast_to_html(context, ast_node["children"], metadata)
-        return f"<sub>{children}</sub>"
-
-    if ast_type in ("thematic-break", "thematic-break-bbcode"):
-        return "<hr />"
-
-    if ast_type in ("image", "image-bbcode"):
+    elif ast_type in ("image", "image-bbcode"):
         src = escape(clean_href(ast_node["src"]))
         alt = escape(ast_node["alt"]) if ast_node["alt"] else ""
-        return f'<img src="{src}" alt="{alt}" />'
+        html.append(f'<img src="{src}" alt="{alt}" />')
 
-    if ast_type in ("url", "url-bbcode"):
-        children = render_ast_to_html(context, ast_node["children"], metadata)
+    elif ast_type in ("url", "url-bbcode"):
         href = escape(clean_href(ast_node["href"]))
         rel = "external nofollow noopener"
-        return f'<a href="{href}" rel="{rel}" target="_blank">{children or href}</a>'
+        html.append(f'<a href="{href}" rel="{rel}" target="_blank">')
+
+        children_start = len(html)
+        write_ast_html(context, ast_node["children"], metadata, html)
+        if not any(html[children_start:]):
+            html.append(href)
 
-    if ast_type in ("auto-link", "auto-url"):
+        html.append("</a>")
+
+    elif ast_type in ("auto-link", "auto-url"):
         href = escape(clean_href(ast_node["href"]))
         rel = "external nofollow noopener"
         if ast_node.get("image"):
-            return f'<img src="{href}" alt="" />'
+            html.append(f'<img src="{href}" alt="" />')
         else:
-            return f'<a href="{href}" rel="{rel}" target="_blank">{href}</a>'
+            html.append(f'<a href="{href}" rel="{rel}" target="_blank">{href}</a>')
 
-    if ast_type == "mention":
+    elif ast_type == "mention":
         username = slugify(ast_node["username"])
         if username not in metadata["users"]:
-            return escape("@" + ast_node["username"])
-
-        user = metadata["users"][username]
-        return f'<a href="{user.get_absolute_url()}">@{escape(user.username)}</a>'
-
-    if ast_type == "escape":
-        return escape(ast_node["character"])
-
-    if ast_type == "line-break":
-        return "<br />"
-
-    if ast_type == "text":
-        return escape(ast_node["text"])
-
-    raise AstError(f"Unknown AST node type: {ast_type}")
+            html.append(escape("@" + ast_node["username"]))
+        else:
+            user = metadata["users"][username]
+            html.append(
+                f'<a href="{user.get_absolute_url()}">@{escape(user.username)}</a>'
+            )
+
+    elif ast_type == "escape":
+        html.append(escape(ast_node["character"]))
+
+    elif ast_type == "line-break":
+        html.append("<br />")
+
+    elif ast_type == "text":
+        html.append(escape(ast_node["text"]))
+
+    else:
+        raise AstError(f"Unknown AST node type: {ast_type}")
+
+
+WRAPPING_HTML_TAGS = {
+    "paragraph": "p",
+    "emphasis": "em",
+    "emphasis-underscore": "em",
+    "strong": "strong",
+    "strong-underscore": "strong",
+    "strikethrough": "del",
+    "strikethrough-bbcode": "del",
+    "bold-bbcode": "b",
+    "italics-bbcode": "i",
+    "underline-bbcode": "u",
+    "superscript-bbcode": "sup",
+    "subscript-bbcode": "sub",
+}
+
+
+def _write_wrapped_children(
+    context: ParserContext,
+    ast_node: dict,
+    metadata: dict,
+    html: list[str],
+    html_tag: str,
+):
+    html.append(f"<{html_tag}>")
+    write_ast_html(context, ast_node["children"], metadata, html)
+    html.append(f"</{html_tag}>")
 
 
 def complete_markup_html(html: str, **kwargs) -> str:
@@ -0,0 +1,80 @@
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+
+from ....cache.versions import get_cache_versions
+from ....conf.shortcuts import get_dynamic_settings
+from ....permissions.proxy import UserPermissionsProxy
+from ...context import create_parser_context
+from ...factory import create_parser
+from ...hooks import render_ast_node_to_html_hook
+from ...html import render_ast_to_html
+from ...metadata import create_ast_metadata
+from .benchmarkparser import SAMPLE_MARKUP
+
+POST_SIZES = (10_000, 100_000)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures renders per second of 10k and 100k characters long posts, with "
+        "HTML written to single list and with every node rendered to a string, "
+        "like when plugins filter nodes HTML."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--time",
+            help="time (in seconds) spent rendering each post size",
+            type=float,
+            default=2.0,
+        )
+
+    def handle(self, *args, **options):
+        cache_versions = get_cache_versions()
+        context = create_parser_context(
+            user_permissions=UserPermissionsProxy(AnonymousUser(), cache_versions),
+            cache_versions=cache_versions,
+            settings=get_dynamic_settings(),
+        )
+        parser = create_parser(context)
+
+        for post_size in POST_SIZES:
+            sample = SAMPLE_MARKUP.strip()
+            markup = "\n\n".join([sample] * (post_size // len(sample) + 1))
+            ast = parser(markup)
+            metadata = create_ast_metadata(context, ast)
+
+            for name, use_filter in (("Streaming", False), ("Per-node", True)):
+                if use_filter:
+                    render_ast_node_to_html_hook.append_filter(pass_through_filter)
+
+                try:
+                    renders_per_second = run_benchmark(
+                        context, ast, metadata, options["time"]
+                    )
+                finally:
+                    if use_filter:
+                        render_ast_node_to_html_hook._filters_last.remove(
+                            pass_through_filter
+                        )
+                        render_ast_node_to_html_hook.invalidate_cache()
+
+                self.stdout.write(
+                    "%s, %s chars post: %.1f renders/s"
+                    % (name, len(markup), renders_per_second)
+                )
+
+
+def pass_through_filter(action, context, ast_node, metadata):
+    return action(context, ast_node, metadata)
+
+
+def run_benchmark(context, ast: list[dict], metadata: dict, duration: float) -> float:
+    renders = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        render_ast_to_html(context, ast, metadata)
+        renders += 1
+    return renders / (time.perf_counter() - start_time)
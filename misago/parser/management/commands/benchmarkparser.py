@@ -0,0 +1,99 @@
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+
+from ....cache.versions import get_cache_versions
+from ....conf.shortcuts import get_dynamic_settings
+from ....permissions.proxy import UserPermissionsProxy
+from ...context import create_parser_context
+from ...factory import create_parser
+from ...parser import Parser
+
+SAMPLE_MARKUP = """
+Hello **world**, this is *sample* post with [link](https://example.com), `inline code`
+and mention of @Admin.
+
+> Quoted text with ~~strikethrough~~ and https://example.com/autolink
+
+- First item
+- Second item with `code`
+
+```python
+print("Hello world!")
+```
+
+[quote="Admin"]Quoted with bbcode and [b]bold[/b] text[/quote]
+"""
+
+CODE_HEAVY_MARKUP = """
+Call `parse()` with `markup` and `parents`, then pass `ast` to `render()`.
+Use `Parser.compile()` before sharing `parser` between `threads`.
+
+[quote]Quoted `value` and `other_value` in `quote`[/quote]
+
+- Item with `code`
+- Item with `more_code` and `even_more_code`
+"""
+
+POST_SIZES = (
+    ("short", SAMPLE_MARKUP, 1),
+    ("medium", SAMPLE_MARKUP, 10),
+    ("long", SAMPLE_MARKUP, 100),
+    ("code-heavy medium", CODE_HEAVY_MARKUP, 10),
+    ("code-heavy long", CODE_HEAVY_MARKUP, 100),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures parses per second of posts of typical sizes, with new parser "
+        "created for every parse and with shared, precompiled parser."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--time",
+            help="time (in seconds) spent parsing each post size",
+            type=float,
+            default=2.0,
+        )
+
+    def handle(self, *args, **options):
+        cache_versions = get_cache_versions()
+        context = create_parser_context(
+            user_permissions=UserPermissionsProxy(AnonymousUser(), cache_versions),
+            cache_versions=cache_versions,
+            settings=get_dynamic_settings(),
+        )
+
+        pooled_parser = create_parser(context)
+
+        def new_parser(markup: str) -> list[dict]:
+            parser = Parser(
+                pooled_parser.block_patterns,
+                pooled_parser.inline_patterns,
+                pooled_parser.post_processors,
+            )
+            return parser(markup)
+
+        for size_name, sample, repeats in POST_SIZES:
+            markup = "\n\n".join([sample.strip()] * repeats)
+            for name, parse in (
+                ("New parser", new_parser),
+                ("Shared parser", pooled_parser),
+            ):
+                parses_per_second = run_benchmark(parse, markup, options["time"])
+                self.stdout.write(
+                    "%s, %s post (%s chars): %.1f parses/s"
+                    % (name, size_name, len(markup), parses_per_second)
+                )
+
+
+def run_benchmark(parse, markup: str, duration: float) -> float:
+    parses = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        parse(markup)
+        parses += 1
+    return parses / (time.perf_counter() - start_time)
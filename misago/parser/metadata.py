@@ -1,25 +1,82 @@
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 
 from ..core.utils import slugify
+from ..permissions.enums import CategoryPermission
 from .context import ParserContext
 from .hooks import (
+    get_ast_metadata_posts_queryset_hook,
     get_ast_metadata_users_queryset_hook,
     update_ast_metadata_hook,
     update_ast_metadata_from_node_hook,
     update_ast_metadata_users_hook,
 )
 
+if TYPE_CHECKING:
+    from ..threads.models import Post
+
 User = get_user_model()
 
+# Fields of quoted posts loaded for metadata, posts contents are not loaded
+METADATA_POSTS_FIELDS = (
+    "id",
+    "category_id",
+    "thread_id",
+    "poster_id",
+    "poster_name",
+    "posted_on",
+)
+
 
 def create_ast_metadata(
     context: ParserContext,
     ast: list[dict],
 ) -> dict:
-    metadata = {
+    metadata = _create_empty_metadata()
+    return update_ast_metadata_hook(_update_ast_metadata_action, context, ast, metadata)
+
+
+def create_asts_metadata(
+    context: ParserContext,
+    asts: list[list[dict]],
+) -> list[dict]:
+    """Creates metadata for many ASTs, like a page of posts.
+
+    Every AST is walked once and users and posts from all ASTs are loaded to
+    context's identity map in one query each. Metadata of every AST is then
+    completed with them by `update_ast_metadata_hook`, which receives metadata
+    already populated with data from AST's nodes.
+    """
+    metadatas: list[dict] = []
+    usernames: set[str] = set()
+    posts_ids: set[int] = set()
+
+    for ast in asts:
+        metadata = _create_empty_metadata()
+        for ast_node in ast:
+            update_ast_metadata_from_node(context, ast_node, metadata)
+        metadatas.append(metadata)
+
+        if len(metadata["usernames"]) <= settings.MISAGO_PARSER_MAX_USERS:
+            usernames.update(metadata["usernames"])
+        posts_ids.update(metadata["posts"]["ids"])
+
+    load_metadata_users(context, usernames)
+    load_metadata_posts(context, posts_ids)
+
+    return [
+        update_ast_metadata_hook(
+            _update_collected_ast_metadata_action, context, ast, metadata
+        )
+        for ast, metadata in zip(asts, metadatas)
+    ]
+
+
+def _create_empty_metadata() -> dict:
+    return {
         "outbound-links": set(),
         "usernames": set(),
         "users": {},
@@ -29,8 +86,6 @@ def create_ast_metadata(
         },
     }
 
-    return update_ast_metadata_hook(_update_ast_metadata_action, context, ast, metadata)
-
 
 def _update_ast_metadata_action(
     context: ParserContext,
@@ -40,7 +95,16 @@ def _update_ast_metadata_action(
     for ast_node in ast:
         update_ast_metadata_from_node(context, ast_node, metadata)
 
+    return _update_collected_ast_metadata_action(context, ast, metadata)
+
+
+def _update_collected_ast_metadata_action(
+    context: ParserContext,
+    ast: list[dict],
+    metadata: dict,
+) -> dict:
     update_ast_metadata_users(context, metadata)
+    update_ast_metadata_posts(context, metadata)
 
     return metadata
 
@@ -98,12 +162,26 @@ def _update_ast_metadata_users_action(context: ParserContext, metadata: dict) ->
     if len(usernames) > settings.MISAGO_PARSER_MAX_USERS:
         return
 
-    if usernames:
-        queryset = get_ast_metadata_users_queryset(context, usernames)
-        for user in queryset:
+    users = load_metadata_users(context, usernames)
+    for username in usernames:
+        if user := users.get(username):
             metadata["users"][user.slug] = user
 
 
+def load_metadata_users(
+    context: ParserContext, usernames: Iterable[str]
+) -> dict[str, User | None]:
+    """Loads users missing from context's identity map, returns the map."""
+    users = context.identity_map.setdefault("users", {})
+    missing_usernames = sorted(set(usernames).difference(users))
+    if missing_usernames:
+        for username in missing_usernames:
+            users[username] = None
+        for user in get_ast_metadata_users_queryset(context, missing_usernames):
+            users[user.slug] = user
+    return users
+
+
 def get_ast_metadata_users_queryset(
     context: ParserContext, usernames: list[str]
 ) -> Iterable[User]:
@@ -116,3 +194,50 @@ def _get_ast_metadata_users_queryset_action(
     context: ParserContext, usernames: list[str]
 ) -> Iterable[User]:
     return User.objects.filter(slug__in=usernames)
+
+
+def update_ast_metadata_posts(context: ParserContext, metadata: dict) -> None:
+    if not metadata["posts"]["ids"]:
+        return
+
+    posts = load_metadata_posts(context, metadata["posts"]["ids"])
+    for post_id in metadata["posts"]["ids"]:
+        if post := posts.get(post_id):
+            metadata["posts"]["objs"][post_id] = post
+
+
+def load_metadata_posts(
+    context: ParserContext, posts_ids: Iterable[int]
+) -> dict[int, "Post | None"]:
+    """Loads posts missing from context's identity map, returns the map."""
+    posts = context.identity_map.setdefault("posts", {})
+    missing_ids = sorted(set(posts_ids).difference(posts))
+    if missing_ids:
+        for post_id in missing_ids:
+            posts[post_id] = None
+        for post in get_ast_metadata_posts_queryset(context, missing_ids):
+            posts[post.id] = post
+    return posts
+
+
+def get_ast_metadata_posts_queryset(
+    context: ParserContext, posts_ids: list[int]
+) -> Iterable["Post"]:
+    return get_ast_metadata_posts_queryset_hook(
+        _get_ast_metadata_posts_queryset_action, context, posts_ids
+    )
+
+
+def _get_ast_metadata_posts_queryset_action(
+    context: ParserContext, posts_ids: list[int]
+) -> Iterable["Post"]:
+    browseable_categories = context.user_permissions.categories[
+        CategoryPermission.BROWSE
+    ]
+
+    Post = apps.get_model("misago_threads", "Post")
+    return Post.objects.filter(
+        id__in=posts_ids,
+        category_id__in=browseable_categories,
+        is_unapproved=False,
+    ).only(*METADATA_POSTS_FIELDS)
@@ -1,8 +1,37 @@
 import re
+from copy import copy
 from functools import cached_property
+from hashlib import sha256
 from typing import Callable
 
-from django.utils.crypto import get_random_string
+# Reserved patterns are replaced in markup with their index in reservations
+# list, wrapped in characters from Unicode's private use area. Those characters
+# are also reserved when they appear in markup so they can be restored later.
+RESERVATION_START = "\ue000"
+RESERVATION_END = "\ue001"
+RESERVATION_CHARS_PATTERN = f"[{RESERVATION_START}{RESERVATION_END}]"
+RESERVATION_CHARS_RE = re.compile(RESERVATION_CHARS_PATTERN)
+RESERVATION_RE = re.compile(f"{RESERVATION_START}(\\d+){RESERVATION_END}")
+
+
+def reserve_pattern(reservations: list[str], value: str) -> str:
+    """Adds value to reservations and returns a placeholder to use in its place."""
+    reservations.append(value)
+    return f"{RESERVATION_START}{len(reservations) - 1}{RESERVATION_END}"
+
+
+def reverse_reserved_patterns(reservations: list[str], value: str) -> str:
+    """Replaces reservations placeholders in value with values in one pass."""
+    if not reservations or RESERVATION_START not in value:
+        return value
+
+    def replace_reservation(match):
+        index = int(match.group(1))
+        if index < len(reservations):
+            return reservations[index]
+        return match.group(0)
+
+    return RESERVATION_RE.sub(replace_reservation, value)
 
 
 class Pattern:
@@ -23,13 +52,29 @@ class LineBreak(Pattern):
         return {"type": self.pattern_type}
 
 
+class ParserState:
+    """Mutable state of single markup parse."""
+
+    reserved_patterns: list[str]
+
+    def __init__(self):
+        self.reserved_patterns = []
+
+
 class Parser:
+    """Markup parser.
+
+    Parser instance is reusable and can be shared between threads. Every call
+    parses markup with a copy of the parser with its own `ParserState`, that
+    shares compiled patterns with the original.
+    """
+
     block_patterns: list[Pattern]
     inline_patterns: list[Pattern]
     post_processors: list[Callable[["Parser", list[dict]], list[dict]]]
 
     reserve_inline_code = re.compile(r"`*`(.|\n)+?``*")
-    _reserved_patterns: dict[str, str]
+    state: ParserState
 
     def __init__(
         self,
@@ -43,40 +88,52 @@ class Parser:
         self.inline_patterns = inline_patterns or []
         self.post_processors = post_processors or []
 
-        self._reserved_patterns = {}
+        self.state = ParserState()
 
     def __call__(self, markup: str) -> list[dict]:
+        self.compile()  # Compile patterns on this instance, not on its copy
+
+        parser = copy(self)
+        parser.state = ParserState()
+        return parser.parse(markup)
+
+    def parse(self, markup: str) -> list[dict]:
         markup = self.reserve_patterns(markup)
         ast = self.parse_blocks(markup, [])
         for post_processor in self.post_processors:
             ast = post_processor(self, ast)
         return ast
 
+    def compile(self):
+        """Compiles parser's patterns before it's shared between threads."""
+        self._block_re
+        self._inline_re
+        self._paragraph_re
+        self._reserve_re
+
     def reserve_patterns(self, markup: str) -> str:
-        if not "`" in markup:
+        if (
+            "`" not in markup
+            and RESERVATION_START not in markup
+            and RESERVATION_END not in markup
+        ):
             return markup
 
         def replace_pattern(match):
             match_str = match.group(0)
             if match_str.startswith("``") or match_str.endswith("``"):
-                return match_str
+                # Match is not reserved, but reservation characters in it are
+                return RESERVATION_CHARS_RE.sub(
+                    lambda m: reserve_pattern(self.state.reserved_patterns, m.group(0)),
+                    match_str,
+                )
 
-            pattern_id = f"%%{get_random_string(12)}%%"
-            while pattern_id in markup or pattern_id in self._reserved_patterns:
-                pattern_id = f"%%{get_random_string(12)}%%"
+            return reserve_pattern(self.state.reserved_patterns, match_str)
 
-            self._reserved_patterns[pattern_id] = match_str
-            return pattern_id
-
-        return self.reserve_inline_code.sub(replace_pattern, markup)
+        return self._reserve_re.sub(replace_pattern, markup)
 
     def reverse_reservations(self, value: str) -> str:
-        if not self._reserved_patterns or "%%" not in value:
-            return value
-
-        for pattern, org in self._reserved_patterns.items():
-            value = value.replace(pattern, org)
-        return value
+        return reverse_reserved_patterns(self.state.reserved_patterns, value)
 
     def parse_blocks(self, markup: str, parents: list[str]) -> list[dict]:
         cursor = 0
@@ -182,6 +239,16 @@ class Parser:
 
         return result
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """Hash of parser's patterns and post-processors configuration."""
+        parts = []
+        for pattern in self.block_patterns + self.inline_patterns:
+            parts.append(f"{_get_qualname(pattern)}:{pattern.pattern}")
+        for post_processor in self.post_processors:
+            parts.append(_get_qualname(post_processor))
+        return sha256("\n".join(parts).encode()).hexdigest()
+
     @cached_property
     def _final_block_patterns(self) -> dict[str, Pattern]:
         patterns: list[Pattern] = self.block_patterns.copy()
@@ -195,6 +262,12 @@ class Parser:
     def _paragraph_re(self) -> re.Pattern:
         return re.compile(r".+(\n.+)*")
 
+    @cached_property
+    def _reserve_re(self) -> re.Pattern:
+        return re.compile(
+            f"{self.reserve_inline_code.pattern}|{RESERVATION_CHARS_PATTERN}"
+        )
+
     @cached_property
     def _final_inline_patterns(self) -> dict[str, Pattern]:
         patterns: list[Pattern] = self.inline_patterns.copy()
@@ -212,3 +285,9 @@ class Parser:
             ),
             re.IGNORECASE,
         )
+
+
+def _get_qualname(obj) -> str:
+    if not hasattr(obj, "__qualname__"):
+        obj = type(obj)
+    return f"{obj.__module__}.{obj.__qualname__}"
@@ -1,10 +1,14 @@
 import re
 from functools import cached_property
 
-from django.utils.crypto import get_random_string
-
 from ..parents import has_invalid_parent
-from ..parser import Parser, Pattern
+from ..parser import (
+    RESERVATION_CHARS_PATTERN,
+    Parser,
+    Pattern,
+    reserve_pattern,
+    reverse_reserved_patterns,
+)
 
 MAIL_RE = re.compile(r"^\w+[.-_+\w]*@[-\w]+(.\w+)+$")
 URL_RE = re.compile(
@@ -125,7 +129,7 @@ class UrlMarkdown(Pattern):
         self,
         parser: Parser,
         clean_match: str,
-        reserved_patterns: dict[str, str],
+        reserved_patterns: list[str],
         parents: list[dict],
     ) -> list[dict]:
         ast: list[dict] = []
@@ -173,18 +177,16 @@ class UrlMarkdown(Pattern):
 
         return ast
 
-    def prepare_match_str(self, match: str) -> tuple[str, dict[str, str]]:
+    def prepare_match_str(self, match: str) -> tuple[str, list[str]]:
         clean_match: str = ""
-        reserved_patterns = {}
+        reserved_patterns: list[str] = []
 
         cursor = 0
         for m in self._exclude_patterns_re.finditer(match):
             if m.start() > cursor:
                 clean_match += match[cursor : m.start()]
 
-            pattern_id = f"%%{get_random_string(8)}%%"
-            clean_match += pattern_id
-            reserved_patterns[pattern_id] = m.group(0)
+            clean_match += reserve_pattern(reserved_patterns, m.group(0))
             cursor = m.end()
 
         if cursor < len(match):
@@ -192,10 +194,8 @@ class UrlMarkdown(Pattern):
 
         return clean_match, reserved_patterns
 
-    def reverse_text_patterns(self, text: str, reserved_patterns: dict) -> str:
-        for token, value in reserved_patterns.items():
-            text = text.replace(token, value)
-        return text
+    def reverse_text_patterns(self, text: str, reserved_patterns: list[str]) -> str:
+        return reverse_reserved_patterns(reserved_patterns, text)
 
     def extract_url_from_source(self, source: str) -> tuple[str, int]:
         opening = source.count("(")
@@ -234,7 +234,8 @@ class UrlMarkdown(Pattern):
 
     @cached_property
     def _exclude_patterns_re(self) -> re.Pattern:
-        return re.compile("|".join(f"({p})" for p in self.exclude_patterns))
+        patterns = self.exclude_patterns + [RESERVATION_CHARS_PATTERN]
+        return re.compile("|".join(f"({p})" for p in patterns))
 
 
 IMAGE_CONTENTS = re.compile(r"!(\[(?P<alt>(.|\n)*?)\])?\((?P<src>.*?)\)")
@@ -2,35 +2,52 @@ from ..parser import Parser
 
 
 class BlockPostProcessor:
+    """Wraps blocks between opening and closing blocks in a single block.
+
+    AST is processed in a single pass with a stack of opened blocks, so every
+    block is visited once no matter how deep blocks are nested or how many of
+    them are left unclosed. Opening blocks nested deeper than `max_depth` are
+    left in AST unwrapped, together with their closing blocks.
+    """
+
     opening_type: str
     closing_type: str
+    max_depth: int = 32
 
     def __call__(self, parser: Parser, ast: list[dict]) -> list[dict]:
         new_ast: list[dict] = []
 
         stack: list[tuple[dict, list[dict]]] = []
+        # Number of opening blocks past max depth left in AST unwrapped
+        overflow = 0
+
         for block_ast in ast:
+            parent = stack[-1][1] if stack else new_ast
+
             if block_ast["type"] == self.opening_type:
-                stack.append((block_ast, []))
-            elif stack:
-                if block_ast["type"] == self.closing_type:
-                    opening_block, children = stack.pop(-1)
-                    wrapped_block = self.wrap_block(
-                        parser, opening_block, block_ast, children
-                    )
-                    if wrapped_block:
-                        if stack:
-                            stack[-1][1].append(wrapped_block)
-                        else:
-                            new_ast.append(wrapped_block)
+                if len(stack) < self.max_depth:
+                    stack.append((block_ast, []))
                 else:
-                    stack[-1][1].append(self.process_other_block(parser, block_ast))
+                    overflow += 1
+                    parent.append(block_ast)
+            elif block_ast["type"] == self.closing_type and overflow:
+                overflow -= 1
+                parent.append(block_ast)
+            elif block_ast["type"] == self.closing_type and stack:
+                opening_block, children = stack.pop()
+                wrapped_block = self.wrap_block(
+                    parser, opening_block, block_ast, children
+                )
+                if wrapped_block:
+                    parent = stack[-1][1] if stack else new_ast
+                    parent.append(wrapped_block)
             else:
-                new_ast.append(self.process_other_block(parser, block_ast))
+                parent.append(self.process_other_block(parser, block_ast))
 
+        # Children of unclosed blocks are already processed
         for opening_block, children in stack:
             new_ast.append(opening_block)
-            new_ast += self(parser, children)
+            new_ast.extend(children)
 
         return new_ast
 
@@ -41,13 +58,14 @@ class BlockPostProcessor:
         closing_block: dict,
         children: list[dict],
     ) -> dict | None:
-        if not children:
-            return None
+        """Returns block wrapping children or `None` to remove them from AST.
 
-        new_children: list[dict]
-        for block_ast in children:
-            new_children.append(self.process_other_block(parser, block_ast))
-        return new_children
+        `children` are already processed by the post processor, including blocks
+        nested in them, and should be used in returned block as they are.
+        Passing them to the post processor again (`self(parser, children)`)
+        still gives the same result but visits all nested blocks again.
+        """
+        raise NotImplementedError()
 
     def process_other_block(self, parser: Parser, block_ast: dict) -> dict:
         if block_ast["type"] != "paragraph" and block_ast.get("children"):
@@ -20,5 +20,5 @@ class QuoteBBCodePostProcessor(BlockPostProcessor):
             "type": "quote-bbcode",
             "author": opening_block["author"],
             "post": opening_block["post"],
-            "children": self(parser, children),
+            "children": children,
         }
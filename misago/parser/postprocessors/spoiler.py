@@ -19,5 +19,5 @@ class SpoilerBBCodePostProcessor(BlockPostProcessor):
         return {
             "type": "spoiler-bbcode",
             "summary": opening_block["summary"],
-            "children": self(parser, children),
+            "children": children,
         }
@@ -1,2 +1,10 @@
-def render_search_document(ast: list, metadata: dict) -> str:
-    raise NotImplementedError()
+from .context import ParserContext
+from .plaintext import PlainTextFormat, render_ast_to_plaintext
+
+
+def render_search_document(
+    context: ParserContext, ast: list[dict], metadata: dict
+) -> str:
+    return render_ast_to_plaintext(
+        context, ast, metadata, PlainTextFormat.SEARCH_DOCUMENT
+    )
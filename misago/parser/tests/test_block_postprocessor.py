@@ -1,3 +1,4 @@
+from copy import deepcopy
 from unittest.mock import Mock
 
 import pytest
@@ -20,7 +21,7 @@ class PostProcessor(BlockPostProcessor):
         if not children:
             return None
 
-        return {"type": "mock", "children": self(parser, children)}
+        return {"type": "mock", "children": children}
 
 
 @pytest.fixture
@@ -325,3 +326,125 @@ def test_block_post_processor_handles_extra_opening_block(parser, post_processor
             ],
         },
     ]
+
+
+def test_block_post_processor_leaves_blocks_past_max_depth_unwrapped(parser):
+    post_processor = PostProcessor()
+    post_processor.max_depth = 1
+
+    result = post_processor(
+        parser,
+        [
+            {"type": "mock-open"},
+            {"type": "mock-open"},
+            {
+                "type": "paragraph",
+                "children": [{"type": "text", "text": "Hello world!"}],
+            },
+            {"type": "mock-close"},
+            {"type": "mock-close"},
+        ],
+    )
+    assert result == [
+        {
+            "type": "mock",
+            "children": [
+                {"type": "mock-open"},
+                {
+                    "type": "paragraph",
+                    "children": [{"type": "text", "text": "Hello world!"}],
+                },
+                {"type": "mock-close"},
+            ],
+        },
+    ]
+
+
+class ChildrenTypesPostProcessor(PostProcessor):
+    def wrap_block(
+        self,
+        parser: Parser,
+        opening_block: dict,
+        closing_block: dict,
+        children: list[dict],
+    ) -> dict | None:
+        return {
+            "type": "mock",
+            "children_types": [child["type"] for child in children],
+            "children": children,
+        }
+
+
+def test_block_post_processor_subclass_wrap_block_receives_processed_children(
+    parser,
+):
+    result = ChildrenTypesPostProcessor()(
+        parser,
+        [
+            {"type": "mock-open"},
+            {"type": "mock-open"},
+            {
+                "type": "paragraph",
+                "children": [{"type": "text", "text": "Hello world!"}],
+            },
+            {"type": "mock-close"},
+            {"type": "mock-close"},
+        ],
+    )
+    assert result == [
+        {
+            "type": "mock",
+            "children_types": ["mock"],
+            "children": [
+                {
+                    "type": "mock",
+                    "children_types": ["paragraph"],
+                    "children": [
+                        {
+                            "type": "paragraph",
+                            "children": [{"type": "text", "text": "Hello world!"}],
+                        },
+                    ],
+                }
+            ],
+        },
+    ]
+
+
+class ReprocessingPostProcessor(PostProcessor):
+    def wrap_block(
+        self,
+        parser: Parser,
+        opening_block: dict,
+        closing_block: dict,
+        children: list[dict],
+    ) -> dict | None:
+        return super().wrap_block(
+            parser, opening_block, closing_block, self(parser, children)
+        )
+
+
+def test_block_post_processor_subclass_reprocessing_children_gives_same_result(
+    parser, post_processor
+):
+    ast = [
+        {"type": "mock-open"},
+        {"type": "mock-open"},
+        {
+            "type": "other-block",
+            "children": [
+                {"type": "mock-open"},
+                {
+                    "type": "paragraph",
+                    "children": [{"type": "text", "text": "Hello world!"}],
+                },
+                {"type": "mock-close"},
+            ],
+        },
+        {"type": "mock-close"},
+        {"type": "mock-close"},
+        {"type": "mock-open"},
+    ]
+
+    result = ReprocessingPostProcessor()(parser, deepcopy(ast))
+    assert result == post_processor(parser, deepcopy(ast))
@@ -0,0 +1,84 @@
+import random
+import time
+
+import pytest
+
+from .test_block_postprocessor import PostProcessor
+
+# Generous budget for slow CI machines, quadratic implementation takes seconds
+TIME_BUDGET = 0.5
+
+ADVERSARIAL_MARKUPS = {
+    "unclosed quotes": "[quote]\n\nLorem ipsum\n\n" * 1000,
+    "unopened quotes": "Lorem ipsum\n\n[/quote]\n\n" * 1000,
+    "nested quotes": "[quote]" * 1000 + "Lorem ipsum" + "[/quote]" * 1000,
+    "nested spoilers": "[spoiler]" * 1000 + "Lorem ipsum" + "[/spoiler]" * 1000,
+    "interleaved blocks": "[quote][spoiler]Lorem ipsum[/quote][/spoiler]\n" * 500,
+    "unclosed nested blocks": "[quote]\n\n[spoiler]\n\nLorem ipsum\n\n" * 500,
+}
+
+
+@pytest.mark.parametrize("markup", ADVERSARIAL_MARKUPS.values())
+def test_adversarial_markup_is_parsed_within_time_budget(parser, markup):
+    start_time = time.perf_counter()
+    parser(markup)
+    assert time.perf_counter() - start_time < TIME_BUDGET
+
+
+def create_random_ast(rng: random.Random, size: int) -> list[dict]:
+    ast = []
+    for i in range(size):
+        choice = rng.random()
+        if choice < 0.35:
+            ast.append({"type": "mock-open"})
+        elif choice < 0.7:
+            ast.append({"type": "mock-close"})
+        else:
+            ast.append(
+                {
+                    "type": "paragraph",
+                    "children": [{"type": "text", "text": str(i)}],
+                }
+            )
+    return ast
+
+
+def get_paragraphs(ast: list[dict]) -> list[str]:
+    paragraphs = []
+    for node in ast:
+        if node["type"] == "paragraph":
+            paragraphs.append(node["children"][0]["text"])
+        elif node["type"] == "mock":
+            paragraphs += get_paragraphs(node["children"])
+    return paragraphs
+
+
+def get_depth(ast: list[dict]) -> int:
+    return max(
+        [get_depth(node["children"]) + 1 for node in ast if node["type"] == "mock"],
+        default=0,
+    )
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_ast_is_wrapped_without_losing_paragraphs(parser, seed):
+    rng = random.Random(seed)
+    ast = create_random_ast(rng, rng.randint(1, 200))
+    paragraphs = get_paragraphs(ast)
+
+    post_processor = PostProcessor()
+    post_processor.max_depth = 5
+    result = post_processor(parser, ast)
+
+    assert get_paragraphs(result) == paragraphs
+    assert get_depth(result) <= post_processor.max_depth
+
+
+@pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+def test_random_ast_is_wrapped_within_time_budget(parser, size):
+    ast = create_random_ast(random.Random(size), size)
+    post_processor = PostProcessor()
+
+    start_time = time.perf_counter()
+    post_processor(parser, ast)
+    assert time.perf_counter() - start_time < TIME_BUDGET
@@ -1,5 +1,6 @@
 import pytest
 
+from ..hooks import render_ast_node_to_html_hook
 from ..html import complete_markup_html, render_ast_to_html
 from ..metadata import create_ast_metadata
 
@@ -411,3 +412,60 @@ def test_complete_markup_html_replaces_default_spoiler_summary(
     metadata = create_ast_metadata(parser_context, ast)
     html = render_ast_to_html(parser_context, ast, metadata)
     assert snapshot == complete_markup_html(html)
+
+
+RENDERER_MARKUP = """
+# Hello *world*!
+
+> Quote with [link](https://example.com) and [url=https://example.com][/url]
+
+[quote="Author"]Quoted **text**[/quote]
+
+[spoiler]Hidden ~~text~~[/spoiler]
+
+1. Item with `code`
+2. Item with https://example.com/image.png
+
+```python
+print("Hello!")
+```
+"""
+
+
+def test_render_ast_to_html_with_plugin_filter_produces_same_html(
+    parser_context, parse_markup
+):
+    ast = parse_markup(RENDERER_MARKUP)
+    metadata = create_ast_metadata(parser_context, ast)
+    html = render_ast_to_html(parser_context, ast, metadata)
+
+    def plugin_filter(action, context, ast_node, metadata):
+        return action(context, ast_node, metadata)
+
+    render_ast_node_to_html_hook.append_filter(plugin_filter)
+    try:
+        assert render_ast_to_html(parser_context, ast, metadata) == html
+    finally:
+        render_ast_node_to_html_hook._filters_last.remove(plugin_filter)
+        render_ast_node_to_html_hook.invalidate_cache()
+
+
+def test_render_ast_to_html_plugin_filter_can_wrap_nested_nodes(
+    parser_context, parse_markup
+):
+    ast = parse_markup("Hello **world**!")
+    metadata = create_ast_metadata(parser_context, ast)
+
+    def plugin_filter(action, context, ast_node, metadata):
+        if ast_node["type"] == "strong":
+            return f"<mark>{action(context, ast_node, metadata)}</mark>"
+        return action(context, ast_node, metadata)
+
+    render_ast_node_to_html_hook.append_filter(plugin_filter)
+    try:
+        assert render_ast_to_html(parser_context, ast, metadata) == (
+            "<p>Hello <mark><strong>world</strong></mark>!</p>"
+        )
+    finally:
+        render_ast_node_to_html_hook._filters_last.remove(plugin_filter)
+        render_ast_node_to_html_hook.invalidate_cache()
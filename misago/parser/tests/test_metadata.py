@@ -1,4 +1,6 @@
-from ..metadata import create_ast_metadata
+from ...permissions.enums import CategoryPermission
+from .. import metadata as metadata_module
+from ..metadata import create_ast_metadata, create_asts_metadata
 
 
 def test_create_ast_metadata_creates_metadata_for_empty_ast(parser_context):
@@ -282,3 +284,94 @@ def test_create_ast_metadata_visits_nested_lists_items(parser_context, user):
     )
     assert metadata["usernames"] == set([user.slug])
     assert metadata["users"] == {user.slug: user}
+
+
+def test_create_ast_metadata_includes_quoted_posts(parser_context, post):
+    metadata = create_ast_metadata(
+        parser_context,
+        [
+            {
+                "type": "quote-bbcode",
+                "author": None,
+                "post": post.id,
+                "children": [],
+            },
+        ],
+    )
+    assert metadata["posts"]["ids"] == {post.id}
+    assert metadata["posts"]["objs"] == {post.id: post}
+
+
+def test_create_ast_metadata_excludes_unapproved_quoted_posts(parser_context, post):
+    post.is_unapproved = True
+    post.save()
+
+    metadata = create_ast_metadata(
+        parser_context,
+        [{"type": "quote-bbcode", "author": None, "post": post.id, "children": []}],
+    )
+    assert metadata["posts"]["ids"] == {post.id}
+    assert metadata["posts"]["objs"] == {}
+
+
+def test_create_ast_metadata_excludes_quoted_posts_in_invisible_categories(
+    parser_context, post, default_category
+):
+    parser_context.user_permissions.permissions["categories"][
+        CategoryPermission.BROWSE
+    ] = []
+
+    metadata = create_ast_metadata(
+        parser_context,
+        [{"type": "quote-bbcode", "author": None, "post": post.id, "children": []}],
+    )
+    assert metadata["posts"]["objs"] == {}
+
+
+def test_create_ast_metadata_defers_quoted_posts_contents(parser_context, post):
+    metadata = create_ast_metadata(
+        parser_context,
+        [{"type": "quote-bbcode", "author": None, "post": post.id, "children": []}],
+    )
+    deferred_fields = metadata["posts"]["objs"][post.id].get_deferred_fields()
+    assert {"original", "parsed", "search_document"} <= deferred_fields
+
+
+def test_create_asts_metadata_walks_every_ast_once(mocker, parser_context):
+    update_spy = mocker.spy(metadata_module, "update_ast_metadata_from_node")
+    asts = [[{"type": "thematic-break"}], [{"type": "thematic-break"}]]
+
+    create_asts_metadata(parser_context, asts)
+    assert update_spy.call_count == 2
+
+
+def test_create_asts_metadata_loads_users_and_posts_in_two_queries(
+    parser_context, parse_markup, user, other_user, post, django_assert_num_queries
+):
+    asts = [
+        parse_markup(f"Hello @{user.username}!"),
+        parse_markup(f'[quote="{other_user.username}; post:{post.id}"]Hi![/quote]'),
+        parse_markup(f"Hello @{other_user.username} and @JohnDoe!"),
+    ]
+
+    # Load user permissions used by posts queryset
+    parser_context.user_permissions.permissions
+
+    with django_assert_num_queries(2):
+        metadatas = create_asts_metadata(parser_context, asts)
+
+    assert metadatas[0]["users"] == {user.slug: user}
+    assert metadatas[1]["users"] == {other_user.slug: other_user}
+    assert metadatas[1]["posts"]["objs"] == {post.id: post}
+    assert metadatas[2]["users"] == {other_user.slug: other_user}
+
+
+def test_create_ast_metadata_reuses_users_from_context_identity_map(
+    parser_context, parse_markup, user, django_assert_num_queries
+):
+    ast = parse_markup(f"Hello @{user.username}!")
+    create_ast_metadata(parser_context, ast)
+
+    with django_assert_num_queries(0):
+        metadata = create_ast_metadata(parser_context, ast)
+    assert metadata["users"] == {user.slug: user}
@@ -1,6 +1,6 @@
 from textwrap import dedent
 
-from ..parser import Parser
+from ..parser import Parser, reverse_reserved_patterns
 
 
 def parse(value: str) -> list[dict]:
@@ -117,3 +117,99 @@ def test_parser_parses_line_breaks_surrounded_by_spaces():
             ],
         },
     ]
+
+
+def test_parser_reserves_inline_code_from_block_patterns(parse_markup):
+    result = parse_markup("Hello `[quote]` world!")
+    assert result == [
+        {
+            "type": "paragraph",
+            "children": [
+                {"type": "text", "text": "Hello "},
+                {"type": "code-inline", "code": "[quote]"},
+                {"type": "text", "text": " world!"},
+            ],
+        }
+    ]
+
+
+def test_parser_preserves_reservation_characters_in_markup(parse_markup):
+    result = parse_markup("Hello \ue0000\ue001 `code` world \ue001!")
+    assert result == [
+        {
+            "type": "paragraph",
+            "children": [
+                {"type": "text", "text": "Hello \ue0000\ue001 "},
+                {"type": "code-inline", "code": "code"},
+                {"type": "text", "text": " world \ue001!"},
+            ],
+        }
+    ]
+
+
+def test_parser_preserves_reservation_characters_in_inline_code(parse_markup):
+    result = parse_markup("Hello `\ue0000\ue001`!")
+    assert result == [
+        {
+            "type": "paragraph",
+            "children": [
+                {"type": "text", "text": "Hello "},
+                {"type": "code-inline", "code": "\ue0000\ue001"},
+                {"type": "text", "text": "!"},
+            ],
+        }
+    ]
+
+
+def test_parser_preserves_reservation_characters_in_unreserved_code(parse_markup):
+    result = parse_markup("`b` ``\ue0000\ue001`")
+    assert result == [
+        {
+            "type": "paragraph",
+            "children": [
+                {"type": "code-inline", "code": "b"},
+                {"type": "text", "text": " "},
+                {"type": "code-inline", "code": ""},
+                {"type": "text", "text": "\ue0000\ue001`"},
+            ],
+        }
+    ]
+
+
+def test_parser_preserves_not_issued_reservation_in_unreserved_code(parse_markup):
+    result = parse_markup("`b`\n``\ue0001\ue001`")
+    assert result == [
+        {
+            "type": "paragraph",
+            "children": [
+                {"type": "code-inline", "code": "b"},
+                {"type": "line-break"},
+                {"type": "code-inline", "code": ""},
+                {"type": "text", "text": "\ue0001\ue001`"},
+            ],
+        }
+    ]
+
+
+def test_parser_preserves_reservation_characters_in_link_text(parse_markup):
+    result = parse_markup("[Hello \ue0000\ue001 `code`](https://example.com)")
+    assert result == [
+        {
+            "type": "paragraph",
+            "children": [
+                {
+                    "type": "url",
+                    "href": "https://example.com",
+                    "children": [
+                        {"type": "text", "text": "Hello \ue0000\ue001 "},
+                        {"type": "code-inline", "code": "code"},
+                    ],
+                },
+            ],
+        }
+    ]
+
+
+def test_reverse_reserved_patterns_ignores_not_issued_indexes():
+    result = reverse_reserved_patterns(["code"], "\ue0000\ue001 \ue0001\ue001")
+    assert result == "code \ue0001\ue001"
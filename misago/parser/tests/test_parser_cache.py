@@ -0,0 +1,72 @@
+from django.test import override_settings
+
+from ..cache import ast_cache, get_ast_cache_key, parse_cached
+from ..parser import Parser
+from ..patterns import block_patterns, inline_patterns
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(MISAGO_PARSER_AST_CACHE_SIZE=10)
+def test_parse_cached_parses_identical_markup_once(mocker, parser):
+    ast_cache.clear()
+    parser_spy = mocker.spy(parser, "parse_blocks")
+
+    ast = parse_cached(parser, "Hello *world*!")
+    assert parse_cached(parser, "Hello *world*!") == ast
+    assert parser_spy.call_count == 1
+
+
+@override_settings(MISAGO_PARSER_AST_CACHE_SIZE=10)
+def test_parse_cached_returns_copy_of_cached_ast(parser):
+    ast_cache.clear()
+
+    ast = parse_cached(parser, "Hello world!")
+    ast[0]["children"][0]["text"] = "Changed"
+
+    assert parse_cached(parser, "Hello world!") == [
+        {"type": "paragraph", "children": [{"type": "text", "text": "Hello world!"}]}
+    ]
+
+
+@override_settings(MISAGO_PARSER_AST_CACHE_SIZE=0)
+def test_parse_cached_parses_markup_if_cache_is_disabled(mocker, parser):
+    ast_cache.clear()
+    parser_spy = mocker.spy(parser, "parse_blocks")
+
+    parse_cached(parser, "Hello world!")
+    parse_cached(parser, "Hello world!")
+    assert parser_spy.call_count == 2
+
+
+@override_settings(
+    MISAGO_PARSER_AST_CACHE_SIZE=0,
+    MISAGO_PARSER_AST_CACHE_SHARED=True,
+    CACHES=LOCMEM_CACHE,
+)
+def test_parse_cached_reads_ast_from_shared_cache(mocker, parser):
+    parse_cached(parser, "Hello shared world!")
+
+    parser_spy = mocker.spy(parser, "parse_blocks")
+    parse_cached(parser, "Hello shared world!")
+    parser_spy.assert_not_called()
+
+
+def test_ast_cache_key_depends_on_markup(parser):
+    assert get_ast_cache_key(parser, "Hello") != get_ast_cache_key(parser, "World")
+
+
+def test_ast_cache_key_depends_on_parser_patterns(parser):
+    other_parser = Parser(block_patterns, inline_patterns[:-1], [])
+    assert get_ast_cache_key(parser, "Hello") != get_ast_cache_key(
+        other_parser, "Hello"
+    )
+
+
+def test_ast_cache_key_is_same_for_parsers_with_same_patterns(parser):
+    other_parser = Parser(
+        parser.block_patterns, parser.inline_patterns, parser.post_processors
+    )
+    assert get_ast_cache_key(parser, "Hello") == get_ast_cache_key(
+        other_parser, "Hello"
+    )
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ..factory import create_parser, get_pooled_parser
+from ..patterns import block_patterns, inline_patterns
+from ..postprocessors import post_processors
+
+
+def test_create_parser_returns_pooled_parser(parser_context):
+    assert create_parser(parser_context) is create_parser(parser_context)
+
+
+def test_pooled_parser_is_shared_by_calls_with_same_patterns():
+    parser = get_pooled_parser(
+        block_patterns.copy(), inline_patterns.copy(), post_processors.copy()
+    )
+    other_parser = get_pooled_parser(
+        block_patterns.copy(), inline_patterns.copy(), post_processors.copy()
+    )
+    assert parser is other_parser
+
+
+def test_pooled_parser_is_not_shared_by_calls_with_different_patterns():
+    parser = get_pooled_parser(block_patterns, inline_patterns, post_processors)
+    other_parser = get_pooled_parser(block_patterns, inline_patterns[:-1], [])
+    assert parser is not other_parser
+
+
+def test_parser_calls_dont_share_reserved_patterns(parser):
+    parser("Hello `code`!")
+    assert not parser.state.reserved_patterns
+
+
+def test_shared_parser_parses_markups_in_many_threads(parser):
+    markups = [f"Hello `code {i}` and `other {i}`!" for i in range(50)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        asts = list(executor.map(parser, markups))
+
+    for i, ast in enumerate(asts):
+        assert ast == parser(markups[i])
+        assert ast[0]["children"][1] == {"type": "code-inline", "code": f"code {i}"}
@@ -0,0 +1,18 @@
+from ..metadata import create_ast_metadata
+from ..searchdocument import render_search_document
+
+
+def test_render_search_document_renders_plain_text(parser_context, parse_markup):
+    ast = parse_markup(
+        """
+        Hello **world**!
+
+        [quote="Author"]
+        Quoted [link](https://example.com)
+        [/quote]
+        """
+    )
+    metadata = create_ast_metadata(parser_context, ast)
+    assert render_search_document(parser_context, ast, metadata) == (
+        "Hello world! Author: Quoted link https://example.com"
+    )
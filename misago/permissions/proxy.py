@@ -24,5 +24,13 @@ class UserPermissionsProxy:
         self.accessed_permissions = True
         return get_user_permissions(self.user, self.cache_versions)
 
+    @cached_property
+    def categories_sets(self) -> dict[str, frozenset[int]]:
+        """Frozensets of categories ids for every category permission."""
+        return {
+            permission: frozenset(categories_ids)
+            for permission, categories_ids in self.permissions["categories"].items()
+        }
+
     def __getattr__(self, name: str) -> Any:
         return self.permissions[name]
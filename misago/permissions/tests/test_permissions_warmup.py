@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..user import get_user_permissions_cache_key, permissions_cache
+from ..warmup import warm_up_permissions_cache
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_permissions_warm_up_builds_users_permissions(
+    cache_versions, anonymous_user, user, admin
+):
+    cache.clear()
+    warm_up_permissions_cache(cache_versions)
+
+    for permissions_user in (anonymous_user, user, admin):
+        cache_key = get_user_permissions_cache_key(permissions_user, cache_versions)
+        assert permissions_cache.get(cache_key)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_permissions_warm_up_builds_permissions_once_per_permissions_id(
+    mocker, cache_versions, user, other_user
+):
+    cache.clear()
+    build_user_permissions = mocker.patch(
+        "misago.permissions.warmup.build_user_permissions", return_value={}
+    )
+    warm_up_permissions_cache(cache_versions)
+
+    assert user.permissions_id == other_user.permissions_id
+    assert build_user_permissions.call_count == 2
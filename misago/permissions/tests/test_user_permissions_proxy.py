@@ -20,3 +20,9 @@ def test_user_permissions_proxy_getattr_returns_user_permission(user, cache_vers
     proxy = UserPermissionsProxy(user, cache_versions)
     assert proxy.categories
     assert proxy.accessed_permissions
+
+
+def test_user_permissions_proxy_returns_categories_sets(user, cache_versions):
+    proxy = UserPermissionsProxy(user, cache_versions)
+    for permission, categories_ids in proxy.categories.items():
+        assert proxy.categories_sets[permission] == frozenset(categories_ids)
@@ -1,8 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.core.cache import cache
 
 from ..cache.enums import CacheName
+from ..cache.versionedcache import VersionedCache
 from ..categories.enums import CategoryTree
 from ..categories.models import Category
 from ..users.enums import DefaultGroupId
@@ -17,6 +17,8 @@ from .models import CategoryGroupPermission
 
 User = get_user_model()
 
+permissions_cache = VersionedCache(CacheName.PERMISSIONS)
+
 
 def get_user_permissions(user: User | AnonymousUser, cache_versions: dict) -> dict:
     return get_user_permissions_hook(_get_user_permissions_action, user, cache_versions)
@@ -26,13 +28,12 @@ def _get_user_permissions_action(
     user: User | AnonymousUser, cache_versions: dict
 ) -> dict:
     cache_key = get_user_permissions_cache_key(user, cache_versions)
-    permissions = cache.get(cache_key)
-
-    if permissions is None:
-        permissions = build_user_permissions(user)
-        cache.set(cache_key, permissions)
-
-    return permissions
+    permissions = permissions_cache.get_or_build(
+        cache_key, lambda: build_user_permissions(user)
+    )
+    # Cached permissions are shared between requests, return a copy that
+    # get_user_permissions_hook filters can extend
+    return permissions.copy()
 
 
 def get_user_permissions_cache_key(
@@ -116,12 +117,12 @@ def _build_user_category_permissions_action(
         CategoryPermission.ATTACHMENTS: [],
     }
 
+    # Set of browseable categories for constant time parent lookups
+    browseable_categories: set[int] = set()
+
     for category_id, category in categories.items():
         # Skip category if we can't see its parent
-        if (
-            category.level > 1
-            and category.parent_id not in permissions[CategoryPermission.BROWSE]
-        ):
+        if category.level > 1 and category.parent_id not in browseable_categories:
             continue
 
         # Skip category if we can't see it
@@ -133,6 +134,7 @@ def _build_user_category_permissions_action(
 
         if CategoryPermission.BROWSE in perms:
             permissions[CategoryPermission.BROWSE].append(category_id)
+            browseable_categories.add(category_id)
         else:
             continue  # Skip rest of permissions if we can't read its contents
 
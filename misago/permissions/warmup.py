@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+
+from ..users.models import AnonymousUser
+from .user import (
+    build_user_permissions,
+    get_user_permissions_cache_key,
+    permissions_cache,
+)
+
+User = get_user_model()
+
+
+def warm_up_permissions_cache(cache_versions: dict):
+    """Builds permissions for anonymous user and for every permissions id that
+    users have, so requests after permissions cache invalidation don't build
+    them all at once."""
+    users = [AnonymousUser()] + list(get_users_with_distinct_permissions_ids())
+    for user in users:
+        cache_key = get_user_permissions_cache_key(user, cache_versions)
+        permissions_cache.get_or_build(
+            cache_key, lambda user=user: build_user_permissions(user)
+        )
+
+
+def get_users_with_distinct_permissions_ids():
+    return (
+        User.objects.order_by("permissions_id", "id")
+        .distinct("permissions_id")
+        .only("id", "groups_ids", "permissions_id")
+    )
@@ -45,12 +45,12 @@ class FilterHook(Generic[Action, Filter]):
 
     _filters_first: List[Filter]
     _filters_last: List[Filter]
-    _cache: Action | None
+    _cache: dict[Action, Action]
 
     def __init__(self):
         self._filters_first = []
         self._filters_last = []
-        self._cache = None
+        self._cache = {}
 
     def __bool__(self) -> bool:
         return bool(self._filters_first or self._filters_last)
@@ -64,7 +64,7 @@ class FilterHook(Generic[Action, Filter]):
         self.invalidate_cache()
 
     def invalidate_cache(self):
-        self._cache = None
+        self._cache = {}
 
     def get_reduced_action(self, action: Action) -> Action:
         def reduce_filter(action: Action, next_filter: Filter) -> Action:
@@ -77,7 +77,9 @@ class FilterHook(Generic[Action, Filter]):
         return reduce(reduce_filter, filters, action)
 
     def __call__(self, action: Action, *args, **kwargs):
-        if self._cache is None:
-            self._cache = self.get_reduced_action(action)
+        # Hook can be called with different actions, reduce filters for each
+        reduced_action = self._cache.get(action)
+        if reduced_action is None:
+            reduced_action = self._cache[action] = self.get_reduced_action(action)
 
-        return self._cache(*args, **kwargs)  # type: ignore
+        return reduced_action(*args, **kwargs)  # type: ignore
@@ -58,3 +58,13 @@ def test_filter_can_be_inserted_before_other_filters(hook):
     hook.append_filter(first_filter)
     hook.prepend_filter(second_filter)
     assert hook(action) == [[[ACTION], SECOND_FILTER], FIRST_FILTER]
+
+
+def other_action(data):
+    return [SECOND_FILTER]
+
+
+def test_filter_hook_calls_filters_with_action_it_was_called_with(hook):
+    hook.append_filter(first_filter)
+    assert hook(action) == [[ACTION], FIRST_FILTER]
+    assert hook(other_action) == [[SECOND_FILTER], FIRST_FILTER]
@@ -1,11 +1,20 @@
+from datetime import datetime, timedelta
 from typing import Iterable
 
+from django.db.models import Min, Q
 from django.http import HttpRequest
+from django.utils import timezone
 
 from ..categories.models import Category
 from ..threads.models import Post, Thread
 from ..threads.permissions import exclude_invisible_posts, exclude_invisible_threads
 from .cutoffdate import get_cutoff_date
+from .models import CategoryRead
+from .poststracker import exclude_read_posts
+
+# Posts are checked again for some time after synchronization, because posts
+# committed after it could have posted_on date from before it
+SYNCHRONIZATION_SLACK = timedelta(minutes=1)
 
 
 def get_categories_new_posts(
@@ -21,22 +30,118 @@ def get_categories_new_posts(
     if request.user.is_anonymous:
         return categories_new_posts
 
+    cutoff_date = get_cutoff_date(request.settings, request.user)
+    acl_version = get_acl_version(request.user_acl)
+    categories_reads = {
+        category_read.category_id: category_read
+        for category_read in CategoryRead.objects.filter(
+            user=request.user, category__in=categories
+        )
+    }
+
+    # Categories which read state has to be synchronized, with date since when
+    # their posts have to be checked
+    unsynchronized_categories: dict[Category, datetime] = {}
+
+    for category in categories:
+        category_read = categories_reads.get(category.id)
+        if not is_category_read_synchronized(category_read, cutoff_date, acl_version):
+            unsynchronized_categories[category] = cutoff_date
+        elif (
+            category.last_post_on
+            and category.last_post_on > category_read.synchronized_on
+        ):
+            if category_read.has_unread:
+                categories_new_posts[category.id] = True
+            else:
+                # Only posts newer than last synchronization can be unread
+                unsynchronized_categories[category] = max(
+                    category_read.synchronized_on, cutoff_date
+                )
+        else:
+            categories_new_posts[category.id] = category_read.has_unread
+
+    if unsynchronized_categories:
+        synchronized_on = timezone.now() - SYNCHRONIZATION_SLACK
+        new_posts = get_unsynchronized_categories_new_posts(
+            request, unsynchronized_categories
+        )
+
+        CategoryRead.objects.bulk_create(
+            [
+                CategoryRead(
+                    user=request.user,
+                    category=category,
+                    has_unread=category.id in new_posts,
+                    unread_since=new_posts.get(category.id),
+                    synchronized_on=synchronized_on,
+                    acl_version=acl_version,
+                )
+                for category in unsynchronized_categories
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "category"],
+            update_fields=[
+                "has_unread",
+                "unread_since",
+                "synchronized_on",
+                "acl_version",
+            ],
+        )
+
+        for category_id in new_posts:
+            categories_new_posts[category_id] = True
+
+    return categories_new_posts
+
+
+def get_acl_version(user_acl: dict) -> str:
+    return "%s:%s" % (user_acl.get("acl_key"), user_acl["cache_versions"]["acl"])
+
+
+def is_category_read_synchronized(
+    category_read: CategoryRead | None, cutoff_date: datetime, acl_version: str
+) -> bool:
+    if not category_read or category_read.acl_version != acl_version:
+        return False
+
+    if category_read.synchronized_on + SYNCHRONIZATION_SLACK < cutoff_date:
+        return False
+
+    # Unread posts became older than cutoff date and are no longer unread
+    if category_read.has_unread and (
+        not category_read.unread_since or category_read.unread_since <= cutoff_date
+    ):
+        return False
+
+    return True
+
+
+def get_unsynchronized_categories_new_posts(
+    request: HttpRequest, categories_since: dict[Category, datetime]
+) -> dict[int, datetime]:
+    """Returns a dict with category ID as a key and date of its oldest new post."""
+    categories = list(categories_since)
+
     threads = Thread.objects.filter(category__in=categories)
     threads = exclude_invisible_threads(request.user_acl, categories, threads)
-    queryset = (
-        Post.objects.filter(
-            category__in=categories,
-            thread__in=threads,
-            posted_on__gt=get_cutoff_date(request.settings, request.user),
-        )
-        .values_list("category", flat=True)
-        .distinct()
-    )
 
-    queryset = queryset.exclude(id__in=request.user.postread_set.values("post"))
+    posted_on = Q()
+    for category, since in categories_since.items():
+        posted_on |= Q(category=category, posted_on__gt=since)
+
+    queryset = Post.objects.filter(posted_on, thread__in=threads)
+    queryset = exclude_read_posts(request.user, queryset)
     queryset = exclude_invisible_posts(request.user_acl, categories, queryset)
 
-    for category_id in queryset:
-        categories_new_posts[category_id] = True
+    return {
+        row["category"]: row["unread_since"]
+        for row in queryset.values("category")
+        .annotate(unread_since=Min("posted_on"))
+        .order_by()
+    }
 
-    return categories_new_posts
+
+def invalidate_categories_reads(categories_ids: Iterable[int]):
+    """Makes users read states of categories synchronize on next check."""
+    CategoryRead.objects.filter(category_id__in=categories_ids).delete()
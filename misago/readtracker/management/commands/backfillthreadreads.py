@@ -0,0 +1,79 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from ....core.management.progressbar import show_progress
+from ....threads.models import Thread
+from ...models import PostRead, ThreadRead
+
+
+class Command(BaseCommand):
+    help = "Creates threads read markers from legacy posts reads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            default=100,
+            help="Number of threads which posts reads are backfilled at once.",
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        threads_to_backfill = Thread.objects.count()
+
+        if not threads_to_backfill:
+            self.stdout.write("\n\nNo threads were found")
+        else:
+            self.backfill_threads_reads(threads_to_backfill, options["chunk_size"])
+
+    def backfill_threads_reads(self, threads_to_backfill, chunk_size):
+        self.stdout.write("Backfilling reads for %s threads...\n" % threads_to_backfill)
+
+        threads_count = 0
+        backfilled_count = 0
+        show_progress(self, threads_count, threads_to_backfill)
+        start_time = time.time()
+
+        threads = Thread.objects.values_list("id", "category_id").order_by("id")
+        last_thread_id = 0
+
+        while True:
+            threads_categories = dict(
+                threads.filter(id__gt=last_thread_id)[:chunk_size]
+            )
+            if not threads_categories:
+                break
+
+            backfilled_count += backfill_threads_reads(threads_categories)
+
+            last_thread_id = max(threads_categories)
+            threads_count += len(threads_categories)
+            show_progress(self, threads_count, threads_to_backfill, start_time)
+
+        self.stdout.write("\n\nBackfilled %s threads reads" % backfilled_count)
+
+
+def backfill_threads_reads(threads_categories: dict[int, int]) -> int:
+    """Aggregates posts reads into read markers, skipping existing markers."""
+    posts_reads = (
+        PostRead.objects.filter(thread_id__in=threads_categories)
+        .values("user_id", "thread_id")
+        .annotate(last_read_post_id=Max("post_id"), last_read_on=Max("last_read_on"))
+        .order_by()
+    )
+
+    threads_reads = [
+        ThreadRead(
+            user_id=post_read["user_id"],
+            category_id=threads_categories[post_read["thread_id"]],
+            thread_id=post_read["thread_id"],
+            last_read_post_id=post_read["last_read_post_id"],
+            last_read_on=post_read["last_read_on"],
+        )
+        for post_read in posts_reads
+    ]
+
+    ThreadRead.objects.bulk_create(threads_reads, ignore_conflicts=True)
+    return len(threads_reads)
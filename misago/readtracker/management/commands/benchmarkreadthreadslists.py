@@ -0,0 +1,123 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from ....acl.useracl import get_user_acl
+from ....cache.versions import get_cache_versions
+from ....categories.models import Category
+from ....conf.shortcuts import get_dynamic_settings
+from ....core.cursorpagination import get_page
+from ....threads.viewmodels.threads import (
+    filter_read_threads_queryset,
+    get_threads_queryset,
+)
+from ...threadslists import READ_THREADS_LISTS, get_read_threads_page
+
+User = get_user_model()
+
+
+class BenchmarkRequest:
+    def __init__(self, user):
+        self.user = user
+        self.settings = get_dynamic_settings()
+        self.cache_versions = get_cache_versions()
+        self.user_acl = get_user_acl(user, self.cache_versions)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures time it takes to load pages of the new and unread threads lists, "
+        "with threads filtered by subqueries and by read threads lists engine. "
+        "Use createfakehistory command to generate forum with 1M+ posts first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="ID of user to load lists for, defaults to user with most reads",
+            type=int,
+        )
+        parser.add_argument(
+            "--pages",
+            help="number of pages to load for each list",
+            type=int,
+            default=10,
+        )
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            user = User.objects.filter(id=options["user"]).first()
+        else:
+            user = (
+                User.objects.annotate(reads=Count("threadread"))
+                .order_by("-reads")
+                .first()
+            )
+        if not user:
+            raise CommandError("Benchmark requires at least one user.")
+
+        request = BenchmarkRequest(user)
+        categories = [Category.objects.root_category()] + list(
+            Category.objects.all_categories().filter(
+                id__in=request.user_acl["visible_categories"]
+            )
+        )
+
+        self.stdout.write("Loading lists for %s...\n" % user)
+
+        for list_type in READ_THREADS_LISTS:
+            for name, load_page in (
+                ("subqueries", load_subqueries_page),
+                ("read threads engine", load_read_threads_page),
+            ):
+                pages, threads, duration = run_benchmark(
+                    load_page, request, categories, list_type, options["pages"]
+                )
+                self.stdout.write(
+                    "%s (%s): %s pages, %s threads in %.3fs (%.1fms per page)"
+                    % (
+                        list_type,
+                        name,
+                        pages,
+                        threads,
+                        duration,
+                        duration * 1000 / max(pages, 1),
+                    )
+                )
+
+
+def run_benchmark(load_page, request, categories, list_type, pages_limit):
+    pages = 0
+    threads = 0
+    start = 0
+
+    start_time = time.perf_counter()
+    while pages < pages_limit:
+        page = load_page(request, categories, list_type, start)
+        pages += 1
+        threads += len(page.object_list)
+        if not page.next:
+            break
+        start = page.next
+
+    return pages, threads, time.perf_counter() - start_time
+
+
+def load_subqueries_page(request, categories, list_type, start):
+    queryset = get_threads_queryset(request, categories, "all")
+    queryset = filter_read_threads_queryset(request, categories, list_type, queryset)
+    return get_page(queryset, "-last_post_id", request.settings.threads_per_page, start)
+
+
+def load_read_threads_page(request, categories, list_type, start):
+    queryset = get_threads_queryset(request, categories, "all")
+    return get_read_threads_page(
+        request,
+        categories,
+        list_type,
+        queryset,
+        request.settings.threads_per_page,
+        start,
+    )
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.10 on 2026-10-17 07:16
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("misago_categories", "0012_categories_trees_ids"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("misago_threads", "0015_stats_deltas"),
+        ("misago_readtracker", "0004_auto_20171015_2010"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ThreadRead",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("last_read_post_id", models.PositiveIntegerField()),
+                (
+                    "last_read_on",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="misago_categories.category",
+                    ),
+                ),
+                (
+                    "thread",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="misago_threads.thread",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="threadread",
+            constraint=models.UniqueConstraint(
+                fields=("user", "thread"), name="misago_readtracker_threadread_unique"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.10 on 2026-10-17 07:44
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("misago_categories", "0012_categories_trees_ids"),
+        ("misago_readtracker", "0005_threadread"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryRead",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("has_unread", models.BooleanField()),
+                (
+                    "synchronized_on",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="misago_categories.category",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="categoryread",
+            constraint=models.UniqueConstraint(
+                fields=("user", "category"),
+                name="misago_readtracker_categoryread_unique",
+            ),
+        ),
+    ]
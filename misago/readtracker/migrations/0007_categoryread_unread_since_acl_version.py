@@ -0,0 +1,23 @@
+# Generated by Django 4.2.10 on 2026-10-17 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("misago_readtracker", "0006_categoryread"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="categoryread",
+            name="acl_version",
+            field=models.CharField(default="", max_length=32),
+        ),
+        migrations.AddField(
+            model_name="categoryread",
+            name="unread_since",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -9,3 +9,43 @@ class PostRead(models.Model):
     thread = models.ForeignKey("misago_threads.Thread", on_delete=models.CASCADE)
     post = models.ForeignKey("misago_threads.Post", on_delete=models.CASCADE)
     last_read_on = models.DateTimeField(default=timezone.now)
+
+
+class ThreadRead(models.Model):
+    """Thread's posts with ids up to last_read_post_id have been read by user."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    category = models.ForeignKey("misago_categories.Category", on_delete=models.CASCADE)
+    thread = models.ForeignKey("misago_threads.Thread", on_delete=models.CASCADE)
+    last_read_post_id = models.PositiveIntegerField()
+    last_read_on = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "thread"],
+                name="misago_readtracker_threadread_unique",
+            ),
+        ]
+
+
+class CategoryRead(models.Model):
+    """Category had unread posts for user when it was synchronized."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    category = models.ForeignKey("misago_categories.Category", on_delete=models.CASCADE)
+    has_unread = models.BooleanField()
+    # Date of oldest unread post, read state is synchronized again when this
+    # post becomes older than cutoff date
+    unread_since = models.DateTimeField(null=True, blank=True)
+    synchronized_on = models.DateTimeField(default=timezone.now)
+    # User's ACL key and version, read state is synchronized again when they change
+    acl_version = models.CharField(max_length=32, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "category"],
+                name="misago_readtracker_categoryread_unique",
+            ),
+        ]
@@ -1,4 +1,9 @@
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
 from .cutoffdate import get_cutoff_date
+from .models import CategoryRead, ThreadRead
 
 
 def make_read_aware(request, posts):
@@ -14,19 +19,23 @@ def make_read_aware(request, posts):
         return
 
     cutoff_date = get_cutoff_date(request.settings, request.user)
-    unresolved_posts = {}
+    unresolved_posts = []
 
     for post in posts:
         if post.posted_on > cutoff_date:
             post.is_read = False
             post.is_new = True
-            unresolved_posts[post.pk] = post
+            unresolved_posts.append(post)
 
     if unresolved_posts:
-        queryset = request.user.postread_set.filter(post__in=unresolved_posts)
-        for post_id in queryset.values_list("post_id", flat=True):
-            unresolved_posts[post_id].is_read = True
-            unresolved_posts[post_id].is_new = False
+        threads_reads = get_threads_reads(
+            request.user, set(post.thread_id for post in unresolved_posts)
+        )
+
+        for post in unresolved_posts:
+            if post.id <= threads_reads.get(post.thread_id, 0):
+                post.is_read = True
+                post.is_new = False
 
 
 def make_read(posts):
@@ -35,5 +44,53 @@ def make_read(posts):
         post.is_new = False
 
 
+def get_threads_reads(user, threads_ids) -> dict[int, int]:
+    """Returns dict with thread ID as a key and last read post ID as a value."""
+    queryset = ThreadRead.objects.filter(user=user, thread_id__in=threads_ids)
+    return dict(queryset.values_list("thread_id", "last_read_post_id"))
+
+
+def get_last_read_post_id(user) -> Subquery:
+    """Returns subquery selecting user's last read post ID for post's thread."""
+    return Subquery(
+        ThreadRead.objects.filter(user=user, thread_id=OuterRef("thread_id")).values(
+            "last_read_post_id"
+        )[:1]
+    )
+
+
+def filter_read_posts(user, queryset):
+    return queryset.filter(id__lte=get_last_read_post_id(user))
+
+
+def exclude_read_posts(user, queryset):
+    return queryset.filter(id__gt=Coalesce(get_last_read_post_id(user), Value(0)))
+
+
 def save_read(user, post):
-    user.postread_set.create(category=post.category, thread=post.thread, post=post)
+    updated = ThreadRead.objects.filter(
+        user=user, thread_id=post.thread_id, last_read_post_id__lt=post.id
+    ).update(
+        category_id=post.category_id,
+        last_read_post_id=post.id,
+        last_read_on=timezone.now(),
+    )
+
+    if not updated:
+        ThreadRead.objects.get_or_create(
+            user=user,
+            thread_id=post.thread_id,
+            defaults={"category_id": post.category_id, "last_read_post_id": post.id},
+        )
+
+    # Category may have no unread posts left after this read
+    CategoryRead.objects.filter(
+        user=user, category_id=post.category_id, has_unread=True
+    ).delete()
+
+
+def reset_posts_reads(thread, post_id):
+    """Marks thread's posts starting with post_id as unread for all users."""
+    ThreadRead.objects.filter(thread=thread, last_read_post_id__gte=post_id).update(
+        last_read_post_id=post_id - 1
+    )
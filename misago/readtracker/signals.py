@@ -1,8 +1,13 @@
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Least
 from django.dispatch import Signal, receiver
 
 from ..categories import PRIVATE_THREADS_ROOT_NAME
 from ..categories.signals import delete_category_content, move_category_content
-from ..threads.signals import merge_post, merge_thread, move_post, move_thread
+from ..threads.signals import merge_thread, move_post, move_thread
+from .categories import invalidate_categories_reads
+from .models import ThreadRead
+from .poststracker import reset_posts_reads
 
 thread_read = Signal()
 
@@ -10,32 +15,60 @@ thread_read = Signal()
 @receiver(delete_category_content)
 def delete_category_threads(sender, **kwargs):
     sender.postread_set.all().delete()
+    sender.threadread_set.all().delete()
+    sender.categoryread_set.all().delete()
 
 
 @receiver(move_category_content)
 def move_category_tracker(sender, **kwargs):
     sender.postread_set.update(category=kwargs["new_category"])
+    sender.threadread_set.update(category=kwargs["new_category"])
+    invalidate_categories_reads([sender.id, kwargs["new_category"].id])
 
 
 @receiver(merge_thread)
 def merge_thread_tracker(sender, **kwargs):
     other_thread = kwargs["other_thread"]
-    other_thread.postread_set.update(category=sender.category, thread=sender)
 
+    reads = ThreadRead.objects.filter(thread=sender)
+    other_reads = ThreadRead.objects.filter(thread=other_thread)
 
-@receiver(move_thread)
-def move_thread_tracker(sender, **kwargs):
-    sender.postread_set.update(category=sender.category, thread=sender)
+    # users who read both threads keep the lower of their read markers
+    other_last_read_post_id = other_reads.filter(user=OuterRef("user")).values(
+        "last_read_post_id"
+    )
+    reads.filter(user__in=other_reads.values("user")).update(
+        last_read_post_id=Least(
+            F("last_read_post_id"), Subquery(other_last_read_post_id[:1])
+        )
+    )
 
+    # users who read only one of threads haven't read other thread's posts
+    if other_thread.first_post_id:
+        reads.exclude(user__in=other_reads.values("user")).filter(
+            last_read_post_id__gte=other_thread.first_post_id
+        ).update(last_read_post_id=other_thread.first_post_id - 1)
+    if sender.first_post_id:
+        other_reads.exclude(user__in=reads.values("user")).filter(
+            last_read_post_id__gte=sender.first_post_id
+        ).update(last_read_post_id=sender.first_post_id - 1)
 
-@receiver(merge_post)
-def merge_post_delete_tracker(sender, **kwargs):
-    sender.postread_set.all().delete()
+    other_reads.filter(user__in=reads.values("user")).delete()
+    other_reads.update(category=sender.category, thread=sender)
+
+    invalidate_categories_reads([sender.category_id, other_thread.category_id])
+
+
+@receiver(move_thread)
+def move_thread_tracker(sender, **kwargs):
+    sender.threadread_set.update(category=sender.category)
+    invalidate_categories_reads([kwargs["old_category_id"], sender.category_id])
 
 
 @receiver(move_post)
-def move_post_delete_tracker(sender, **kwargs):
-    sender.postread_set.all().delete()
+def move_post_reset_tracker(sender, **kwargs):
+    reset_posts_reads(sender.thread, sender.id)
+    invalidate_categories_reads([kwargs["old_category_id"], sender.category_id])
 
 
 @receiver(thread_read)
@@ -0,0 +1,52 @@
+from io import StringIO
+
+from django.core import management
+
+from ...threads.test import reply_thread
+from ..management.commands import backfillthreadreads
+from ..models import PostRead, ThreadRead
+from ..poststracker import save_read
+
+
+def call_command():
+    command = backfillthreadreads.Command()
+
+    out = StringIO()
+    management.call_command(command, stdout=out)
+    return out.getvalue().strip().splitlines()[-1].strip()
+
+
+def create_post_read(user, post):
+    return PostRead.objects.create(
+        user=user, category=post.category, thread=post.thread, post=post
+    )
+
+
+def test_command_works_if_there_are_no_threads(db):
+    command_output = call_command()
+    assert command_output == "No threads were found"
+
+
+def test_command_creates_read_marker_from_posts_reads(user, thread):
+    reply = reply_thread(thread)
+    create_post_read(user, thread.first_post)
+    create_post_read(user, reply)
+
+    command_output = call_command()
+    assert command_output == "Backfilled 1 threads reads"
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.thread == thread
+    assert thread_read.category_id == thread.category_id
+    assert thread_read.last_read_post_id == reply.id
+
+
+def test_command_skips_existing_read_markers(user, thread):
+    reply = reply_thread(thread)
+    save_read(user, thread.first_post)
+    create_post_read(user, reply)
+
+    call_command()
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.last_read_post_id == thread.first_post_id
@@ -4,8 +4,10 @@ import pytest
 from django.utils import timezone
 
 from ...conf.test import override_dynamic_settings
+from ...threads.moderation.posts import approve_post, unhide_post
 from ...threads.test import reply_thread
 from ..categories import get_categories_new_posts
+from ..models import CategoryRead
 from ..poststracker import save_read
 
 
@@ -178,3 +180,149 @@ def test_get_categories_new_posts_returns_false_for_untracked_thread_for_anonymo
         anonymous_request_mock, [default_category]
     )
     assert categories_new_posts == {default_category.pk: False}
+
+
+def test_get_categories_new_posts_stores_categories_read_states(
+    request_mock, user, post, default_category
+):
+    get_categories_new_posts(request_mock, [default_category])
+
+    category_read = CategoryRead.objects.get(user=user, category=default_category)
+    assert category_read.has_unread
+
+
+def test_get_categories_new_posts_uses_synchronized_read_states(
+    request_mock, post, default_category, django_assert_num_queries
+):
+    get_categories_new_posts(request_mock, [default_category])
+    default_category.last_post_on = timezone.now() - timedelta(minutes=5)
+
+    with django_assert_num_queries(1):
+        categories_new_posts = get_categories_new_posts(
+            request_mock, [default_category]
+        )
+    assert categories_new_posts == {default_category.pk: True}
+
+
+def test_get_categories_new_posts_checks_posts_newer_than_synchronized_read_state(
+    request_mock, user, read_thread, default_category
+):
+    assert get_categories_new_posts(request_mock, [default_category]) == {
+        default_category.pk: False
+    }
+
+    reply = reply_thread(read_thread, posted_on=timezone.now() + timedelta(minutes=1))
+    default_category.last_post_on = reply.posted_on
+
+    categories_new_posts = get_categories_new_posts(request_mock, [default_category])
+    assert categories_new_posts == {default_category.pk: True}
+
+
+def test_get_categories_new_posts_checks_post_committed_after_read_state_sync(
+    request_mock, user, read_thread, default_category
+):
+    user.joined_on = timezone.now() - timedelta(days=1)
+    user.save()
+
+    assert get_categories_new_posts(request_mock, [default_category]) == {
+        default_category.pk: False
+    }
+
+    # Post's date was set before the read state was synchronized
+    reply = reply_thread(read_thread, posted_on=timezone.now() - timedelta(seconds=5))
+    default_category.last_post_on = reply.posted_on
+
+    categories_new_posts = get_categories_new_posts(request_mock, [default_category])
+    assert categories_new_posts == {default_category.pk: True}
+
+
+def test_get_categories_new_posts_synchronizes_read_state_after_post_is_read(
+    request_mock, user, post, default_category
+):
+    assert get_categories_new_posts(request_mock, [default_category]) == {
+        default_category.pk: True
+    }
+
+    save_read(user, post)
+
+    categories_new_posts = get_categories_new_posts(request_mock, [default_category])
+    assert categories_new_posts == {default_category.pk: False}
+
+
+@override_dynamic_settings(readtracker_cutoff=3)
+def test_get_categories_new_posts_synchronizes_read_state_after_new_posts_age(
+    request_mock, user, read_thread, default_category
+):
+    user.joined_on = timezone.now() - timedelta(days=5)
+    user.save()
+
+    reply = reply_thread(read_thread, posted_on=timezone.now() - timedelta(days=2))
+    assert get_categories_new_posts(request_mock, [default_category]) == {
+        default_category.pk: True
+    }
+
+    category_read = CategoryRead.objects.get(user=user, category=default_category)
+    assert category_read.unread_since == reply.posted_on
+
+    # Reply became older than cutoff date after read state was synchronized
+    reply.posted_on = timezone.now() - timedelta(days=4)
+    reply.save()
+    CategoryRead.objects.update(unread_since=reply.posted_on)
+    default_category.last_post_on = reply.posted_on
+
+    categories_new_posts = get_categories_new_posts(request_mock, [default_category])
+    assert categories_new_posts == {default_category.pk: False}
+
+
+def test_get_categories_new_posts_synchronizes_read_state_after_acl_change(
+    request_mock, user, read_thread, default_category
+):
+    request_mock.user_acl["categories"][default_category.id]["can_hide_events"] = 1
+    reply_thread(read_thread, is_hidden=True, is_event=True)
+    assert get_categories_new_posts(request_mock, [default_category]) == {
+        default_category.pk: True
+    }
+
+    request_mock.user_acl["categories"][default_category.id]["can_hide_events"] = 0
+    request_mock.user_acl["cache_versions"] = {
+        **request_mock.user_acl["cache_versions"],
+        "acl": "changed",
+    }
+
+    categories_new_posts = get_categories_new_posts(request_mock, [default_category])
+    assert categories_new_posts == {default_category.pk: False}
+
+
+def test_thread_move_invalidates_categories_read_states(
+    request_mock, user, thread, default_category, other_category
+):
+    get_categories_new_posts(request_mock, [default_category, other_category])
+    assert CategoryRead.objects.filter(user=user).count() == 2
+
+    thread.move(other_category)
+
+    assert not CategoryRead.objects.exists()
+
+
+def test_post_approval_invalidates_categories_read_states(
+    request_mock, user, read_thread, default_category
+):
+    post = reply_thread(read_thread, is_unapproved=True)
+    get_categories_new_posts(request_mock, [default_category])
+    assert CategoryRead.objects.filter(user=user).exists()
+
+    approve_post(user, post)
+
+    assert not CategoryRead.objects.exists()
+
+
+def test_post_unhiding_invalidates_categories_read_states(
+    request_mock, user, read_thread, default_category
+):
+    post = reply_thread(read_thread, is_hidden=True)
+    get_categories_new_posts(request_mock, [default_category])
+    assert CategoryRead.objects.filter(user=user).exists()
+
+    unhide_post(user, post)
+
+    assert not CategoryRead.objects.exists()
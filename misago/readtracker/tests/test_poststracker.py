@@ -87,3 +87,19 @@ def test_not_tracked_post_is_marked_as_read_and_not_new_for_anonymous_user(
     make_read_aware(anonymous_request_mock, post)
     assert post.is_read
     assert not post.is_new
+
+
+def test_reading_post_marks_thread_previous_posts_as_read(request_mock, thread, reply):
+    save_read(request_mock.user, reply)
+
+    make_read_aware(request_mock, thread.first_post)
+    assert thread.first_post.is_read
+    assert not thread.first_post.is_new
+
+
+def test_reading_previous_post_keeps_thread_read_marker(user, thread, reply):
+    save_read(user, reply)
+    save_read(user, thread.first_post)
+
+    thread_read = user.threadread_set.get()
+    assert thread_read.last_read_post_id == reply.id
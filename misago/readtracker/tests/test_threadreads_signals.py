@@ -0,0 +1,57 @@
+from ...threads.test import reply_thread
+from ..models import ThreadRead
+from ..poststracker import save_read
+
+
+def test_merged_thread_keeps_lower_read_marker(user, thread, other_thread):
+    save_read(user, thread.first_post)
+    save_read(user, other_thread.first_post)
+
+    thread.merge(other_thread)
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.thread == thread
+    assert thread_read.last_read_post_id == thread.first_post_id
+
+
+def test_merged_thread_marks_other_thread_posts_as_unread(user, thread, other_thread):
+    reply = reply_thread(thread)
+    save_read(user, reply)
+
+    thread.merge(other_thread)
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.last_read_post_id == other_thread.first_post_id - 1
+
+
+def test_other_thread_read_marker_is_moved_to_merged_thread(user, thread, other_thread):
+    reply = reply_thread(other_thread)
+    save_read(user, reply)
+
+    thread.merge(other_thread)
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.thread == thread
+    assert thread_read.last_read_post_id == thread.first_post_id - 1
+
+
+def test_moved_post_is_marked_as_unread(user, thread, other_thread):
+    post = reply_thread(other_thread)
+    reply = reply_thread(thread)
+    save_read(user, reply)
+
+    post.move(thread)
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.last_read_post_id == post.id - 1
+
+
+def test_moved_thread_read_marker_is_moved_to_new_category(
+    user, thread, other_category
+):
+    save_read(user, thread.first_post)
+
+    thread.move(other_category)
+
+    thread_read = ThreadRead.objects.get(user=user)
+    assert thread_read.category == other_category
@@ -0,0 +1,98 @@
+import pytest
+from django.core.paginator import EmptyPage
+
+from ...threads.models import Thread
+from ...threads.test import post_thread, reply_thread
+from ..poststracker import save_read
+from ..threadslists import filter_read_threads, get_read_threads_page
+
+
+@pytest.fixture
+def threads(default_category):
+    return [post_thread(default_category) for _ in range(4)]
+
+
+def get_page(request_mock, default_category, list_type, per_page, start=0):
+    return get_read_threads_page(
+        request_mock,
+        [default_category],
+        list_type,
+        Thread.objects.filter(category=default_category),
+        per_page,
+        start,
+    )
+
+
+def test_new_threads_page_contains_not_read_threads(
+    request_mock, user, default_category, threads
+):
+    save_read(user, threads[1].first_post)
+
+    page = get_page(request_mock, default_category, "new", 10)
+    assert page.object_list == [threads[3], threads[2], threads[0]]
+    assert not page.next
+
+
+def test_new_threads_page_has_cursor_to_next_page(
+    request_mock, user, default_category, threads
+):
+    save_read(user, threads[2].first_post)
+    save_read(user, threads[1].first_post)
+
+    page = get_page(request_mock, default_category, "new", 1)
+    assert page.object_list == [threads[3]]
+    assert page.next == threads[0].last_post_id
+
+    next_page = get_page(request_mock, default_category, "new", 1, page.next)
+    assert next_page.object_list == [threads[0]]
+    assert not next_page.next
+
+
+def test_unread_threads_page_contains_read_threads_with_new_posts(
+    request_mock, user, default_category, threads
+):
+    for thread in threads:
+        save_read(user, thread.first_post)
+
+    reply_thread(threads[0])
+    reply_thread(threads[2])
+
+    page = get_page(request_mock, default_category, "unread", 10)
+    assert page.object_list == [threads[2], threads[0]]
+
+
+def test_read_threads_page_raises_empty_page_for_empty_next_page(
+    request_mock, user, default_category, threads
+):
+    with pytest.raises(EmptyPage):
+        get_page(request_mock, default_category, "unread", 10, threads[3].last_post_id)
+
+
+def test_read_threads_page_stops_after_batches_limit_with_cursor_to_next_batch(
+    mocker, request_mock, user, default_category, threads
+):
+    mocker.patch("misago.readtracker.threadslists.BATCH_SIZE", 2)
+    mocker.patch("misago.readtracker.threadslists.MAX_BATCHES", 1)
+    for thread in threads[1:]:
+        save_read(user, thread.first_post)
+
+    page = get_page(request_mock, default_category, "new", 1)
+    assert page.object_list == []
+    assert page.next == threads[1].last_post_id
+
+    next_page = get_page(request_mock, default_category, "new", 1, page.next)
+    assert next_page.object_list == [threads[0]]
+    assert not next_page.next
+
+
+def test_read_threads_are_filtered_in_two_queries(
+    request_mock, user, default_category, threads, django_assert_num_queries
+):
+    save_read(user, threads[0].first_post)
+
+    with django_assert_num_queries(2):
+        new_threads = filter_read_threads(
+            request_mock, [default_category], "new", threads
+        )
+
+    assert new_threads == threads[1:]
@@ -0,0 +1,114 @@
+"""
+Query engine for "new" and "unread" threads lists
+
+Instead of filtering threads with subqueries over all visible and read posts,
+lists walk threads by last post ID in batches, check read state of each batch
+with two index lookups and stop as soon as page is filled.
+
+Number of batches checked for single page is limited. If page is not filled
+before the limit is hit, it's returned with cursor to next batch.
+"""
+
+from django.core.paginator import EmptyPage, InvalidPage
+from django.db.models import Max, Min, Q
+
+from ..core.cursorpagination import CursorPage
+from ..threads.models import Post
+from ..threads.permissions import exclude_invisible_posts
+from .cutoffdate import get_cutoff_date
+from .poststracker import get_threads_reads
+
+READ_THREADS_LISTS = ("new", "unread")
+
+BATCH_SIZE = 100
+MAX_BATCHES = 10
+
+
+def get_read_threads_page(
+    request, categories, list_type, queryset, per_page, start=0
+) -> CursorPage:
+    if start < 0:
+        raise InvalidPage()
+
+    cutoff_date = get_cutoff_date(request.settings, request.user)
+
+    # threads with posts older than cutoff date can still have new unapproved
+    # posts that are visible to moderators
+    queryset = queryset.filter(
+        Q(last_post_on__gt=cutoff_date) | Q(has_unapproved_posts=True)
+    ).order_by("-last_post_id")
+    if start:
+        queryset = queryset.filter(last_post_id__lte=start)
+
+    page_len = int(per_page) + 1
+    batch_size = max(page_len, BATCH_SIZE)
+
+    object_list = []
+    next_cursor = None
+
+    batch_queryset = queryset
+    for _ in range(MAX_BATCHES):
+        batch = list(batch_queryset[: batch_size + 1])
+        next_thread = batch.pop() if len(batch) > batch_size else None
+        object_list += filter_read_threads(
+            request, categories, list_type, batch, cutoff_date
+        )
+
+        if len(object_list) >= page_len or not next_thread:
+            break
+
+        batch_queryset = queryset.filter(last_post_id__lte=next_thread.last_post_id)
+    else:
+        # page wasn't filled before batches limit, continue from next thread
+        next_cursor = next_thread.last_post_id
+
+    object_list = object_list[:page_len]
+    if len(object_list) > per_page:
+        next_cursor = object_list.pop(-1).last_post_id
+
+    if start and not object_list and not next_cursor:
+        raise EmptyPage()
+
+    return CursorPage(start, object_list, next_cursor)
+
+
+def filter_read_threads(request, categories, list_type, threads, cutoff_date=None):
+    """Returns threads that belong on "new" or "unread" list."""
+    if not threads:
+        return []
+
+    if not cutoff_date:
+        cutoff_date = get_cutoff_date(request.settings, request.user)
+
+    threads_ids = [thread.id for thread in threads]
+
+    visible_posts = Post.objects.filter(
+        thread_id__in=threads_ids, posted_on__gt=cutoff_date
+    )
+    visible_posts = exclude_invisible_posts(request.user_acl, categories, visible_posts)
+    threads_posts = {
+        row["thread_id"]: (row["first_post_id"], row["last_post_id"])
+        for row in visible_posts.values("thread_id")
+        .annotate(first_post_id=Min("id"), last_post_id=Max("id"))
+        .order_by()
+    }
+
+    threads_reads = get_threads_reads(request.user, threads_ids)
+
+    filtered_threads = []
+    for thread in threads:
+        if thread.id not in threads_posts:
+            continue
+
+        first_post_id, last_post_id = threads_posts[thread.id]
+        last_read_post_id = threads_reads.get(thread.id, 0)
+
+        if list_type == "new":
+            # new threads have no read posts
+            if first_post_id > last_read_post_id:
+                filtered_threads.append(thread)
+        elif first_post_id <= last_read_post_id < last_post_id:
+            # unread threads were read in past but have new posts
+            filtered_threads.append(thread)
+
+    return filtered_threads
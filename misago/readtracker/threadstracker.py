@@ -1,6 +1,7 @@
 from ..threads.models import Post
 from ..threads.permissions import exclude_invisible_posts
 from .cutoffdate import get_cutoff_date
+from .poststracker import exclude_read_posts
 
 
 def make_read_aware(request, threads):
@@ -24,7 +25,7 @@ def make_read_aware(request, threads):
         .distinct()
     )
 
-    queryset = queryset.exclude(id__in=request.user.postread_set.values("post"))
+    queryset = exclude_read_posts(request.user, queryset)
     queryset = exclude_invisible_posts(request.user_acl, categories, queryset)
 
     unread_threads = list(queryset)
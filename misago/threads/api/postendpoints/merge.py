@@ -3,6 +3,8 @@ from django.utils.translation import pgettext
 from rest_framework.response import Response
 
 from ....acl.objectacl import add_acl_to_obj
+from ....readtracker.poststracker import reset_posts_reads
+from ...searchvectors import update_post_search_vector
 from ...serializers import MergePostsSerializer, PostSerializer
 
 
@@ -43,10 +45,9 @@ def posts_merge_endpoint(request, thread):
 
     first_post.save()
 
-    first_post.update_search_vector()
-    first_post.save(update_fields=["search_vector"])
+    first_post.save(update_fields=update_post_search_vector(first_post))
 
-    first_post.postread_set.all().delete()
+    reset_posts_reads(thread, first_post.id)
 
     thread.synchronize()
     thread.save()
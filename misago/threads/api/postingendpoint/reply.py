@@ -6,6 +6,7 @@ from ....markup import common_flavour
 from ....readtracker.poststracker import save_read
 from ....users.audittrail import create_audit_trail
 from ...checksums import update_post_checksum
+from ...searchvectors import update_post_search_vector
 from ...validators import validate_post, validate_post_length, validate_thread_title
 
 
@@ -37,10 +38,10 @@ class ReplyMiddleware(PostingMiddleware):
         self.post.updated_on = self.datetime
         self.post.save()
 
-        self.post.update_search_vector()
         update_post_checksum(self.post)
 
-        self.post.update_fields += ["checksum", "search_vector"]
+        self.post.update_fields.append("checksum")
+        self.post.update_fields += update_post_search_vector(self.post)
 
         if self.mode == PostingEndpoint.START:
             self.thread.set_first_post(self.post)
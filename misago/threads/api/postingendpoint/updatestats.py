@@ -2,14 +2,37 @@ from django.db.models import F
 
 from . import PostingEndpoint, PostingMiddleware
 from ....categories import THREADS_ROOT_NAME
+from ....conf import settings
+from ...statsdeltas import record_stats_delta
 
 
 class UpdateStatsMiddleware(PostingMiddleware):
     def save(self, serializer):
+        if settings.MISAGO_DEFERRED_STATS:
+            self.update_thread(self.thread, self.post)
+            self.record_stats_delta(self.thread.category, self.thread, self.post)
+            return
+
         self.update_user(self.user, self.post)
         self.update_thread(self.thread, self.post)
         self.update_category(self.thread.category, self.thread, self.post)
 
+    def record_stats_delta(self, category, thread, post):
+        if post.is_unapproved or self.mode == PostingEndpoint.EDIT:
+            return  # don't update stats on moderated post or edit
+
+        is_start = self.mode == PostingEndpoint.START
+        delta = {
+            "category_threads": 1 if is_start else 0,
+            "category_posts": 1,
+        }
+
+        if self.thread.thread_type.root_name == THREADS_ROOT_NAME:
+            delta["user_threads"] = 1 if is_start else 0
+            delta["user_posts"] = 1
+
+        record_stats_delta(category, thread, self.user, **delta)
+
     def update_category(self, category, thread, post):
         if post.is_unapproved:
             return  # don't update category on moderated post
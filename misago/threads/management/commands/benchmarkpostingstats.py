@@ -0,0 +1,130 @@
+import time
+from threading import Barrier, Thread
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ....categories.models import Category
+from ...models import Thread as ForumThread
+from ...statsdeltas import record_stats_delta
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures replies per second that concurrent posters can make to their "
+        "own threads in single category, with counters updated in place and "
+        "recorded as deltas. Changes are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            help="number of concurrent posters",
+            type=int,
+            default=8,
+        )
+        parser.add_argument(
+            "--replies",
+            help="number of replies made by each poster",
+            type=int,
+            default=100,
+        )
+        parser.add_argument(
+            "--work-ms",
+            help="time spent in the posting transaction after updating counters",
+            type=float,
+            default=2.0,
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        threads = []
+        last_thread = ForumThread.objects.order_by("-id").first()
+        if last_thread:
+            threads = list(
+                ForumThread.objects.filter(category_id=last_thread.category_id)
+                .select_related("category")
+                .order_by("-id")[:workers]
+            )
+
+        users = list(User.objects.order_by("id")[:workers])
+        if len(threads) < workers or len(users) < workers:
+            raise CommandError(
+                "Benchmark requires one thread in same category and one user "
+                "per worker."
+            )
+
+        for name, update_stats in (
+            ("In-place counters", update_stats_in_place),
+            ("Stats deltas", update_stats_with_delta),
+        ):
+            replies_per_second = run_benchmark(
+                update_stats,
+                threads,
+                users,
+                options["replies"],
+                options["work_ms"] / 1000,
+            )
+            self.stdout.write("%s: %.1f replies/s" % (name, replies_per_second))
+
+
+def run_benchmark(update_stats, threads, users, replies, work_time):
+    barrier = Barrier(len(users) + 1)
+
+    def worker(thread, user):
+        barrier.wait()
+        try:
+            for _ in range(replies):
+                with transaction.atomic():
+                    update_stats(thread, user)
+                    time.sleep(work_time)
+                    transaction.set_rollback(True)
+        finally:
+            connection.close()
+
+    workers = [
+        Thread(target=worker, args=(thread, user))
+        for thread, user in zip(threads, users)
+    ]
+    for worker_thread in workers:
+        worker_thread.start()
+
+    barrier.wait()
+    start_time = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.join()
+
+    return len(users) * replies / (time.perf_counter() - start_time)
+
+
+def update_thread(thread, user):
+    ForumThread.objects.filter(id=thread.id).update(
+        replies=F("replies") + 1,
+        last_post_on=timezone.now(),
+        last_poster=user,
+        last_poster_name=user.username,
+        last_poster_slug=user.slug,
+    )
+
+
+def update_stats_in_place(thread, user):
+    update_thread(thread, user)
+    Category.objects.filter(id=thread.category_id).update(
+        posts=F("posts") + 1,
+        last_post_on=timezone.now(),
+        last_thread=thread,
+        last_poster=user,
+        last_poster_name=user.username,
+        last_poster_slug=user.slug,
+    )
+    User.objects.filter(id=user.id).update(posts=F("posts") + 1)
+
+
+def update_stats_with_delta(thread, user):
+    update_thread(thread, user)
+    record_stats_delta(thread.category, thread, user, category_posts=1, user_posts=1)
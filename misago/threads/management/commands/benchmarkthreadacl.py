@@ -0,0 +1,88 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from ....acl.objectacl import add_acl_to_obj
+from ....acl.useracl import get_user_acl
+from ....cache.versions import get_cache_versions
+from ....conf.shortcuts import get_dynamic_settings
+from ...models import Thread
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures time it takes to add ACL to thread and posts on first page of "
+        "thread with most posts, with annotators called for every object and with "
+        "batch annotators called for all objects at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="ID of user to add ACL for, defaults to first superuser",
+            type=int,
+        )
+        parser.add_argument(
+            "--repeats",
+            help="number of times ACL is added to page",
+            type=int,
+            default=100,
+        )
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            user = User.objects.filter(id=options["user"]).first()
+        else:
+            user = User.objects.filter(is_superuser=True).order_by("id").first()
+
+        thread = (
+            Thread.objects.annotate(posts_count=Count("post"))
+            .select_related("category")
+            .order_by("-posts_count")
+            .first()
+        )
+        if not user or not thread:
+            raise CommandError("Benchmark requires at least one user and one thread.")
+
+        user_acl = get_user_acl(user, get_cache_versions())
+        posts_per_page = get_dynamic_settings().posts_per_page
+        posts = list(
+            thread.post_set.select_related("category", "poster").order_by("id")[
+                :posts_per_page
+            ]
+        )
+        for post in posts:
+            post.thread = thread
+
+        self.stdout.write(
+            "Adding ACL for %s to thread with %s posts...\n" % (user, len(posts))
+        )
+
+        for name, add_acl in (
+            ("Single object annotators", add_acl_to_each_obj),
+            ("Batch annotators", add_acl_to_obj),
+        ):
+            duration = run_benchmark(
+                add_acl, user_acl, thread, posts, options["repeats"]
+            )
+            self.stdout.write(
+                "%s: %.3fs (%.2fms per page)"
+                % (name, duration, duration * 1000 / options["repeats"])
+            )
+
+
+def run_benchmark(add_acl, user_acl, thread, posts, repeats):
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        add_acl_to_obj(user_acl, thread)
+        add_acl(user_acl, posts)
+    return time.perf_counter() - start_time
+
+
+def add_acl_to_each_obj(user_acl, objs):
+    for obj in objs:
+        add_acl_to_obj(user_acl, obj)
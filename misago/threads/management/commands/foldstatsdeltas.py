@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...statsdeltas import fold_stats_deltas
+
+
+class Command(BaseCommand):
+    help = "Folds pending stats deltas into categories and users counters."
+
+    def handle(self, *args, **options):
+        deltas_folded = fold_stats_deltas()
+        self.stdout.write("Stats deltas folded: %s" % deltas_folded)
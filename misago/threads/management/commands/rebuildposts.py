@@ -0,0 +1,126 @@
+import os
+import time
+from multiprocessing import Pool
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from ....core.management.progressbar import show_progress
+from ...postsrebuild import (
+    REBUILD_CHUNK_SIZE,
+    PostsReparse,
+    get_posts_ranges,
+    rebuild_posts_range,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds posts checksums and search, optionally reparsing them, "
+        "in ranges of posts ids processed by pool of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            help="number of worker processes, each with its own database connection",
+            type=int,
+            default=1,
+        )
+        parser.add_argument(
+            "--chunk-size",
+            help="number of posts ids in single range processed by worker",
+            type=int,
+            default=REBUILD_CHUNK_SIZE,
+        )
+        parser.add_argument(
+            "--reparse",
+            help="reparse posts with legacy markup or new parser",
+            choices=[reparse.value for reparse in PostsReparse],
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "path to file with rebuilt ranges, "
+                "ranges listed in it are skipped when command is ran again"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        reparse = PostsReparse(options["reparse"]) if options["reparse"] else None
+        checkpoint = options["checkpoint"]
+
+        posts_ranges = get_posts_ranges(options["chunk_size"])
+        if checkpoint:
+            rebuilt_ranges = read_checkpoint(checkpoint)
+            posts_ranges = [r for r in posts_ranges if r not in rebuilt_ranges]
+
+        if not posts_ranges:
+            self.stdout.write("\n\nNo posts were found")
+            return
+
+        self.stdout.write(
+            "Rebuilding posts in %s ranges with %s workers...\n"
+            % (len(posts_ranges), max(options["workers"], 1))
+        )
+
+        rebuilt_count = 0
+        show_progress(self, 0, len(posts_ranges))
+        start_time = time.time()
+
+        for step, (posts_range, posts_count) in enumerate(
+            rebuild_posts_ranges(posts_ranges, reparse, options["workers"]), 1
+        ):
+            if checkpoint:
+                write_checkpoint(checkpoint, posts_range)
+
+            rebuilt_count += posts_count
+            show_progress(self, step, len(posts_ranges), start_time)
+
+        self.stdout.write("\n\nRebuilt %s posts" % rebuilt_count)
+
+
+def rebuild_posts_ranges(posts_ranges, reparse, workers):
+    if workers <= 1:
+        for posts_range in posts_ranges:
+            yield rebuild_posts_range_task((posts_range, reparse))
+        return
+
+    # Forked workers must not share parent's database connections,
+    # each worker opens its own connection when it runs first query.
+    connections.close_all()
+
+    with Pool(workers, initializer=init_worker) as pool:
+        yield from pool.imap_unordered(
+            rebuild_posts_range_task,
+            [(posts_range, reparse) for posts_range in posts_ranges],
+        )
+
+
+def init_worker():
+    # Setup Django in workers started with "spawn" instead of "fork"
+    django.setup()
+
+
+def rebuild_posts_range_task(args):
+    posts_range, reparse = args
+    return posts_range, rebuild_posts_range(posts_range, reparse)
+
+
+def read_checkpoint(path: str) -> set[tuple[int, int]]:
+    if not os.path.exists(path):
+        return set()
+
+    rebuilt_ranges = set()
+    with open(path) as fp:
+        for line in fp:
+            if line.strip():
+                start, end = line.split(":")
+                rebuilt_ranges.add((int(start), int(end)))
+    return rebuilt_ranges
+
+
+def write_checkpoint(path: str, posts_range: tuple[int, int]):
+    with open(path, "a") as fp:
+        fp.write("%s:%s\n" % posts_range)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...searchvectors import update_outdated_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Updates outdated posts search vectors."
+
+    def handle(self, *args, **options):
+        posts_updated = update_outdated_search_vectors()
+        self.stdout.write("Posts search vectors updated: %s" % posts_updated)
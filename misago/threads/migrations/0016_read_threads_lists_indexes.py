@@ -0,0 +1,27 @@
+# Generated by Django 4.2.10 on 2026-10-17 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("misago_threads", "0015_stats_deltas"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["thread", "posted_on"],
+                include=("id",),
+                name="misago_post_thread_posted_on",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="thread",
+            index=models.Index(
+                fields=["category", "last_post"], name="misago_thre_categor_0590e8_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.10 on 2026-10-17 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("misago_threads", "0016_read_threads_lists_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector_outdated",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("search_vector_outdated", True)),
+                fields=["search_vector_outdated"],
+                name="misago_post_search_outd_part",
+            ),
+        ),
+    ]
@@ -8,3 +8,4 @@ from .attachmenttype import AttachmentType
 from .attachment import Attachment
 from .poll import Poll
 from .pollvote import PollVote
+from .statsdelta import StatsDelta
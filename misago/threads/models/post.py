@@ -76,6 +76,7 @@ class Post(PluginDataModel):
 
     search_document = models.TextField(null=True, blank=True)
     search_vector = SearchVectorField()
+    search_vector_outdated = models.BooleanField(default=False)
 
     class Meta:
         indexes = [
@@ -95,9 +96,19 @@ class Post(PluginDataModel):
                 fields=["is_event", "event_type"],
                 condition=Q(is_event=True),
             ),
+            models.Index(
+                name="misago_post_search_outd_part",
+                fields=["search_vector_outdated"],
+                condition=Q(search_vector_outdated=True),
+            ),
             GinIndex(fields=["search_vector"]),
             # Speed up threadview for team members
             models.Index(fields=["thread", "id"]),
+            models.Index(
+                name="misago_post_thread_posted_on",
+                fields=["thread", "posted_on"],
+                include=["id"],
+            ),
             models.Index(fields=["is_event", "is_hidden"]),
             models.Index(fields=["poster", "posted_on"]),
         ]
@@ -152,9 +163,10 @@ class Post(PluginDataModel):
         if self.is_best_answer:
             self.thread.clear_best_answer()
 
+        old_category_id = self.category_id
         self.category = new_thread.category
         self.thread = new_thread
-        move_post.send(sender=self)
+        move_post.send(sender=self, old_category_id=old_category_id)
 
     @property
     def attachments(self):
@@ -212,6 +224,7 @@ class Post(PluginDataModel):
         self.search_vector = SearchVector(
             "search_document", config=settings.MISAGO_SEARCH_CONFIG
         )
+        self.search_vector_outdated = False
 
     @property
     def short(self):
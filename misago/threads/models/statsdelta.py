@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class StatsDelta(models.Model):
+    """Pending change to category's and user's threads and posts counters.
+
+    Deltas are inserted by the posting process instead of updating counters on
+    the category and user rows, which serializes every poster in busy category
+    on the same row lock. They are folded into the counters in the background.
+    """
+
+    category = models.ForeignKey(
+        "misago_categories.Category", null=True, on_delete=models.CASCADE
+    )
+    thread = models.ForeignKey(
+        "misago_threads.Thread",
+        related_name="+",
+        null=True,
+        on_delete=models.SET_NULL,
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, on_delete=models.CASCADE
+    )
+
+    category_threads = models.IntegerField(default=0)
+    category_posts = models.IntegerField(default=0)
+    user_threads = models.IntegerField(default=0)
+    user_posts = models.IntegerField(default=0)
+
+    created_on = models.DateTimeField(default=timezone.now)
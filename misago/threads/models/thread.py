@@ -148,6 +148,7 @@ class Thread(PluginDataModel):
             models.Index(fields=["category", "id"]),
             models.Index(fields=["category", "last_post_on"]),
             models.Index(fields=["category", "replies"]),
+            models.Index(fields=["category", "last_post"]),
         ]
 
     def __str__(self):
@@ -171,8 +172,9 @@ class Thread(PluginDataModel):
     def move(self, new_category):
         from ..signals import move_thread
 
+        old_category_id = self.category_id
         self.category = new_category
-        move_thread.send(sender=self)
+        move_thread.send(sender=self, old_category_id=old_category_id)
 
     def synchronize(self):
         try:
@@ -2,6 +2,7 @@ from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import pgettext
 
+from ...readtracker.categories import invalidate_categories_reads
 from .exceptions import ModerationError
 
 __all__ = [
@@ -20,6 +21,7 @@ def approve_post(user, post):
 
     post.is_unapproved = False
     post.save(update_fields=["is_unapproved"])
+    invalidate_categories_reads([post.category_id])
     return True
 
 
@@ -61,6 +63,7 @@ def unhide_post(user, post):
 
     post.is_hidden = False
     post.save(update_fields=["is_hidden"])
+    invalidate_categories_reads([post.category_id])
     return True
 
 
@@ -2,7 +2,9 @@ from django.db import transaction
 from django.utils import timezone
 
 from ...notifications.tasks import delete_duplicate_watched_threads
+from ...readtracker.categories import invalidate_categories_reads
 from ..events import record_event
+from ..searchvectors import update_post_search_vector
 
 __all__ = [
     "change_thread_title",
@@ -32,8 +34,7 @@ def change_thread_title(request, thread, new_title):
     thread.first_post.set_search_document(thread.title)
     thread.first_post.save(update_fields=["search_document"])
 
-    thread.first_post.update_search_vector()
-    thread.first_post.save(update_fields=["search_vector"])
+    thread.first_post.save(update_fields=update_post_search_vector(thread.first_post))
 
     record_event(request, thread, "changed_title", {"old_title": old_title})
     return True
@@ -115,6 +116,7 @@ def approve_thread(request, thread):
     unapproved_post_qs = thread.post_set.filter(is_unapproved=True)
     thread.has_unapproved_posts = unapproved_post_qs.exists()
 
+    invalidate_categories_reads([thread.category_id])
     record_event(request, thread, "approved")
     return True
 
@@ -148,6 +150,7 @@ def unhide_thread(request, thread):
     thread.first_post.save(update_fields=["is_hidden"])
     thread.is_hidden = False
 
+    invalidate_categories_reads([thread.category_id])
     record_event(request, thread, "unhid")
 
     if thread.pk == thread.category.last_thread_id:
@@ -13,6 +13,11 @@ from ...admin.forms import YesNoSwitch
 from ...categories.models import Category, CategoryRole
 from ...categories.permissions import get_categories_roles
 from ..models import Post, Thread
+from .visibility import (
+    get_posts_visibility_q,
+    get_threads_visibility_q,
+    get_visibility_plan,
+)
 
 __all__ = [
     "allow_see_thread",
@@ -601,10 +606,231 @@ def add_acl_to_reply(user_acl, post):
         )
 
 
+def add_acl_to_threads(user_acl, threads):
+    """Batch version of add_acl_to_thread
+
+    Reads category ACLs once for every category and replaces permission
+    checks raising exceptions with boolean expressions.
+    """
+    if user_acl["is_anonymous"]:
+        for thread in threads:
+            add_acl_to_thread(user_acl, thread)
+        return
+
+    user_id = user_acl["user_id"]
+    now = timezone.now()
+    categories_acls = {}
+
+    for thread in threads:
+        category_acl = categories_acls.get(thread.category_id)
+        if category_acl is None:
+            category_acl = get_category_threads_acl(user_acl, thread.category_id)
+            categories_acls[thread.category_id] = category_acl
+
+        is_open = category_acl["can_close_threads"] or not (
+            thread.category.is_closed or thread.is_closed
+        )
+
+        is_owner = thread.starter_id == user_id and (
+            not category_acl["thread_edit_time"]
+            or minutes_since(now, thread.started_on) < category_acl["thread_edit_time"]
+        )
+
+        can_pin = bool(category_acl["can_pin_threads"] and is_open)
+        can_hide = bool(
+            is_open
+            and (
+                category_acl["can_hide_threads"]
+                or (category_acl["can_hide_own_threads"] and is_owner)
+            )
+        )
+        can_delete = is_open and (
+            category_acl["can_hide_threads"] == 2
+            or (category_acl["can_hide_own_threads"] == 2 and is_owner)
+        )
+
+        thread.acl.update(
+            {
+                "can_reply": bool(category_acl["can_reply_threads"] and is_open),
+                "can_edit": bool(
+                    is_open
+                    and category_acl["can_edit_threads"]
+                    and (category_acl["can_edit_threads"] != 1 or is_owner)
+                ),
+                "can_pin": can_pin,
+                "can_pin_globally": can_pin and category_acl["can_pin_threads"] == 2,
+                "can_hide": can_hide,
+                "can_unhide": bool(is_open),
+                "can_delete": bool(can_delete),
+                "can_close": category_acl["acl"].get("can_close_threads", False),
+                "can_move": bool(category_acl["can_move_threads"] and is_open),
+                "can_merge": bool(category_acl["can_merge_threads"] and is_open),
+                "can_move_posts": category_acl["acl"].get("can_move_posts", False),
+                "can_merge_posts": category_acl["acl"].get("can_merge_posts", False),
+                "can_approve": bool(category_acl["can_approve_content"] and is_open),
+                "can_see_reports": category_acl["acl"].get("can_see_reports", False),
+            }
+        )
+
+
+def add_acl_to_posts(user_acl, posts):
+    """Batch version of add_acl_to_post
+
+    Reads category ACLs once for every category and checks if user can reply
+    once for every thread, leaving only ownership, time limit and protection
+    checks to be done for every post.
+    """
+    replies = []
+    for post in posts:
+        if post.is_event:
+            add_acl_to_event(user_acl, post)
+        else:
+            replies.append(post)
+
+    if not replies:
+        return
+
+    if user_acl["is_anonymous"]:
+        for post in replies:
+            add_acl_to_reply(user_acl, post)
+        return
+
+    user_id = user_acl["user_id"]
+    now = timezone.now()
+    categories_acls = {}
+    threads_can_reply = {}
+
+    for post in replies:
+        category_acl = categories_acls.get(post.category_id)
+        if category_acl is None:
+            category_acl = get_category_posts_acl(user_acl, post.category_id)
+            categories_acls[post.category_id] = category_acl
+
+        can_reply = threads_can_reply.get(post.thread_id)
+        if can_reply is None:
+            can_reply = can_reply_thread(user_acl, post.thread)
+            threads_can_reply[post.thread_id] = can_reply
+
+        is_open = category_acl["can_close_threads"] or not (
+            post.category.is_closed or post.thread.is_closed
+        )
+        is_visible = not post.is_hidden or category_acl["can_hide_posts"]
+
+        is_owner = (
+            post.poster_id == user_id
+            and (not post.is_protected or category_acl["can_protect_posts"])
+            and (
+                not category_acl["post_edit_time"]
+                or minutes_since(now, post.posted_on) < category_acl["post_edit_time"]
+            )
+        )
+
+        can_edit = bool(
+            is_open
+            and category_acl["can_edit_posts"]
+            and (is_visible or post.is_first_post)
+            and (category_acl["can_edit_posts"] != 1 or is_owner)
+        )
+        can_hide = bool(
+            is_open
+            and not post.is_first_post
+            and (
+                category_acl["can_hide_posts"]
+                or (category_acl["can_hide_own_posts"] and is_owner)
+            )
+        )
+        can_delete = bool(
+            is_open
+            and not post.is_first_post
+            and (
+                category_acl["can_hide_posts"] == 2
+                or (category_acl["can_hide_own_posts"] == 2 and is_owner)
+            )
+        )
+        can_protect = bool(category_acl["can_protect_posts"] and can_edit)
+
+        post_acl = category_acl["acl"]
+        post.acl.update(
+            {
+                "can_reply": can_reply,
+                "can_edit": can_edit,
+                "can_see_hidden": post.is_first_post or post_acl.get("can_hide_posts"),
+                "can_unhide": can_hide,
+                "can_hide": can_hide,
+                "can_delete": can_delete,
+                "can_protect": can_protect,
+                "can_approve": bool(
+                    is_open
+                    and category_acl["can_approve_content"]
+                    and not post.is_first_post
+                    and is_visible
+                ),
+                "can_move": bool(
+                    is_open
+                    and category_acl["can_move_posts"]
+                    and not post.is_first_post
+                    and is_visible
+                ),
+                "can_merge": bool(
+                    is_open
+                    and category_acl["can_merge_posts"]
+                    and (is_visible or post.is_first_post)
+                ),
+                "can_report": post_acl.get("can_report_content", False),
+                "can_see_reports": post_acl.get("can_see_reports", False),
+                "can_see_likes": post_acl.get("can_see_posts_likes", 0),
+                "can_like": False,
+                "can_see_protected": can_protect or user_id == post.poster_id,
+            }
+        )
+
+        if not post.acl["can_see_hidden"]:
+            post.acl["can_see_hidden"] = post.id == post.thread.first_post_id
+        if post.acl["can_see_likes"]:
+            post.acl["can_like"] = post_acl.get("can_like_posts", False)
+
+
+def get_category_threads_acl(user_acl, category_id):
+    category_acl = user_acl["categories"].get(category_id, {})
+    return {
+        "acl": category_acl,
+        "can_reply_threads": category_acl.get("can_reply_threads", False),
+        "can_edit_threads": category_acl.get("can_edit_threads", False),
+        "can_pin_threads": category_acl.get("can_pin_threads", 0),
+        "can_hide_threads": category_acl.get("can_hide_threads", 0),
+        "can_hide_own_threads": category_acl.get("can_hide_own_threads", 0),
+        "can_close_threads": category_acl.get("can_close_threads", False),
+        "can_move_threads": category_acl.get("can_move_threads", 0),
+        "can_merge_threads": category_acl.get("can_merge_threads", 0),
+        "can_approve_content": category_acl.get("can_approve_content", 0),
+        "thread_edit_time": category_acl.get("thread_edit_time", 0),
+    }
+
+
+def get_category_posts_acl(user_acl, category_id):
+    category_acl = user_acl["categories"].get(category_id, {})
+    return {
+        "acl": category_acl,
+        "can_edit_posts": category_acl.get("can_edit_posts", False),
+        "can_hide_posts": category_acl.get("can_hide_posts", 0),
+        "can_hide_own_posts": category_acl.get("can_hide_own_posts", 0),
+        "can_protect_posts": category_acl.get("can_protect_posts", False),
+        "can_approve_content": category_acl.get("can_approve_content", False),
+        "can_move_posts": category_acl.get("can_move_posts", False),
+        "can_merge_posts": category_acl.get("can_merge_posts", False),
+        "can_close_threads": category_acl.get("can_close_threads", False),
+        "post_edit_time": category_acl.get("post_edit_time", 0),
+    }
+
+
+def minutes_since(now, date):
+    return int((now - date).total_seconds() / 60)
+
+
 def register_with(registry):
     registry.acl_annotator(Category, add_acl_to_category)
-    registry.acl_annotator(Thread, add_acl_to_thread)
-    registry.acl_annotator(Post, add_acl_to_post)
+    registry.acl_annotator(Thread, add_acl_to_thread, many=add_acl_to_threads)
+    registry.acl_annotator(Post, add_acl_to_post, many=add_acl_to_posts)
 
 
 def allow_see_thread(user_acl, target):
@@ -1776,107 +2002,13 @@ def has_time_to_edit_post(user_acl, target):
     return True
 
 
-def exclude_invisible_threads(
-    user_acl, categories, queryset
-):  # pylint: disable=too-many-branches
-    show_all = []
-    show_accepted_visible = []
-    show_accepted = []
-    show_visible = []
-    show_owned = []
-    show_owned_visible = []
-
-    for category in categories:
-        add_acl_to_obj(user_acl, category)
-
-        if not (category.acl["can_see"] and category.acl["can_browse"]):
-            continue
-
-        can_hide = category.acl["can_hide_threads"]
-        if category.acl["can_see_all_threads"]:
-            can_mod = category.acl["can_approve_content"]
-
-            if can_mod and can_hide:
-                show_all.append(category)
-            elif user_acl["is_authenticated"]:
-                if not can_mod and not can_hide:
-                    show_accepted_visible.append(category)
-                elif not can_mod:
-                    show_accepted.append(category)
-                elif not can_hide:
-                    show_visible.append(category)
-            else:
-                show_accepted_visible.append(category)
-        elif user_acl["is_authenticated"]:
-            if can_hide:
-                show_owned.append(category)
-            else:
-                show_owned_visible.append(category)
-
-    conditions = None
-    if show_all:
-        conditions = Q(category__in=show_all)
-
-    if show_accepted_visible:
-        if user_acl["is_authenticated"]:
-            condition = Q(
-                Q(starter_id=user_acl["user_id"]) | Q(is_unapproved=False),
-                category__in=show_accepted_visible,
-                is_hidden=False,
-            )
-        else:
-            condition = Q(
-                category__in=show_accepted_visible, is_hidden=False, is_unapproved=False
-            )
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if show_accepted:
-        condition = Q(
-            Q(starter_id=user_acl["user_id"]) | Q(is_unapproved=False),
-            category__in=show_accepted,
-        )
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if show_visible:
-        condition = Q(category__in=show_visible, is_hidden=False)
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if show_owned:
-        condition = Q(category__in=show_owned, starter_id=user_acl["user_id"])
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if show_owned_visible:
-        condition = Q(
-            category__in=show_owned_visible,
-            starter_id=user_acl["user_id"],
-            is_hidden=False,
-        )
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if not conditions:
+def exclude_invisible_threads(user_acl, categories, queryset):
+    plan = get_visibility_plan(user_acl, categories)
+    predicate = get_threads_visibility_q(user_acl, plan)
+    if predicate is None:
         return Thread.objects.none()
 
-    return queryset.filter(conditions)
+    return queryset.filter(predicate)
 
 
 def exclude_invisible_posts(user_acl, categories, queryset):
@@ -1885,61 +2017,13 @@ def exclude_invisible_posts(user_acl, categories, queryset):
     return exclude_invisible_posts_in_category(user_acl, categories, queryset)
 
 
-def exclude_invisible_posts_in_categories(
-    user_acl, categories, queryset
-):  # pylint: disable=too-many-branches
-    show_all = []
-    show_approved = []
-    show_approved_owned = []
-
-    hide_invisible_events = []
-
-    for category in categories:
-        add_acl_to_obj(user_acl, category)
-
-        if category.acl["can_approve_content"]:
-            show_all.append(category.pk)
-        else:
-            if user_acl["is_authenticated"]:
-                show_approved_owned.append(category.pk)
-            else:
-                show_approved.append(category.pk)
-
-        if not category.acl["can_hide_events"]:
-            hide_invisible_events.append(category.pk)
-
-    conditions = None
-    if show_all:
-        conditions = Q(category__in=show_all)
-
-    if show_approved:
-        condition = Q(category__in=show_approved, is_unapproved=False)
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if show_approved_owned:
-        condition = Q(
-            Q(poster_id=user_acl["user_id"]) | Q(is_unapproved=False),
-            category__in=show_approved_owned,
-        )
-
-        if conditions:
-            conditions = conditions | condition
-        else:
-            conditions = condition
-
-    if hide_invisible_events:
-        queryset = queryset.exclude(
-            category__in=hide_invisible_events, is_event=True, is_hidden=True
-        )
-
-    if not conditions:
+def exclude_invisible_posts_in_categories(user_acl, categories, queryset):
+    plan = get_visibility_plan(user_acl, categories)
+    predicate = get_posts_visibility_q(user_acl, plan)
+    if predicate is None:
         return Post.objects.none()
 
-    return queryset.filter(conditions)
+    return queryset.filter(predicate)
 
 
 def exclude_invisible_posts_in_category(user_acl, category, queryset):
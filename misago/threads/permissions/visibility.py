@@ -0,0 +1,167 @@
+from hashlib import md5
+
+from django.db.models import Q
+
+from ...cache.versionedcache import VersionedCache
+from ...conf import settings
+
+VISIBILITY_PLANS_CACHE = "visibility_plans"
+
+
+class VisibilityPlansCache(VersionedCache):
+    """Process-local cache for visibility plans, keyed by user's ACL key and
+    version and categories ids."""
+
+    def get_local_size(self) -> int:
+        return settings.MISAGO_VISIBILITY_PLANS_CACHE_SIZE
+
+    def is_shared(self) -> bool:
+        return False
+
+
+visibility_plans_cache = VisibilityPlansCache(VISIBILITY_PLANS_CACHE)
+
+
+def get_visibility_plan(user_acl: dict, categories) -> dict:
+    """Returns categories ids grouped by what content user can see in them.
+
+    Plan is built from user ACL once for every ACL key, version and categories,
+    instead of annotating every category with ACL on every call.
+    """
+    categories_ids = tuple(dict.fromkeys(category.id for category in categories))
+
+    if not user_acl.get("acl_key"):
+        return build_visibility_plan(user_acl, categories_ids)
+
+    categories_hash = md5(",".join(map(str, categories_ids)).encode()).hexdigest()
+    cache_key = "%s_%s_%s_%s" % (
+        VISIBILITY_PLANS_CACHE,
+        user_acl["acl_key"],
+        user_acl["cache_versions"]["acl"],
+        categories_hash,
+    )
+    return visibility_plans_cache.get_or_build(
+        cache_key, lambda: build_visibility_plan(user_acl, categories_ids)
+    )
+
+
+def build_visibility_plan(user_acl: dict, categories_ids: tuple[int, ...]) -> dict:
+    is_authenticated = user_acl["is_authenticated"]
+    visible_categories = set(user_acl["visible_categories"])
+
+    threads_categories = []
+    see_all_threads = []
+    see_hidden_threads = []
+    see_unapproved_threads = []
+
+    see_unapproved_posts = []
+    hide_hidden_events = []
+
+    for category_id in categories_ids:
+        category_acl = user_acl["categories"].get(category_id, {})
+        can_approve_content = is_authenticated and get_acl_value(
+            category_acl, "can_approve_content"
+        )
+
+        if can_approve_content:
+            see_unapproved_posts.append(category_id)
+        if not is_authenticated or not get_acl_value(category_acl, "can_hide_events"):
+            hide_hidden_events.append(category_id)
+
+        if category_id not in visible_categories or not category_acl.get("can_browse"):
+            continue
+
+        can_see_all_threads = get_acl_value(category_acl, "can_see_all_threads")
+        if not is_authenticated and not can_see_all_threads:
+            continue
+
+        threads_categories.append(category_id)
+        if can_see_all_threads:
+            see_all_threads.append(category_id)
+        if is_authenticated and get_acl_value(category_acl, "can_hide_threads"):
+            see_hidden_threads.append(category_id)
+        if can_approve_content:
+            see_unapproved_threads.append(category_id)
+
+    return {
+        "threads": {
+            "categories": tuple(threads_categories),
+            "see_all": get_plan_subset(threads_categories, see_all_threads),
+            "see_hidden": get_plan_subset(threads_categories, see_hidden_threads),
+            "see_unapproved": get_plan_subset(
+                threads_categories, see_unapproved_threads
+            ),
+        },
+        "posts": {
+            "categories": categories_ids,
+            "see_unapproved": get_plan_subset(categories_ids, see_unapproved_posts),
+            "hide_hidden_events": get_plan_subset(categories_ids, hide_hidden_events),
+        },
+    }
+
+
+def get_acl_value(category_acl: dict, permission: str) -> int:
+    return max(category_acl.get(permission, 0), 0)
+
+
+def get_plan_subset(categories_ids, subset: list[int]) -> tuple[int, ...] | None:
+    """Returns subset of categories ids or None if it includes all of them."""
+    if len(subset) == len(categories_ids):
+        return None
+    return tuple(subset)
+
+
+def get_threads_visibility_q(user_acl: dict, plan: dict) -> Q | None:
+    """Returns predicate for threads user can see in plan's categories, or None
+    if there are no such threads."""
+    plan = plan["threads"]
+    if not plan["categories"]:
+        return None
+
+    user_id = user_acl["user_id"] if user_acl["is_authenticated"] else None
+    predicate = Q(category_id__in=plan["categories"])
+
+    if plan["see_all"] is not None:
+        # Anonymous users only see categories in which they can see all threads
+        predicate &= get_categories_or_q(plan["see_all"], Q(starter_id=user_id))
+
+    if plan["see_hidden"] is not None:
+        predicate &= get_categories_or_q(plan["see_hidden"], Q(is_hidden=False))
+
+    if plan["see_unapproved"] is not None:
+        condition = Q(is_unapproved=False)
+        if user_id:
+            condition |= Q(starter_id=user_id)
+        predicate &= get_categories_or_q(plan["see_unapproved"], condition)
+
+    return predicate
+
+
+def get_posts_visibility_q(user_acl: dict, plan: dict) -> Q | None:
+    """Returns predicate for posts user can see in plan's categories, or None
+    if there are no such posts."""
+    plan = plan["posts"]
+    if not plan["categories"]:
+        return None
+
+    predicate = Q(category_id__in=plan["categories"])
+
+    if plan["see_unapproved"] is not None:
+        condition = Q(is_unapproved=False)
+        if user_acl["is_authenticated"]:
+            condition |= Q(poster_id=user_acl["user_id"])
+        predicate &= get_categories_or_q(plan["see_unapproved"], condition)
+
+    if plan["hide_hidden_events"] != ():
+        condition = Q(is_event=True, is_hidden=True)
+        if plan["hide_hidden_events"] is not None:
+            condition &= Q(category_id__in=plan["hide_hidden_events"])
+        predicate &= ~condition
+
+    return predicate
+
+
+def get_categories_or_q(categories_ids: tuple[int, ...], condition: Q) -> Q:
+    if categories_ids:
+        return Q(category_id__in=categories_ids) | condition
+    return condition
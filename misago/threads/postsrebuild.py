@@ -0,0 +1,135 @@
+from enum import StrEnum
+from urllib.parse import urlparse
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.postgres.search import SearchVector
+from django.db import transaction
+from django.db.models import Max, Min
+
+from ..cache.versions import get_cache_versions
+from ..conf import settings
+from ..conf.shortcuts import get_dynamic_settings
+from ..markup import common_flavour
+from ..parser.context import create_parser_context
+from ..parser.enums import ContentType
+from ..parser.factory import create_parser
+from ..parser.html import render_ast_to_html
+from ..parser.metadata import create_asts_metadata
+from ..parser.searchdocument import render_search_document
+from ..permissions.proxy import UserPermissionsProxy
+from .checksums import update_post_checksum
+from .filtersearch import filter_search
+from .models import Post
+
+REBUILD_CHUNK_SIZE = 1000
+
+
+class PostsReparse(StrEnum):
+    MARKUP = "markup"
+    PARSER = "parser"
+
+
+class RebuildRequest:
+    """Stands in for request in legacy markup parser, which only reads its host."""
+
+    def __init__(self, dynamic_settings):
+        self.user = AnonymousUser()
+        self.settings = dynamic_settings
+        self.host = urlparse(dynamic_settings.forum_address or "").netloc
+
+    def get_host(self) -> str:
+        return self.host
+
+
+def get_posts_ranges(chunk_size: int = REBUILD_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Splits posts into ranges of ids, each range including its start only."""
+    ids_range = Post.objects.filter(is_event=False).aggregate(
+        min_id=Min("id"), max_id=Max("id")
+    )
+    if ids_range["min_id"] is None:
+        return []
+
+    return [
+        (start, start + chunk_size)
+        for start in range(ids_range["min_id"], ids_range["max_id"] + 1, chunk_size)
+    ]
+
+
+def rebuild_posts_range(
+    posts_range: tuple[int, int], reparse: PostsReparse | None = None
+) -> int:
+    """Rebuilds checksums and search of posts in range, returns number of posts.
+
+    Posts are written back with single bulk update and their search vectors
+    are updated by single query afterwards, because vectors are created from
+    search documents already stored in the database.
+    """
+    start, end = posts_range
+    queryset = Post.objects.select_related("thread", "poster").filter(
+        is_event=False, id__gte=start, id__lt=end
+    )
+
+    with transaction.atomic():
+        posts = list(queryset.order_by("id").select_for_update(of=("self",)))
+        if not posts:
+            return 0
+
+        update_fields = ["search_document", "checksum"]
+        if reparse:
+            update_fields.append("parsed")
+
+        if reparse == PostsReparse.MARKUP:
+            reparse_posts_markup(posts)
+        elif reparse == PostsReparse.PARSER:
+            reparse_posts_parser(posts)
+        else:
+            for post in posts:
+                post.set_search_document(get_post_thread_title(post))
+
+        for post in posts:
+            update_post_checksum(post)
+
+        Post.objects.bulk_update(posts, update_fields)
+        Post.objects.filter(id__in=[post.id for post in posts]).update(
+            search_vector=SearchVector(
+                "search_document", config=settings.MISAGO_SEARCH_CONFIG
+            ),
+            search_vector_outdated=False,
+        )
+
+    return len(posts)
+
+
+def reparse_posts_markup(posts: list[Post]):
+    request = RebuildRequest(get_dynamic_settings())
+    for post in posts:
+        parsing_result = common_flavour(request, post.poster, post.original)
+        post.parsed = parsing_result["parsed_text"]
+        post.set_search_document(get_post_thread_title(post))
+
+
+def reparse_posts_parser(posts: list[Post]):
+    cache_versions = get_cache_versions()
+    context = create_parser_context(
+        user_permissions=UserPermissionsProxy(AnonymousUser(), cache_versions),
+        cache_versions=cache_versions,
+        settings=get_dynamic_settings(),
+        content_type=ContentType.POST,
+    )
+    parser = create_parser(context)
+
+    asts = [parser(post.original) for post in posts]
+    metadatas = create_asts_metadata(context, asts)
+
+    for post, ast, metadata in zip(posts, asts, metadatas):
+        post.parsed = render_ast_to_html(context, ast, metadata)
+        search_document = render_search_document(context, ast, metadata)
+        if thread_title := get_post_thread_title(post):
+            search_document = "\n\n".join([thread_title, search_document])
+        post.search_document = filter_search(search_document)
+
+
+def get_post_thread_title(post: Post) -> str | None:
+    if post.id == post.thread.first_post_id:
+        return post.thread.title
+    return None
@@ -0,0 +1,48 @@
+from django.contrib.postgres.search import SearchVector
+from django.db import transaction
+
+from ..conf import settings
+from .models import Post
+
+UPDATE_BATCH_SIZE = 500
+
+
+def update_post_search_vector(post: Post) -> list[str]:
+    """Updates post's search vector or marks it for update in background.
+
+    Returns list of post's fields that have to be saved.
+    """
+    if settings.MISAGO_DEFERRED_SEARCH_VECTORS:
+        post.search_vector_outdated = True
+        return ["search_vector_outdated"]
+
+    post.update_search_vector()
+    return ["search_vector", "search_vector_outdated"]
+
+
+def update_outdated_search_vectors(batch_size: int = UPDATE_BATCH_SIZE) -> int:
+    """Updates outdated posts search vectors, returns number of updated posts."""
+    updated = 0
+    while True:
+        with transaction.atomic():
+            posts_ids = list(
+                Post.objects.select_for_update(skip_locked=True)
+                .filter(search_vector_outdated=True)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not posts_ids:
+                break
+
+            Post.objects.filter(id__in=posts_ids).update(
+                search_vector=SearchVector(
+                    "search_document", config=settings.MISAGO_SEARCH_CONFIG
+                ),
+                search_vector_outdated=False,
+            )
+
+        updated += len(posts_ids)
+        if len(posts_ids) < batch_size:
+            break
+
+    return updated
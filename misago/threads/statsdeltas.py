@@ -0,0 +1,174 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, Sum
+
+from ..categories.models import Category
+from .models import StatsDelta, Thread
+
+User = get_user_model()
+
+FOLD_BATCH_SIZE = 1000
+
+
+def record_stats_delta(
+    category=None,
+    thread=None,
+    user=None,
+    *,
+    category_threads: int = 0,
+    category_posts: int = 0,
+    user_threads: int = 0,
+    user_posts: int = 0,
+) -> StatsDelta:
+    return StatsDelta.objects.create(
+        category=category,
+        thread=thread,
+        user=user,
+        category_threads=category_threads,
+        category_posts=category_posts,
+        user_threads=user_threads,
+        user_posts=user_posts,
+    )
+
+
+def discard_category_stats_deltas(category):
+    """Discards category's pending deltas before its counters are recounted.
+
+    Deltas are detached from the category instead of being deleted, because
+    they still carry pending changes to their users counters.
+    """
+    StatsDelta.objects.filter(category=category).update(
+        category=None, category_threads=0, category_posts=0
+    )
+
+
+def discard_user_stats_deltas(user):
+    """Discards user's pending deltas before their counters are recounted."""
+    StatsDelta.objects.filter(user=user).update(user=None, user_threads=0, user_posts=0)
+
+
+def get_category_stats(category) -> dict[str, int]:
+    """Returns category's threads and posts counters including pending deltas."""
+    pending = StatsDelta.objects.filter(category=category).aggregate(
+        threads=Sum("category_threads"), posts=Sum("category_posts")
+    )
+
+    return {
+        "threads": category.threads + (pending["threads"] or 0),
+        "posts": category.posts + (pending["posts"] or 0),
+    }
+
+
+def get_user_stats(user) -> dict[str, int]:
+    """Returns user's threads and posts counters including pending deltas."""
+    pending = StatsDelta.objects.filter(user=user).aggregate(
+        threads=Sum("user_threads"), posts=Sum("user_posts")
+    )
+
+    return {
+        "threads": user.threads + (pending["threads"] or 0),
+        "posts": user.posts + (pending["posts"] or 0),
+    }
+
+
+def fold_stats_deltas(batch_size: int = FOLD_BATCH_SIZE) -> int:
+    """Folds pending deltas into the counters, returns number of folded deltas."""
+    folded = 0
+    while True:
+        with transaction.atomic():
+            deltas = list(
+                StatsDelta.objects.select_for_update(skip_locked=True).order_by("id")[
+                    :batch_size
+                ]
+            )
+            if not deltas:
+                break
+
+            fold_categories_deltas(deltas)
+            fold_users_deltas(deltas)
+
+            StatsDelta.objects.filter(id__in=[delta.id for delta in deltas]).delete()
+
+        folded += len(deltas)
+        if len(deltas) < batch_size:
+            break
+
+    return folded
+
+
+def fold_categories_deltas(deltas: list[StatsDelta]):
+    categories_deltas: dict[int, dict] = {}
+    for delta in deltas:
+        if not delta.category_id:
+            continue
+
+        category_delta = categories_deltas.setdefault(
+            delta.category_id, {"threads": 0, "posts": 0, "threads_ids": set()}
+        )
+        category_delta["threads"] += delta.category_threads
+        category_delta["posts"] += delta.category_posts
+        if delta.thread_id:
+            category_delta["threads_ids"].add(delta.thread_id)
+
+    if not categories_deltas:
+        return
+
+    threads_ids = set()
+    for category_delta in categories_deltas.values():
+        threads_ids.update(category_delta["threads_ids"])
+
+    last_threads: dict[int, Thread] = {}
+    threads_queryset = Thread.objects.filter(
+        id__in=threads_ids, is_hidden=False, is_unapproved=False
+    ).order_by("last_post_on")
+    for thread in threads_queryset:
+        last_threads[thread.category_id] = thread
+
+    categories_queryset = (
+        Category.objects.select_for_update()
+        .filter(id__in=categories_deltas)
+        .order_by("id")
+    )
+    for category in categories_queryset:
+        category_delta = categories_deltas[category.id]
+        category.threads = max(category.threads + category_delta["threads"], 0)
+        category.posts = max(category.posts + category_delta["posts"], 0)
+
+        last_thread = last_threads.get(category.id)
+        if last_thread and (
+            not category.last_post_on
+            or category.last_post_on <= last_thread.last_post_on
+        ):
+            category.set_last_thread(last_thread)
+
+        category.save(
+            update_fields=[
+                "threads",
+                "posts",
+                "last_post_on",
+                "last_thread",
+                "last_thread_title",
+                "last_thread_slug",
+                "last_poster",
+                "last_poster_name",
+                "last_poster_slug",
+            ]
+        )
+
+
+def fold_users_deltas(deltas: list[StatsDelta]):
+    users_deltas: dict[int, dict] = {}
+    for delta in deltas:
+        if delta.user_id and (delta.user_threads or delta.user_posts):
+            user_delta = users_deltas.setdefault(
+                delta.user_id, {"threads": 0, "posts": 0}
+            )
+            user_delta["threads"] += delta.user_threads
+            user_delta["posts"] += delta.user_posts
+
+    for user_id in sorted(users_deltas):
+        user_delta = users_deltas[user_id]
+        User.objects.filter(id=user_id).update(
+            threads=F("threads") + user_delta["threads"],
+            posts=F("posts") + user_delta["posts"],
+        )
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from .searchvectors import update_outdated_search_vectors
+from .statsdeltas import fold_stats_deltas
+
+
+@shared_task(name="threads.fold-stats-deltas", serializer="json")
+def fold_pending_stats_deltas():
+    fold_stats_deltas()
+
+
+@shared_task(name="threads.update-search-vectors", serializer="json")
+def update_posts_search_vectors():
+    update_outdated_search_vectors()
@@ -0,0 +1,119 @@
+from io import StringIO
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.management import call_command
+
+from ...conf import settings
+from ..management.commands import rebuildposts
+from ..models import Post
+from ..postsrebuild import PostsReparse, get_posts_ranges, rebuild_posts_range
+from ..test import reply_thread
+
+
+def search_posts(text):
+    return Post.objects.filter(
+        search_vector=SearchQuery(text, config=settings.MISAGO_SEARCH_CONFIG)
+    )
+
+
+def call_rebuildposts(*args):
+    out = StringIO()
+    call_command(rebuildposts.Command(), *args, stdout=out)
+    return out.getvalue().splitlines()[-1].strip()
+
+
+def test_posts_ranges_are_empty_if_there_are_no_posts(db):
+    assert get_posts_ranges() == []
+
+
+def test_posts_ranges_cover_all_posts_ids(thread):
+    posts = [reply_thread(thread) for _ in range(4)]
+    first_id = thread.first_post_id
+
+    ranges = get_posts_ranges(2)
+    assert ranges[0] == (first_id, first_id + 2)
+    assert ranges[-1][1] > posts[-1].id
+    assert len(ranges) == 3
+
+
+def test_posts_range_rebuild_updates_checksums_and_search(thread):
+    post = reply_thread(thread, message="Lorem ipsum")
+    Post.objects.update(checksum="-", search_document="")
+
+    rebuilt = rebuild_posts_range((thread.first_post_id, post.id + 1))
+    assert rebuilt == 2
+
+    post.refresh_from_db()
+    assert post.is_valid
+    assert post.search_document == "Lorem ipsum"
+    assert list(search_posts("lorem")) == [post]
+
+
+def test_posts_range_rebuild_includes_thread_title_in_first_post_search(thread):
+    rebuild_posts_range((thread.first_post_id, thread.first_post_id + 1))
+
+    thread.first_post.refresh_from_db()
+    assert thread.first_post.search_document.startswith(thread.title)
+
+
+def test_posts_range_rebuild_skips_posts_outside_of_range(thread):
+    post = reply_thread(thread, message="Lorem ipsum")
+    Post.objects.update(checksum="-")
+
+    assert rebuild_posts_range((thread.first_post_id, post.id)) == 1
+
+    post.refresh_from_db()
+    assert not post.is_valid
+
+
+def test_posts_range_rebuild_reparses_posts_with_markup(thread):
+    post = reply_thread(thread, message="Hello **world**!")
+    Post.objects.filter(id=post.id).update(parsed="<p>Outdated</p>")
+
+    rebuild_posts_range((post.id, post.id + 1), PostsReparse.MARKUP)
+
+    post.refresh_from_db()
+    assert post.parsed == "<p>Hello <strong>world</strong>!</p>"
+    assert post.is_valid
+
+
+def test_posts_range_rebuild_reparses_posts_with_parser(thread):
+    post = reply_thread(thread, message="Hello **world**!")
+    Post.objects.filter(id=post.id).update(parsed="<p>Outdated</p>")
+
+    rebuild_posts_range((post.id, post.id + 1), PostsReparse.PARSER)
+
+    post.refresh_from_db()
+    assert post.parsed == "<p>Hello <strong>world</strong>!</p>"
+    assert post.search_document == "Hello world!"
+    assert post.is_valid
+
+
+def test_rebuildposts_command_handles_no_posts(db):
+    assert call_rebuildposts() == "No posts were found"
+
+
+def test_rebuildposts_command_rebuilds_posts(thread):
+    [reply_thread(thread) for _ in range(3)]
+    Post.objects.update(checksum="-")
+
+    assert call_rebuildposts("--chunk-size=2") == "Rebuilt 4 posts"
+    for post in Post.objects.all():
+        assert post.is_valid
+
+
+def test_rebuildposts_command_skips_ranges_from_checkpoint(tmp_path, thread):
+    checkpoint = tmp_path / "checkpoint"
+    [reply_thread(thread) for _ in range(3)]
+
+    assert call_rebuildposts("--chunk-size=2", f"--checkpoint={checkpoint}") == (
+        "Rebuilt 4 posts"
+    )
+    assert len(checkpoint.read_text().splitlines()) == 2
+
+    Post.objects.update(checksum="-")
+    assert call_rebuildposts("--chunk-size=2", f"--checkpoint={checkpoint}") == (
+        "No posts were found"
+    )
+    for post in Post.objects.all():
+        assert not post.is_valid
@@ -0,0 +1,97 @@
+from io import StringIO
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from ...conf import settings
+from ..management.commands import updatesearchvectors
+from ..models import Post
+from ..searchvectors import update_outdated_search_vectors, update_post_search_vector
+from ..test import reply_thread
+
+
+def search_posts(text):
+    return Post.objects.filter(
+        search_vector=SearchQuery(text, config=settings.MISAGO_SEARCH_CONFIG)
+    )
+
+
+def test_post_search_vector_is_updated_in_place(thread):
+    post = reply_thread(thread, message="Lorem ipsum")
+    post.set_search_document()
+    post.save()
+
+    assert update_post_search_vector(post) == [
+        "search_vector",
+        "search_vector_outdated",
+    ]
+    post.save()
+
+    assert list(search_posts("lorem")) == [post]
+
+
+@override_settings(MISAGO_DEFERRED_SEARCH_VECTORS=True)
+def test_deferred_post_search_vector_is_marked_as_outdated(thread):
+    post = reply_thread(thread, message="Lorem ipsum")
+    post.set_search_document()
+
+    assert update_post_search_vector(post) == ["search_vector_outdated"]
+    post.save()
+
+    post.refresh_from_db()
+    assert post.search_vector_outdated
+    assert not search_posts("lorem").exists()
+
+
+def test_outdated_search_vectors_are_updated(thread):
+    post = reply_thread(thread, message="Lorem ipsum")
+    post.set_search_document()
+    post.search_vector_outdated = True
+    post.save()
+
+    assert update_outdated_search_vectors() == 1
+
+    post.refresh_from_db()
+    assert not post.search_vector_outdated
+    assert list(search_posts("lorem")) == [post]
+
+
+def test_outdated_search_vectors_are_updated_in_batches(thread):
+    for _ in range(5):
+        post = reply_thread(thread, message="Lorem ipsum")
+        post.set_search_document()
+        post.search_vector_outdated = True
+        post.save()
+
+    assert update_outdated_search_vectors(batch_size=2) == 5
+    assert not Post.objects.filter(search_vector_outdated=True).exists()
+    assert search_posts("lorem").count() == 5
+
+
+@override_settings(MISAGO_DEFERRED_SEARCH_VECTORS=True)
+def test_reply_defers_search_vector_update(mocker, user_client, thread):
+    mocker.patch(
+        "misago.threads.api.postingendpoint.notifications.notify_on_new_thread_reply"
+    )
+
+    response = user_client.post(
+        reverse("misago:api:thread-post-list", kwargs={"thread_pk": thread.pk}),
+        data={"post": "Lorem ipsum dolor met!"},
+    )
+    assert response.status_code == 200
+
+    post = Post.objects.get(id=response.json()["id"])
+    assert post.search_vector_outdated
+    assert not search_posts("lorem").exists()
+
+    update_outdated_search_vectors()
+    assert list(search_posts("lorem")) == [post]
+
+
+def test_management_command_displays_number_of_updated_posts(db):
+    out = StringIO()
+    call_command(updatesearchvectors.Command(), stdout=out)
+    command_output = out.getvalue().splitlines()[0].strip()
+    assert command_output == "Posts search vectors updated: 0"
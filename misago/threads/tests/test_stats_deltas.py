@@ -0,0 +1,165 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from ...users.management.commands import synchronizeusers
+from ..management.commands import foldstatsdeltas
+from ..models import StatsDelta
+from ..statsdeltas import (
+    fold_stats_deltas,
+    get_category_stats,
+    get_user_stats,
+    record_stats_delta,
+)
+from ..test import post_thread
+
+
+def test_category_stats_include_pending_deltas(default_category, thread, user):
+    default_category.refresh_from_db()
+    record_stats_delta(default_category, thread, user, category_posts=2)
+    record_stats_delta(default_category, thread, user, category_threads=1)
+
+    stats = get_category_stats(default_category)
+    assert stats["threads"] == default_category.threads + 1
+    assert stats["posts"] == default_category.posts + 2
+
+
+def test_user_stats_include_pending_deltas(default_category, thread, user):
+    record_stats_delta(default_category, thread, user, user_threads=1, user_posts=3)
+
+    stats = get_user_stats(user)
+    assert stats["threads"] == user.threads + 1
+    assert stats["posts"] == user.posts + 3
+
+
+def test_folding_deltas_updates_counters_and_deletes_deltas(
+    default_category, thread, user
+):
+    default_category.refresh_from_db()
+    record_stats_delta(
+        default_category,
+        thread,
+        user,
+        category_threads=1,
+        category_posts=1,
+        user_threads=1,
+        user_posts=1,
+    )
+    record_stats_delta(default_category, thread, user, category_posts=1, user_posts=1)
+
+    assert fold_stats_deltas() == 2
+    assert not StatsDelta.objects.exists()
+
+    old_threads, old_posts = default_category.threads, default_category.posts
+    default_category.refresh_from_db()
+    assert default_category.threads == old_threads + 1
+    assert default_category.posts == old_posts + 2
+
+    user.refresh_from_db()
+    assert user.threads == 1
+    assert user.posts == 2
+
+
+def test_folding_deltas_sets_category_last_thread(default_category, user):
+    thread = post_thread(default_category, title="Newest thread")
+    default_category.empty_last_thread()
+    default_category.save()
+
+    record_stats_delta(default_category, thread, user, category_threads=1)
+    fold_stats_deltas()
+
+    default_category.refresh_from_db()
+    assert default_category.last_thread == thread
+    assert default_category.last_thread_title == "Newest thread"
+
+
+def test_category_synchronization_discards_pending_deltas(
+    default_category, thread, user
+):
+    record_stats_delta(default_category, thread, user, category_posts=1, user_posts=1)
+
+    default_category.synchronize()
+    default_category.save()
+    synchronized_posts = default_category.posts
+
+    assert get_category_stats(default_category)["posts"] == synchronized_posts
+    assert get_user_stats(user)["posts"] == user.posts + 1
+
+    fold_stats_deltas()
+
+    default_category.refresh_from_db()
+    assert default_category.posts == synchronized_posts
+
+    user.refresh_from_db()
+    assert user.posts == 1
+
+
+def test_users_synchronization_discards_pending_deltas(default_category, thread, user):
+    record_stats_delta(default_category, thread, user, category_posts=1, user_posts=1)
+
+    call_command(synchronizeusers.Command(), stdout=StringIO())
+    fold_stats_deltas()
+
+    user.refresh_from_db()
+    assert user.posts == 0
+
+
+def test_folding_deltas_in_batches(default_category, thread, user):
+    for _ in range(5):
+        record_stats_delta(default_category, thread, user, user_posts=1)
+
+    assert fold_stats_deltas(batch_size=2) == 5
+
+    user.refresh_from_db()
+    assert user.posts == 5
+
+
+@override_settings(MISAGO_DEFERRED_STATS=True)
+def test_reply_records_stats_delta_with_deferred_stats(
+    mocker, user_client, default_category, thread, user
+):
+    mocker.patch(
+        "misago.threads.api.postingendpoint.notifications.notify_on_new_thread_reply"
+    )
+
+    default_category.refresh_from_db()
+    response = user_client.post(
+        reverse("misago:api:thread-post-list", kwargs={"thread_pk": thread.pk}),
+        data={"post": "This is test reply!"},
+    )
+    assert response.status_code == 200
+
+    delta = StatsDelta.objects.get()
+    assert delta.category == default_category
+    assert delta.user == user
+    assert delta.category_posts == 1
+    assert delta.user_posts == 1
+
+    old_posts = default_category.posts
+    default_category.refresh_from_db()
+    assert default_category.posts == old_posts
+    assert get_category_stats(default_category)["posts"] == old_posts + 1
+
+    thread.refresh_from_db()
+    assert thread.replies == 1
+
+    # Category's last thread is updated when deltas are folded
+    assert default_category.last_post_on < thread.last_post_on
+
+    fold_stats_deltas()
+
+    default_category.refresh_from_db()
+    assert default_category.last_post_on == thread.last_post_on
+
+
+def test_management_command_displays_number_of_folded_deltas(
+    default_category, thread, user
+):
+    record_stats_delta(default_category, thread, user, user_posts=1)
+
+    out = StringIO()
+    call_command(foldstatsdeltas.Command(), stdout=out)
+    command_output = out.getvalue().splitlines()[0].strip()
+    assert command_output == "Stats deltas folded: 1"
@@ -254,15 +254,14 @@ class ThreadMergeApiTests(ThreadsApiTestCase):
             },
         )
 
-        # posts reads are kept
-        postreads = self.user.postread_set.filter(post__is_event=False).order_by("id")
-
-        self.assertEqual(
-            list(postreads.values_list("post_id", flat=True)),
-            [self.thread.first_post_id, other_thread.first_post_id],
-        )
-        self.assertEqual(postreads.filter(thread=other_thread).count(), 2)
-        self.assertEqual(postreads.filter(category=self.other_category).count(), 2)
+        # threads reads are kept
+        thread_read = self.user.threadread_set.get()
+        self.assertEqual(thread_read.thread, other_thread)
+        self.assertEqual(thread_read.category, self.other_category)
+
+        # merge event was read by its author
+        merge_event = other_thread.post_set.filter(is_event=True).latest("id")
+        self.assertEqual(thread_read.last_read_post_id, merge_event.id)
 
     @patch_other_category_acl({"can_merge_threads": True})
     @patch_category_acl({"can_merge_threads": True})
@@ -633,5 +633,6 @@ class ThreadPostMergeApiTestCase(AuthenticatedUserTestCase):
         )
         self.assertEqual(response.status_code, 200)
 
-        # both post's were removed from readtracker
-        self.assertEqual(self.user.postread_set.count(), 0)
+        # merged post is unread
+        thread_read = self.user.threadread_set.get()
+        self.assertEqual(thread_read.last_read_post_id, post_a.pk - 1)
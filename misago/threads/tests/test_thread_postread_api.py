@@ -33,16 +33,6 @@ class PostReadApiTests(ThreadsApiTestCase):
 
     def test_read_post(self):
         """api marks post as read"""
-        response = self.client.post(self.api_link)
-        self.assertEqual(response.status_code, 200)
-
-        self.assertEqual(self.user.postread_set.count(), 1)
-        self.user.postread_set.get(post=self.post)
-
-        # one post read, first post is still unread
-        self.assertFalse(response.json()["thread_is_read"])
-
-        # read second post
         response = self.client.post(
             reverse(
                 "misago:api:thread-post-read",
@@ -51,12 +41,28 @@ class PostReadApiTests(ThreadsApiTestCase):
         )
         self.assertEqual(response.status_code, 200)
 
-        self.assertEqual(self.user.postread_set.count(), 2)
-        self.user.postread_set.get(post=self.thread.first_post)
+        thread_read = self.user.threadread_set.get()
+        self.assertEqual(thread_read.last_read_post_id, self.thread.first_post.pk)
+
+        # first post read, second post is still unread
+        self.assertFalse(response.json()["thread_is_read"])
+
+        # read second post
+        response = self.client.post(self.api_link)
+        self.assertEqual(response.status_code, 200)
+
+        thread_read = self.user.threadread_set.get()
+        self.assertEqual(thread_read.last_read_post_id, self.post.pk)
 
         # both posts are read
         self.assertTrue(response.json()["thread_is_read"])
 
+    def test_read_post_marks_previous_posts_as_read(self):
+        """api marks thread as read when its last post is read"""
+        response = self.client.post(self.api_link)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["thread_is_read"])
+
 
 def test_read_watched_thread_post_updates_watching_read_at_if_its_older_than_post(
     user, user_client, thread, reply, watched_thread_factory
@@ -0,0 +1,207 @@
+import itertools
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ...acl.objectacl import add_acl_to_obj
+from ...categories.models import Category
+from ..models import Post, Thread
+from ..permissions.threads import (
+    add_acl_to_post,
+    add_acl_to_posts,
+    add_acl_to_thread,
+    add_acl_to_threads,
+)
+
+USER_ID = 1
+OTHER_USER_ID = 2
+
+
+def get_user_acl(category_acl, is_anonymous=False):
+    return {
+        "user_id": None if is_anonymous else USER_ID,
+        "is_authenticated": not is_anonymous,
+        "is_anonymous": is_anonymous,
+        "categories": {1: category_acl},
+    }
+
+
+def get_threads_categories_acls():
+    for values in itertools.product(
+        (False, True),  # can_reply_threads
+        (0, 1, 2),  # can_edit_threads
+        (0, 2),  # can_pin_threads
+        (0, 1, 2),  # can_hide_threads
+        (0, 1, 2),  # can_hide_own_threads
+        (False, True),  # can_close_threads
+        (0, 30),  # thread_edit_time
+    ):
+        yield {
+            "can_reply_threads": values[0],
+            "can_edit_threads": values[1],
+            "can_pin_threads": values[2],
+            "can_hide_threads": values[3],
+            "can_hide_own_threads": values[4],
+            "can_close_threads": values[5],
+            "can_move_threads": values[1] == 2,
+            "can_merge_threads": values[3] == 1,
+            "can_approve_content": values[4] == 2,
+            "can_move_posts": values[0],
+            "can_merge_posts": values[5],
+            "can_see_reports": values[2],
+            "thread_edit_time": values[6],
+        }
+
+
+def get_threads():
+    now = timezone.now()
+    for starter_id, is_closed, category_is_closed, age in itertools.product(
+        (USER_ID, OTHER_USER_ID), (False, True), (False, True), (5, 60)
+    ):
+        category = Category(id=1, is_closed=category_is_closed)
+        thread = Thread(
+            id=1,
+            category=category,
+            starter_id=starter_id,
+            is_closed=is_closed,
+            started_on=now - timedelta(minutes=age),
+        )
+        thread.acl = {}
+        yield thread
+
+
+def test_threads_batch_annotator_sets_same_acl_as_single_annotator():
+    for category_acl in get_threads_categories_acls():
+        for is_anonymous in (False, True):
+            user_acl = get_user_acl(category_acl, is_anonymous)
+            threads = list(get_threads())
+            add_acl_to_threads(user_acl, threads)
+
+            for thread in threads:
+                expected = Thread(
+                    id=1,
+                    category=thread.category,
+                    starter_id=thread.starter_id,
+                    is_closed=thread.is_closed,
+                    started_on=thread.started_on,
+                )
+                expected.acl = {}
+                add_acl_to_thread(user_acl, expected)
+                assert thread.acl == expected.acl, (category_acl, is_anonymous)
+
+
+def get_posts_categories_acls():
+    for values in itertools.product(
+        (0, 1, 2),  # can_edit_posts
+        (0, 1, 2),  # can_hide_posts
+        (0, 1, 2),  # can_hide_own_posts
+        (False, True),  # can_protect_posts
+        (False, True),  # can_close_threads
+        (0, 30),  # post_edit_time
+    ):
+        yield {
+            "can_reply_threads": values[3],
+            "can_edit_posts": values[0],
+            "can_hide_posts": values[1],
+            "can_hide_own_posts": values[2],
+            "can_protect_posts": values[3],
+            "can_close_threads": values[4],
+            "can_approve_content": values[0] == 2,
+            "can_move_posts": values[1] == 1,
+            "can_merge_posts": values[2] == 1,
+            "can_report_content": values[4],
+            "can_see_reports": values[3],
+            "can_see_posts_likes": values[1],
+            "can_like_posts": values[2] == 2,
+            "post_edit_time": values[5],
+        }
+
+
+def get_post_kwargs():
+    now = timezone.now()
+    for thread_id, (
+        poster_id,
+        is_first_post,
+        is_hidden,
+        is_protected,
+        is_closed,
+        category_is_closed,
+        age,
+    ) in enumerate(
+        itertools.product(
+            (USER_ID, OTHER_USER_ID),
+            (False, True),
+            (False, True),
+            (False, True),
+            (False, True),
+            (False, True),
+            (5, 60),
+        )
+    ):
+        category = Category(id=1, is_closed=category_is_closed)
+        thread = Thread(
+            id=thread_id,
+            category=category,
+            is_closed=is_closed,
+            first_post_id=1 if is_first_post else 2,
+        )
+        yield {
+            "id": 1,
+            "category": category,
+            "thread": thread,
+            "poster_id": poster_id,
+            "is_hidden": is_hidden,
+            "is_protected": is_protected,
+            "posted_on": now - timedelta(minutes=age),
+        }
+
+
+def create_post(post_kwargs):
+    post = Post(**post_kwargs)
+    post.acl = {}
+    return post
+
+
+def test_posts_batch_annotator_sets_same_acl_as_single_annotator():
+    posts_kwargs = list(get_post_kwargs())
+    for category_acl in get_posts_categories_acls():
+        for is_anonymous in (False, True):
+            user_acl = get_user_acl(category_acl, is_anonymous)
+            posts = [create_post(post_kwargs) for post_kwargs in posts_kwargs]
+            add_acl_to_posts(user_acl, posts)
+
+            for post, post_kwargs in zip(posts, posts_kwargs):
+                expected = create_post(post_kwargs)
+                add_acl_to_post(user_acl, expected)
+                assert post.acl == expected.acl, (category_acl, post_kwargs)
+
+
+def test_posts_batch_annotator_annotates_events(user_acl, thread):
+    event = Post(
+        id=1,
+        category=thread.category,
+        thread=thread,
+        is_event=True,
+        posted_on=timezone.now(),
+    )
+    event.acl = {}
+    add_acl_to_posts(user_acl, [event])
+
+    assert event.acl == {
+        "can_see_hidden": False,
+        "can_hide": False,
+        "can_delete": False,
+    }
+
+
+def test_add_acl_to_obj_calls_annotators_for_list_of_objects(user_acl, thread):
+    post = thread.first_post
+    add_acl_to_obj(user_acl, [thread, post])
+
+    expected_thread = Thread.objects.get(id=thread.id)
+    expected_post = Post.objects.get(id=post.id)
+    add_acl_to_obj(user_acl, expected_thread)
+    add_acl_to_obj(user_acl, expected_post)
+
+    assert thread.acl == expected_thread.acl
+    assert post.acl == expected_post.acl
@@ -0,0 +1,150 @@
+import itertools
+
+from django.test import override_settings
+
+from ..models import Post, Thread
+from ..permissions import exclude_invisible_posts, exclude_invisible_threads
+from ..permissions.visibility import get_visibility_plan, visibility_plans_cache
+from ..test import post_thread, reply_thread
+
+CATEGORY_ACLS = [
+    {
+        "can_see_all_threads": can_see_all_threads,
+        "can_hide_threads": can_hide_threads,
+        "can_approve_content": can_approve_content,
+        "can_hide_events": can_hide_events,
+    }
+    for (
+        can_see_all_threads,
+        can_hide_threads,
+        can_approve_content,
+        can_hide_events,
+    ) in itertools.product((0, 1), (0, 1), (0, 1), (0, 2))
+]
+
+
+def is_thread_visible(user_acl, category_acl, thread):
+    """Reference visibility rules for thread in single category"""
+    is_owner = user_acl["is_authenticated"] and thread.starter_id == user_acl["user_id"]
+    can_hide = user_acl["is_authenticated"] and category_acl["can_hide_threads"]
+    can_approve = user_acl["is_authenticated"] and category_acl["can_approve_content"]
+
+    if not category_acl["can_see_all_threads"] and not is_owner:
+        return False
+    if thread.is_hidden and not can_hide:
+        return False
+    if thread.is_unapproved and not (can_approve or is_owner):
+        return False
+    return True
+
+
+def is_post_visible(user_acl, category_acl, post):
+    """Reference visibility rules for post in single category"""
+    is_owner = user_acl["is_authenticated"] and post.poster_id == user_acl["user_id"]
+    can_approve = user_acl["is_authenticated"] and category_acl["can_approve_content"]
+    can_hide_events = user_acl["is_authenticated"] and category_acl["can_hide_events"]
+
+    if post.is_unapproved and not (can_approve or is_owner):
+        return False
+    if post.is_event and post.is_hidden and not can_hide_events:
+        return False
+    return True
+
+
+def create_threads(category, user, other_user):
+    for starter, is_hidden, is_unapproved in itertools.product(
+        (user, other_user), (False, True), (False, True)
+    ):
+        thread = post_thread(
+            category,
+            poster=starter,
+            is_hidden=is_hidden,
+            is_unapproved=is_unapproved,
+        )
+        for poster, is_event in ((user, False), (other_user, False), (user, True)):
+            post = reply_thread(
+                thread,
+                poster=poster,
+                is_hidden=is_hidden,
+                is_unapproved=is_unapproved,
+            )
+            if is_event:
+                Post.objects.filter(id=post.id).update(is_event=True)
+
+
+def test_visibility_plan_excludes_same_threads_and_posts_as_reference_rules(
+    default_category, user, other_user, user_acl, anonymous_user_acl
+):
+    create_threads(default_category, user, other_user)
+    threads = list(Thread.objects.filter(category=default_category))
+    posts = list(Post.objects.filter(category=default_category))
+
+    for base_acl, category_acl in itertools.product(
+        (user_acl, anonymous_user_acl), CATEGORY_ACLS
+    ):
+        test_acl = base_acl.copy()
+        test_acl["categories"] = base_acl["categories"].copy()
+        test_acl["categories"][default_category.id] = dict(
+            base_acl["categories"][default_category.id], **category_acl
+        )
+
+        visible_threads = exclude_invisible_threads(
+            test_acl, [default_category], Thread.objects
+        )
+        assert set(visible_threads) == {
+            thread
+            for thread in threads
+            if is_thread_visible(test_acl, category_acl, thread)
+        }, category_acl
+
+        visible_posts = exclude_invisible_posts(
+            test_acl, [default_category], Post.objects
+        )
+        assert set(visible_posts) == {
+            post for post in posts if is_post_visible(test_acl, category_acl, post)
+        }, category_acl
+
+
+def test_visibility_plan_excludes_all_threads_in_invisible_categories(
+    default_category, user_acl
+):
+    post_thread(default_category)
+
+    user_acl["visible_categories"] = []
+    queryset = exclude_invisible_threads(user_acl, [default_category], Thread.objects)
+    assert not queryset.exists()
+
+
+def test_visibility_plan_skips_predicates_for_categories_without_restrictions(
+    default_category, user_acl
+):
+    user_acl["categories"][default_category.id].update(
+        {"can_see_all_threads": 1, "can_hide_threads": 1, "can_approve_content": 1}
+    )
+
+    plan = get_visibility_plan(user_acl, [default_category])
+    assert plan["threads"] == {
+        "categories": (default_category.id,),
+        "see_all": None,
+        "see_hidden": None,
+        "see_unapproved": None,
+    }
+
+
+@override_settings(MISAGO_VISIBILITY_PLANS_CACHE_SIZE=10)
+def test_visibility_plan_is_cached_for_acl_key_and_version(
+    mocker, default_category, user_acl
+):
+    visibility_plans_cache.clear()
+    build_visibility_plan = mocker.patch(
+        "misago.threads.permissions.visibility.build_visibility_plan",
+        return_value={"threads": {}, "posts": {}},
+    )
+
+    get_visibility_plan(user_acl, [default_category])
+    get_visibility_plan(user_acl, [default_category])
+    assert build_visibility_plan.call_count == 1
+
+    user_acl["cache_versions"] = dict(user_acl["cache_versions"], acl="changed")
+    get_visibility_plan(user_acl, [default_category])
+    assert build_visibility_plan.call_count == 2
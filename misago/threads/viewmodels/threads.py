@@ -10,6 +10,12 @@ from ...notifications.models import WatchedThread
 from ...notifications.threads import get_watched_threads
 from ...readtracker import threadstracker
 from ...readtracker.cutoffdate import get_cutoff_date
+from ...readtracker.poststracker import exclude_read_posts, filter_read_posts
+from ...readtracker.threadslists import (
+    READ_THREADS_LISTS,
+    filter_read_threads,
+    get_read_threads_page,
+)
 from ..models import Post, Thread
 from ..participants import make_participants_aware
 from ..permissions import exclude_invisible_posts, exclude_invisible_threads
@@ -59,7 +65,14 @@ class ViewModel:
 
         category_model = category.unwrap()
 
-        base_queryset = self.get_base_queryset(request, category.categories, list_type)
+        # "new" and "unread" lists are filtered by read threads engine
+        is_read_threads_list = list_type in READ_THREADS_LISTS
+
+        base_queryset = self.get_base_queryset(
+            request,
+            category.categories,
+            "all" if is_read_threads_list else list_type,
+        )
         base_queryset = base_queryset.select_related("starter", "last_poster")
 
         threads_categories = [category_model] + category.subcategories
@@ -69,12 +82,22 @@ class ViewModel:
         )
 
         try:
-            list_page = get_page(
-                threads_queryset,
-                "-last_post_id",
-                request.settings.threads_per_page,
-                start,
-            )
+            if is_read_threads_list:
+                list_page = get_read_threads_page(
+                    request,
+                    category.categories,
+                    list_type,
+                    threads_queryset,
+                    request.settings.threads_per_page,
+                    start,
+                )
+            else:
+                list_page = get_page(
+                    threads_queryset,
+                    "-last_post_id",
+                    request.settings.threads_per_page,
+                    start,
+                )
         except (EmptyPage, InvalidPage):
             raise Http404()
 
@@ -84,6 +107,10 @@ class ViewModel:
                     base_queryset, category_model, threads_categories
                 )
             )
+            if is_read_threads_list:
+                pinned_threads = filter_read_threads(
+                    request, category.categories, list_type, pinned_threads
+                )
             threads = list(pinned_threads) + list(list_page.object_list)
         else:
             threads = list(list_page.object_list)
@@ -96,7 +123,7 @@ class ViewModel:
         else:
             self.watched_threads = {}
 
-        if list_type in ("new", "unread"):
+        if is_read_threads_list:
             # we already know all threads on list are unread
             for thread in threads:
                 thread.is_read = False
@@ -239,17 +266,15 @@ def filter_read_threads_queryset(request, categories, list_type, queryset):
 
     queryset = queryset.filter(id__in=visible_posts.distinct().values("thread"))
 
-    read_posts = visible_posts.filter(id__in=request.user.postread_set.values("post"))
+    read_posts = filter_read_posts(request.user, visible_posts)
 
     if list_type == "new":
-        # new threads have no entry in reads table
+        # new threads have no read posts
         return queryset.exclude(id__in=read_posts.distinct().values("thread"))
 
     if list_type == "unread":
         # unread threads were read in past but have new posts
-        unread_posts = visible_posts.exclude(
-            id__in=request.user.postread_set.values("post")
-        )
+        unread_posts = exclude_read_posts(request.user, visible_posts)
         queryset = queryset.filter(id__in=read_posts.distinct().values("thread"))
         queryset = queryset.filter(id__in=unread_posts.distinct().values("thread"))
         return queryset
@@ -1,12 +1,12 @@
 from math import ceil
 
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.translation import pgettext
 from django.views import View
 
 from ...readtracker.cutoffdate import get_cutoff_date
+from ...readtracker.poststracker import exclude_read_posts
 from ..permissions import exclude_invisible_posts
 from ..viewmodels import ForumThread, PrivateThread
 
@@ -90,15 +90,12 @@ class GetFirstUnreadPostMixin:
     def get_first_unread_post(self, user, posts_queryset):
         if user.is_authenticated:
             cutoff_date = get_cutoff_date(self.request.settings, user)
-            expired_posts = Q(posted_on__lt=cutoff_date)
-            read_posts = Q(id__in=user.postread_set.values("post"))
-
-            first_unread = (
-                posts_queryset.exclude(expired_posts | read_posts)
-                .order_by("id")
-                .first()
+            unread_posts = exclude_read_posts(
+                user, posts_queryset.filter(posted_on__gte=cutoff_date)
             )
 
+            first_unread = unread_posts.order_by("id").first()
+
             if first_unread:
                 return first_unread
 
@@ -13,10 +13,6 @@ class BanAdmin(generic.AdminBaseMixin):
     templates_dir = "misago/admin/bans"
     message_404 = pgettext_lazy("admin bans", "Requested ban does not exist.")
 
-    def handle_form(self, form, request, target):
-        super().handle_form(form, request, target)
-        Ban.objects.invalidate_cache()
-
 
 class BansList(BanAdmin, generic.ListView):
     items_per_page = 30
@@ -58,6 +54,5 @@ class EditBan(BanAdmin, generic.ModelFormView):
 class DeleteBan(BanAdmin, generic.ButtonView):
     def button_action(self, request, target):
         target.delete()
-        Ban.objects.invalidate_cache()
         message = pgettext("admin bans", 'Ban "%(name)s" has been removed.')
         messages.success(request, message % {"name": target.name})
@@ -0,0 +1,117 @@
+"""
+Compiled index of active bans
+
+Index is built once per bans cache version and kept by the process. Exact bans
+are looked up in hash tables, "value*" bans in a prefix trie and "*value" bans
+in a suffix trie, so checking a value costs O(len(value)) no matter how many
+bans exist. Bans with wildcards in other places are matched with regexes.
+"""
+
+import re
+from threading import Lock
+from typing import Iterable
+
+TRIE_BANS = None  # Trie node key under which bans ending on this node are stored
+
+
+class BanTrie:
+    def __init__(self):
+        self.root = {}
+
+    def add(self, value: str, ban):
+        node = self.root
+        for char in value:
+            node = node.setdefault(char, {})
+        node.setdefault(TRIE_BANS, []).append(ban)
+
+    def match(self, value: str) -> Iterable:
+        """Yields bans for all prefixes of value."""
+        node = self.root
+        yield from node.get(TRIE_BANS, ())
+        for char in value:
+            node = node.get(char)
+            if node is None:
+                return
+            yield from node.get(TRIE_BANS, ())
+
+
+class BanTable:
+    def __init__(self):
+        self.exact: dict[str, list] = {}
+        self.prefixes = BanTrie()
+        self.suffixes = BanTrie()
+        self.patterns: list[tuple[re.Pattern, object]] = []
+
+    def add(self, ban):
+        value = ban.banned_value.lower()
+        wildcards = value.count("*")
+
+        if not wildcards:
+            self.exact.setdefault(value, []).append(ban)
+        elif wildcards == 1 and value.endswith("*"):
+            self.prefixes.add(value[:-1], ban)
+        elif wildcards == 1 and value.startswith("*"):
+            self.suffixes.add(value[:0:-1], ban)
+        else:
+            regex = re.escape(value).replace(r"\*", r"(.*?)")
+            self.patterns.append((re.compile("^%s$" % regex, re.IGNORECASE), ban))
+
+    def match(self, value: str) -> Iterable:
+        value = value.lower()
+
+        yield from self.exact.get(value, ())
+        yield from self.prefixes.match(value)
+        yield from self.suffixes.match(value[::-1])
+
+        for pattern, ban in self.patterns:
+            if pattern.search(value):
+                yield ban
+
+
+class BanIndex:
+    def __init__(self, bans: Iterable):
+        self.tables: dict[int, BanTable] = {}
+        for ban in bans:
+            self.tables.setdefault(ban.check_type, BanTable()).add(ban)
+
+    def find(self, checks: dict[int, str], registration_only: bool = False):
+        """Returns ban with lowest id that matches any of the checked values."""
+        found_ban = None
+        for check_type, value in checks.items():
+            table = self.tables.get(check_type)
+            if not table:
+                continue
+
+            for ban in table.match(value):
+                if ban.registration_only and not registration_only:
+                    continue
+                if ban.is_expired:
+                    continue
+                if not found_ban or ban.id < found_ban.id:
+                    found_ban = ban
+
+        return found_ban
+
+
+class BanIndexCache:
+    """Keeps single ban index in the process, rebuilding it when version changes."""
+
+    def __init__(self):
+        self.version = None
+        self.index = None
+        self.lock = Lock()
+
+    def get(self, version: str, build_index) -> BanIndex:
+        with self.lock:
+            if self.index is None or self.version != version:
+                self.index = build_index()
+                self.version = version
+            return self.index
+
+    def clear(self):
+        with self.lock:
+            self.version = None
+            self.index = None
+
+
+ban_index_cache = BanIndexCache()
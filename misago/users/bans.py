@@ -7,6 +7,7 @@ to use validate_X_banned validators
 
 from datetime import timedelta
 
+from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
@@ -15,6 +16,16 @@ from .models import Ban, BanCache
 
 CACHE_SESSION_KEY = "misago_ip_check"
 
+BAN_CACHE_FIELDS = [
+    "ban",
+    "cache_version",
+    "expires_on",
+    "user_message",
+    "staff_message",
+]
+
+User = get_user_model()
+
 
 def get_username_ban(username, registration_only=False):
     try:
@@ -53,32 +64,101 @@ def get_user_ban(user, cache_versions):
         user.ban_cache = BanCache(user=user)
         user.ban_cache = _set_user_ban_cache(user, cache_versions)
 
-    if user.ban_cache.ban:
+    if user.ban_cache.ban_id:
         return user.ban_cache
 
 
+def get_users_bans(users, cache_versions):
+    """
+    Batch version of get_user_ban
+
+    Validates ban caches of all users in one pass, refreshes stale ones and
+    saves them in single query. Returns dict with banned users ids as keys
+    and their ban caches as values.
+    """
+    users_by_id = {}
+    for user in users:
+        users_by_id.setdefault(user.pk, []).append(user)
+
+    uncached_ids = {
+        user_id
+        for user_id, users_list in users_by_id.items()
+        if not User.ban_cache.is_cached(users_list[0])
+    }
+
+    ban_caches = {}
+    if uncached_ids:
+        queryset = BanCache.objects.filter(user_id__in=uncached_ids)
+        for ban_cache in queryset.select_related("ban"):
+            ban_caches[ban_cache.user_id] = ban_cache
+
+    ban_index = None
+    users_bans = {}
+    stale_ban_caches = []
+    for user_id, users_list in users_by_id.items():
+        user = users_list[0]
+        if user_id in uncached_ids:
+            ban_cache = ban_caches.get(user_id) or BanCache(user=user)
+        else:
+            try:
+                ban_cache = user.ban_cache
+            except BanCache.DoesNotExist:
+                ban_cache = BanCache(user=user)
+
+        if not ban_cache.is_valid(cache_versions):
+            ban_index = ban_index or Ban.objects.get_ban_index()
+            user_ban = ban_index.find(
+                {Ban.USERNAME: user.username.lower(), Ban.EMAIL: user.email.lower()}
+            )
+            _update_ban_cache(ban_cache, cache_versions, user_ban)
+            stale_ban_caches.append(ban_cache)
+
+        for user in users_list:
+            user.ban_cache = ban_cache
+        if ban_cache.ban_id:
+            users_bans[user_id] = ban_cache
+
+    if stale_ban_caches:
+        BanCache.objects.bulk_create(
+            stale_ban_caches,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=BAN_CACHE_FIELDS,
+        )
+
+    return users_bans
+
+
 def _set_user_ban_cache(user, cache_versions):
     ban_cache = user.ban_cache
-    ban_cache.cache_version = cache_versions[BANS_CACHE]
+    _update_ban_cache(ban_cache, cache_versions, _find_user_ban(user))
+    ban_cache.save()
+    return ban_cache
+
 
+def _find_user_ban(user):
     try:
-        user_ban = Ban.objects.get_ban(
+        return Ban.objects.get_ban(
             username=user.username, email=user.email, registration_only=False
         )
+    except Ban.DoesNotExist:
+        return None
+
 
+def _update_ban_cache(ban_cache, cache_versions, user_ban):
+    ban_cache.cache_version = cache_versions[BANS_CACHE]
+
+    if user_ban:
         ban_cache.ban = user_ban
         ban_cache.expires_on = user_ban.expires_on
         ban_cache.user_message = user_ban.user_message
         ban_cache.staff_message = user_ban.staff_message
-    except Ban.DoesNotExist:
+    else:
         ban_cache.ban = None
         ban_cache.expires_on = None
         ban_cache.user_message = None
         ban_cache.staff_message = None
 
-    ban_cache.save()
-    return ban_cache
-
 
 def get_request_ip_ban(request):
     """
@@ -43,7 +43,10 @@ def preload_user_json(request):
     else:
         serializer = AnonymousUserSerializer
 
-    serialized_user = serializer(request.user, context={"acl": request.user_acl}).data
+    # ACL is inserted into frontend context as JSON cached for user's ACL key
+    serialized_user = serializer(
+        request.user, context={"acl": request.user_acl, "preencode_acl": True}
+    ).data
     request.frontend_context["user"] = serialized_user
 
     request.frontend_context.update(get_users_menus(request))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...online.tracker import flush_tracker_buffer
+
+
+class Command(BaseCommand):
+    help = "Saves online tracker updates buffered in the cache to the database."
+
+    def handle(self, *args, **options):
+        trackers_updated = flush_tracker_buffer()
+        self.stdout.write("Tracker entries updated: %s" % trackers_updated)
@@ -21,6 +21,9 @@ class Command(BaseCommand):
         queryset = queryset.filter(expires_on__lt=timezone.now())
 
         expired_count = queryset.update(is_checked=False)
+        if expired_count:
+            Ban.objects.invalidate_cache()
+
         self.stdout.write("Bans invalidated: %s" % expired_count)
 
     def handle_bans_caches(self):
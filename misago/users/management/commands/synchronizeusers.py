@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand
 
 from ....categories.models import Category
 from ....core.management.progressbar import show_progress
+from ....threads.statsdeltas import discard_user_stats_deltas
 
 User = get_user_model()
 
@@ -30,6 +31,8 @@ class Command(BaseCommand):
         start_time = time.time()
 
         for user in User.objects.iterator(chunk_size=50):
+            discard_user_stats_deltas(user)
+
             user.threads = user.thread_set.filter(
                 category__in=categories, is_hidden=False, is_unapproved=False
             ).count()
@@ -6,7 +6,8 @@ from django.utils import timezone
 from django.utils.translation import pgettext_lazy
 
 from .. import BANS_CACHE
-from ...cache.versions import invalidate_cache
+from ..banindex import BanIndex, ban_index_cache
+from ...cache.versions import get_cached_cache_versions, invalidate_cache
 
 
 class BansManager(models.Manager):
@@ -23,44 +24,29 @@ class BansManager(models.Manager):
         invalidate_cache(BANS_CACHE)
 
     def get_ban(self, username=None, email=None, ip=None, registration_only=False):
-        checks = []
+        checks = {}
 
         if username:
-            username = username.lower()
-            checks.append(self.model.USERNAME)
+            checks[self.model.USERNAME] = username.lower()
         if email:
-            email = email.lower()
-            checks.append(self.model.EMAIL)
+            checks[self.model.EMAIL] = email.lower()
         if ip:
-            checks.append(self.model.IP)
-
-        queryset = self.filter(is_checked=True)
-        if not registration_only:
-            queryset = self.filter(registration_only=False)
-
-        if len(checks) == 1:
-            queryset = queryset.filter(check_type=checks[0])
-        elif checks:
-            queryset = queryset.filter(check_type__in=checks)
-
-        for ban in queryset.iterator(chunk_size=50):
-            if ban.is_expired:
-                continue
-            elif (
-                ban.check_type == self.model.USERNAME
-                and username
-                and ban.check_value(username)
-            ):
-                return ban
-            elif (
-                ban.check_type == self.model.EMAIL and email and ban.check_value(email)
-            ):
-                return ban
-            elif ban.check_type == self.model.IP and ip and ban.check_value(ip):
+            checks[self.model.IP] = ip
+
+        if checks:
+            ban = self.get_ban_index().find(checks, registration_only)
+            if ban:
                 return ban
 
         raise Ban.DoesNotExist("specified values are not banned")
 
+    def get_ban_index(self):
+        version = get_cached_cache_versions()[BANS_CACHE]
+        return ban_index_cache.get(version, self.build_ban_index)
+
+    def build_ban_index(self):
+        return BanIndex(self.filter(is_checked=True).order_by("id"))
+
 
 class Ban(models.Model):
     USERNAME = 0
@@ -89,7 +75,13 @@ class Ban(models.Model):
         self.banned_value = self.banned_value.lower()
         self.is_checked = not self.is_expired
 
-        return super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
+        Ban.objects.invalidate_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Ban.objects.invalidate_cache()
+        return result
 
     def get_serialized_message(self):
         from ..serializers import BanMessageSerializer
@@ -1,8 +1,19 @@
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.request import Request
 
+from ...conf import settings
 from ..models import Online
 
+BUFFER_CACHE_KEY = "misago_online_tracker_buffer"
+BUFFER_HEAD_KEY = f"{BUFFER_CACHE_KEY}_head"
+BUFFER_TAIL_KEY = f"{BUFFER_CACHE_KEY}_tail"
+BUFFER_FLUSHED_HEAD_KEY = f"{BUFFER_CACHE_KEY}_flushed_head"
+BUFFER_ENTRY_TIMEOUT = 3600
+BUFFER_FLUSH_CHUNK_SIZE = 500
+
 
 def mute_tracker(request):
     request._misago_online_tracker = None
@@ -16,9 +27,95 @@ def start_tracking(request, user):
 
 
 def update_tracker(request, tracker):
-    tracker.last_click = timezone.now()
+    now = timezone.now()
+
+    threshold = settings.MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD
+    if threshold and tracker.last_click > now - timedelta(seconds=threshold):
+        return
+
+    tracker.last_click = now
+
+    if not settings.MISAGO_ONLINE_TRACKER_BUFFERED or not buffer_tracker_update(
+        tracker
+    ):
+        tracker.save(update_fields=["last_click"])
+
+
+def buffer_tracker_update(tracker) -> bool:
+    """Appends tracker's last click to the buffer in shared cache.
+
+    Returns False if the update couldn't be buffered and should be saved instead.
+    """
+    # Trackers in the database are stale until flush, buffer only one update per
+    # user per update threshold
+    threshold = settings.MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD
+    if threshold:
+        user_key = f"{BUFFER_CACHE_KEY}_user_{tracker.user_id}"
+        if not cache.add(user_key, True, threshold):
+            return True
+
+    try:
+        cache.add(BUFFER_HEAD_KEY, 0, None)
+        entry_id = cache.incr(BUFFER_HEAD_KEY)
+    except ValueError:
+        return False  # Cache backend doesn't keep values (eg. DummyCache)
+
+    cache.set(
+        f"{BUFFER_CACHE_KEY}_{entry_id}",
+        (tracker.user_id, tracker.last_click),
+        BUFFER_ENTRY_TIMEOUT,
+    )
+    return True
+
+
+def flush_tracker_buffer() -> int:
+    """Saves buffered last clicks to the database, returns number of updated users."""
+    head = cache.get(BUFFER_HEAD_KEY) or 0
+    tail = cache.get(BUFFER_TAIL_KEY) or 0
+    # Head seen by previous flush, entries up to it had time to be written
+    flushed_head = cache.get(BUFFER_FLUSHED_HEAD_KEY) or 0
+
+    if head < tail:
+        # Head was evicted from the cache and entries numbering has restarted
+        tail = flushed_head = 0
+
+    last_clicks = {}
+    new_tail = tail
+
+    for chunk_start in range(tail + 1, head + 1, BUFFER_FLUSH_CHUNK_SIZE):
+        chunk_end = min(chunk_start + BUFFER_FLUSH_CHUNK_SIZE, head + 1)
+        keys = {i: f"{BUFFER_CACHE_KEY}_{i}" for i in range(chunk_start, chunk_end)}
+        entries = cache.get_many(keys.values())
+
+        flushed_keys = []
+        for entry_id, key in keys.items():
+            if key not in entries and entry_id > flushed_head:
+                break  # Entry could be not written yet, flush it next time
+
+            if key in entries:
+                user_id, last_click = entries[key]
+                if user_id not in last_clicks or last_clicks[user_id] < last_click:
+                    last_clicks[user_id] = last_click
+                flushed_keys.append(key)
+
+            new_tail = entry_id
+
+        cache.delete_many(flushed_keys)
+        if new_tail < chunk_end - 1:
+            break
+
+    cache.set(BUFFER_TAIL_KEY, new_tail, None)
+    cache.set(BUFFER_FLUSHED_HEAD_KEY, head, None)
+
+    trackers = [
+        Online(user_id=user_id, last_click=last_click)
+        for user_id, last_click in last_clicks.items()
+    ]
+    Online.objects.bulk_update(
+        trackers, ["last_click"], batch_size=BUFFER_FLUSH_CHUNK_SIZE
+    )
 
-    tracker.save(update_fields=["last_click"])
+    return len(trackers)
 
 
 def stop_tracking(request, tracker):
@@ -2,8 +2,8 @@ from datetime import timedelta
 
 from django.utils import timezone
 
-from ..bans import get_user_ban
-from ..models import BanCache, Online
+from ..bans import get_user_ban, get_users_bans
+from ..models import Online
 
 ACTIVITY_CUTOFF = timedelta(minutes=2)
 
@@ -14,14 +14,13 @@ def make_users_status_aware(request, users, fetch_state=False):
         users_dict[user.pk] = user
 
     if fetch_state:
-        # Fill ban cache on users
-        for ban_cache in BanCache.objects.filter(user__in=users_dict.keys()):
-            users_dict[ban_cache.user_id].ban_cache = ban_cache
-
         # Fill user online trackers
         for online_tracker in Online.objects.filter(user__in=users_dict.keys()):
             users_dict[online_tracker.user_id].online_tracker = online_tracker
 
+    # Fill and refresh ban caches on users
+    get_users_bans(users, request.cache_versions)
+
     # Fill user states
     for user in users:
         user.status = get_user_status(request, user)
@@ -2,7 +2,8 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import serializers
 
-from ...acl.useracl import serialize_user_acl
+from ...acl.useracl import serialize_user_acl, serialize_user_acl_json
+from ...core.utils import PreencodedJSON
 from .user import UserSerializer
 
 User = get_user_model()
@@ -10,6 +11,15 @@ User = get_user_model()
 __all__ = ["AuthenticatedUserSerializer", "AnonymousUserSerializer"]
 
 
+def serialize_context_acl(context):
+    acl = context.get("acl")
+    if not acl:
+        return {}
+    if context.get("preencode_acl"):
+        return PreencodedJSON(serialize_user_acl_json(acl))
+    return serialize_user_acl(acl)
+
+
 class AuthFlags:
     def get_is_authenticated(self, obj):
         return bool(obj.is_authenticated)
@@ -41,10 +51,7 @@ class AuthenticatedUserSerializer(UserSerializer, AuthFlags):
         ]
 
     def get_acl(self, obj):
-        acl = self.context.get("acl")
-        if acl:
-            return serialize_user_acl(acl)
-        return {}
+        return serialize_context_acl(self.context)
 
     def get_email(self, obj):
         return obj.email
@@ -99,7 +106,4 @@ class AnonymousUserSerializer(serializers.Serializer, AuthFlags):
     is_anonymous = serializers.SerializerMethodField()
 
     def get_acl(self, obj):
-        acl = self.context.get("acl")
-        if acl:
-            return serialize_user_acl(acl)
-        return {}
+        return serialize_context_acl(self.context)
@@ -2,6 +2,7 @@ from celery import shared_task
 from django.contrib.auth import get_user_model
 
 from ..permissions.permissionsid import get_permissions_id
+from .online.tracker import flush_tracker_buffer
 
 
 NOTIFY_CHUNK_SIZE = 20
@@ -16,3 +17,8 @@ def remove_group_from_users_groups_ids(group_id: int):
         user.groups_ids.remove(group_id)
         user.permissions_id = get_permissions_id(user.groups_ids)
         user.save(update_fields=["groups_ids", "permissions_id"])
+
+
+@shared_task(name="users.flush-online-tracker", serializer="json")
+def flush_online_tracker():
+    flush_tracker_buffer()
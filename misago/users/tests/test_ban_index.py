@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from ..banindex import BanIndex
+from ..models import Ban
+
+
+def create_ban(ban_id, banned_value, check_type=Ban.USERNAME, **kwargs):
+    return Ban(id=ban_id, check_type=check_type, banned_value=banned_value, **kwargs)
+
+
+def test_index_finds_exact_ban():
+    ban = create_ban(1, "bob")
+    index = BanIndex([ban])
+
+    assert index.find({Ban.USERNAME: "bob"}) == ban
+    assert index.find({Ban.USERNAME: "BoB"}) == ban
+    assert index.find({Ban.USERNAME: "bobby"}) is None
+
+
+def test_index_finds_prefix_ban():
+    ban = create_ban(1, "bob*")
+    index = BanIndex([ban])
+
+    assert index.find({Ban.USERNAME: "bob"}) == ban
+    assert index.find({Ban.USERNAME: "bobby"}) == ban
+    assert index.find({Ban.USERNAME: "abob"}) is None
+
+
+def test_index_finds_suffix_ban():
+    ban = create_ban(1, "*@example.com", Ban.EMAIL)
+    index = BanIndex([ban])
+
+    assert index.find({Ban.EMAIL: "bob@example.com"}) == ban
+    assert index.find({Ban.EMAIL: "bob@example.com.org"}) is None
+    assert index.find({Ban.USERNAME: "bob@example.com"}) is None
+
+
+def test_index_finds_ip_prefix_ban():
+    ban = create_ban(1, "127.0.*", Ban.IP)
+    index = BanIndex([ban])
+
+    assert index.find({Ban.IP: "127.0.0.1"}) == ban
+    assert index.find({Ban.IP: "127.1.0.1"}) is None
+
+
+def test_index_finds_ban_with_wildcards_in_middle():
+    ban = create_ban(1, "b*b*y")
+    index = BanIndex([ban])
+
+    assert index.find({Ban.USERNAME: "bobby"}) == ban
+    assert index.find({Ban.USERNAME: "bobbo"}) is None
+
+
+def test_index_finds_wildcard_only_ban():
+    ban = create_ban(1, "*")
+    index = BanIndex([ban])
+
+    assert index.find({Ban.USERNAME: "anything"}) == ban
+
+
+def test_index_returns_ban_with_lowest_id():
+    index = BanIndex([create_ban(3, "bob"), create_ban(2, "bo*"), create_ban(5, "*b")])
+    assert index.find({Ban.USERNAME: "bob"}).id == 2
+
+
+def test_index_skips_expired_bans():
+    expired_ban = create_ban(1, "bob", expires_on=timezone.now() - timedelta(days=1))
+    ban = create_ban(2, "bo*", expires_on=timezone.now() + timedelta(days=1))
+    index = BanIndex([expired_ban, ban])
+
+    assert index.find({Ban.USERNAME: "bob"}) == ban
+
+
+def test_index_skips_registration_only_bans_unless_checking_registration():
+    ban = create_ban(1, "bob", registration_only=True)
+    index = BanIndex([ban])
+
+    assert index.find({Ban.USERNAME: "bob"}) is None
+    assert index.find({Ban.USERNAME: "bob"}, registration_only=True) == ban
+
+
+def test_index_checks_multiple_values():
+    ban = create_ban(1, "*@example.com", Ban.EMAIL)
+    index = BanIndex([ban])
+
+    assert index.find({Ban.USERNAME: "bob", Ban.EMAIL: "bob@example.com"}) == ban
+
+
+def test_ban_manager_rebuilds_index_when_ban_is_created(db):
+    with pytest.raises(Ban.DoesNotExist):
+        Ban.objects.get_username_ban("bob")
+
+    Ban.objects.create(banned_value="bob")
+    assert Ban.objects.get_username_ban("bob").banned_value == "bob"
@@ -0,0 +1,77 @@
+from ..bans import get_user_ban, get_users_bans
+from ..models import Ban, BanCache, User
+
+
+def test_users_bans_are_empty_for_not_banned_users(user, other_user, cache_versions):
+    assert get_users_bans([user, other_user], cache_versions) == {}
+    assert BanCache.objects.count() == 2
+
+
+def test_users_bans_include_banned_users(user, other_user, cache_versions):
+    ban = Ban.objects.create(banned_value=user.username)
+
+    users_bans = get_users_bans([user, other_user], cache_versions)
+    assert list(users_bans) == [user.id]
+    assert users_bans[user.id].ban == ban
+    assert user.ban_cache == users_bans[user.id]
+
+
+def test_users_bans_are_resolved_in_constant_number_of_queries(
+    user, other_user, cache_versions, django_assert_num_queries
+):
+    Ban.objects.create(banned_value=user.username)
+    Ban.objects.get_ban_index()
+
+    users = list(User.objects.filter(id__in=[user.id, other_user.id]))
+    # Query existing ban caches, get cache versions, upsert ban caches
+    with django_assert_num_queries(3):
+        get_users_bans(users, cache_versions)
+
+
+def test_users_bans_skip_queries_for_valid_ban_caches(
+    user, other_user, cache_versions, django_assert_num_queries
+):
+    get_users_bans([user, other_user], cache_versions)
+
+    users = list(
+        User.objects.filter(id__in=[user.id, other_user.id]).select_related("ban_cache")
+    )
+    with django_assert_num_queries(0):
+        assert get_users_bans(users, cache_versions) == {}
+
+
+def test_banned_users_bans_are_checked_without_extra_queries(
+    user, other_user, cache_versions, django_assert_num_queries
+):
+    Ban.objects.create(banned_value=user.username)
+    Ban.objects.create(banned_value=other_user.username)
+    get_users_bans([user, other_user], cache_versions)
+
+    users = list(
+        User.objects.filter(id__in=[user.id, other_user.id]).select_related("ban_cache")
+    )
+    with django_assert_num_queries(0):
+        assert len(get_users_bans(users, cache_versions)) == 2
+        for user in users:
+            assert get_user_ban(user, cache_versions)
+
+
+def test_users_bans_refresh_ban_caches_with_outdated_version(user, cache_versions):
+    get_users_bans([user], cache_versions)
+
+    ban = Ban.objects.create(banned_value=user.username)
+    cache_versions["bans"] = "changed"
+
+    user = User.objects.get(id=user.id)
+    users_bans = get_users_bans([user], cache_versions)
+    assert users_bans[user.id].ban == ban
+    assert BanCache.objects.get(user=user).cache_version == "changed"
+
+
+def test_users_bans_set_same_ban_cache_on_duplicate_users(user, cache_versions):
+    Ban.objects.create(banned_value=user.username)
+
+    same_user = User.objects.get(id=user.id)
+    users_bans = get_users_bans([user, same_user], cache_versions)
+    assert user.ban_cache is same_user.ban_cache
+    assert list(users_bans) == [user.id]
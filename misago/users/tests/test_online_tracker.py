@@ -0,0 +1,163 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from ..management.commands import flushonlinetracker
+from ..models import Online
+from ..online.tracker import flush_tracker_buffer, update_tracker
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def set_last_click(user, last_click):
+    Online.objects.filter(user=user).update(last_click=last_click)
+    return Online.objects.get(user=user)
+
+
+@override_settings(MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=30)
+def test_tracker_update_is_skipped_if_last_click_is_recent(user):
+    last_click = timezone.now() - timedelta(seconds=10)
+    tracker = set_last_click(user, last_click)
+
+    update_tracker(Mock(), tracker)
+
+    assert Online.objects.get(user=user).last_click == last_click
+
+
+@override_settings(MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=30)
+def test_tracker_is_updated_if_last_click_is_older_than_threshold(user):
+    last_click = timezone.now() - timedelta(seconds=60)
+    tracker = set_last_click(user, last_click)
+
+    update_tracker(Mock(), tracker)
+
+    assert Online.objects.get(user=user).last_click > last_click
+
+
+@override_settings(
+    MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=0,
+    MISAGO_ONLINE_TRACKER_BUFFERED=True,
+    CACHES=LOCMEM_CACHE,
+)
+def test_buffered_tracker_update_is_saved_on_flush(user, other_user):
+    cache.clear()
+
+    last_click = timezone.now() - timedelta(seconds=60)
+    tracker = set_last_click(user, last_click)
+    other_tracker = set_last_click(other_user, last_click)
+
+    update_tracker(Mock(), tracker)
+    update_tracker(Mock(), other_tracker)
+
+    assert Online.objects.get(user=user).last_click == last_click
+
+    assert flush_tracker_buffer() == 2
+    assert Online.objects.get(user=user).last_click == tracker.last_click
+    assert Online.objects.get(user=other_user).last_click == other_tracker.last_click
+
+    assert flush_tracker_buffer() == 0
+
+
+@override_settings(
+    MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=30,
+    MISAGO_ONLINE_TRACKER_BUFFERED=True,
+    CACHES=LOCMEM_CACHE,
+)
+def test_buffered_tracker_updates_user_once_per_update_threshold(user):
+    cache.clear()
+
+    # Trackers loaded in next requests have stale last click until flush
+    last_click = timezone.now() - timedelta(seconds=60)
+    update_tracker(Mock(), set_last_click(user, last_click))
+    update_tracker(Mock(), set_last_click(user, last_click))
+
+    assert cache.get("misago_online_tracker_buffer_head") == 1
+    assert cache.get(f"misago_online_tracker_buffer_user_{user.id}")
+
+
+@override_settings(
+    MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=0,
+    MISAGO_ONLINE_TRACKER_BUFFERED=True,
+    CACHES=LOCMEM_CACHE,
+)
+def test_buffered_tracker_buffers_every_update_without_update_threshold(user):
+    cache.clear()
+
+    last_click = timezone.now() - timedelta(seconds=60)
+    update_tracker(Mock(), set_last_click(user, last_click))
+    update_tracker(Mock(), set_last_click(user, last_click))
+
+    assert cache.get("misago_online_tracker_buffer_head") == 2
+
+
+@override_settings(
+    MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=0,
+    MISAGO_ONLINE_TRACKER_BUFFERED=True,
+    CACHES=LOCMEM_CACHE,
+)
+def test_buffered_tracker_flush_recovers_from_evicted_head(user):
+    cache.clear()
+    cache.set("misago_online_tracker_buffer_tail", 100)
+
+    tracker = set_last_click(user, timezone.now() - timedelta(seconds=60))
+    update_tracker(Mock(), tracker)
+
+    assert flush_tracker_buffer() == 1
+    assert Online.objects.get(user=user).last_click == tracker.last_click
+    assert cache.get("misago_online_tracker_buffer_tail") == 1
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_buffered_tracker_flush_waits_for_entry_that_is_not_written_yet(user):
+    cache.clear()
+
+    last_click = timezone.now()
+    cache.set("misago_online_tracker_buffer_head", 2)
+    cache.set("misago_online_tracker_buffer_2", (user.id, last_click))
+
+    assert flush_tracker_buffer() == 0
+    assert cache.get("misago_online_tracker_buffer_tail") == 0
+
+    cache.set("misago_online_tracker_buffer_1", (user.id, last_click))
+
+    assert flush_tracker_buffer() == 1
+    assert Online.objects.get(user=user).last_click == last_click
+    assert cache.get("misago_online_tracker_buffer_tail") == 2
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+def test_buffered_tracker_flush_skips_entry_missing_since_previous_flush(user):
+    cache.clear()
+
+    last_click = timezone.now()
+    cache.set("misago_online_tracker_buffer_head", 2)
+    cache.set("misago_online_tracker_buffer_2", (user.id, last_click))
+
+    assert flush_tracker_buffer() == 0
+    assert flush_tracker_buffer() == 1
+    assert Online.objects.get(user=user).last_click == last_click
+    assert cache.get("misago_online_tracker_buffer_tail") == 2
+
+
+@override_settings(
+    MISAGO_ONLINE_TRACKER_UPDATE_THRESHOLD=0, MISAGO_ONLINE_TRACKER_BUFFERED=True
+)
+def test_buffered_tracker_saves_update_if_cache_is_unavailable(user):
+    last_click = timezone.now() - timedelta(seconds=60)
+    tracker = set_last_click(user, last_click)
+
+    update_tracker(Mock(), tracker)
+
+    assert Online.objects.get(user=user).last_click > last_click
+
+
+def test_management_command_displays_number_of_updated_trackers(db):
+    out = StringIO()
+    call_command(flushonlinetracker.Command(), stdout=out)
+    command_output = out.getvalue().splitlines()[0].strip()
+    assert command_output == "Tracker entries updated: 0"